@@ -0,0 +1,455 @@
+"""
+Batch Lead Qualification
+
+Runs LeadQualificationPipeline (validator -> scorer -> recommender) for every
+lead of a CSV or JSONL file, each lead in its own session, with at most
+--concurrency leads in flight. Leads are read lazily, so lists with tens of
+thousands of rows do not have to fit in memory. As soon as a lead finishes,
+its validation_status, lead_score and action_recommendation are appended to
+the output file (CSV or JSONL, by extension), and its ID is then added to a
+checkpoint file. A lead that fails is written to a separate errors file
+instead and is not checkpointed, so the output holds one row per lead.
+Restarting the same command skips every lead in the checkpoint and retries
+the failed ones.
+
+Each lead is a row with an optional "id" column; every other column becomes
+a line of the lead description ("company: Acme" -> "Company: Acme"). A
+single "lead" or "text" column is used as the description as it is.
+
+Usage:
+    python batch.py leads.csv qualified.csv --concurrency 16
+    python batch.py leads.jsonl qualified.jsonl --checkpoint qualified.done
+    python batch.py leads.csv scored.csv --score-only
+    LEAD_STAGE_CACHE=stages.db python batch.py leads.csv qualified.csv \
+        --rerun-from ActionRecommenderAgent
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import statistics
+import time
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from dotenv import load_dotenv
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from lead_qualification_agent.agent import root_agent, stage_cache
+from lead_qualification_agent.lead_rules import prevalidate
+from lead_qualification_agent.scoring import LeadScoringModel, justify
+from lead_qualification_agent.stage_cache import lead_hash
+
+load_dotenv("lead_qualification_agent/.env")
+
+# ===== PART 1: Constants =====
+APP_NAME = "Lead Qualification Batch"
+USER_ID = "sales_ops"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT_SEC = 120.0
+RESULT_FIELDS = [
+    "id",
+    "status",
+    "validation_status",
+    "lead_score",
+    "action_recommendation",
+    "latency_sec",
+    "error",
+]
+TEXT_COLUMNS = ("lead", "text")
+SCORE_FIELDS = ["id", "validation_status", "lead_score", "borderline"]
+SCORE_CHUNK_SIZE = 4096
+
+
+# ===== PART 2: Reading leads and the checkpoint =====
+def read_leads(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the leads of a CSV or JSONL file one at a time.
+
+    IDs default to the row number (counting from 1, without the header).
+    """
+    with open(path, newline="") as file:
+        if path.endswith(".csv"):
+            rows = csv.DictReader(file)
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+        for number, row in enumerate(rows, 1):
+            lead = {key: value for key, value in row.items() if value not in ("", None)}
+            lead["id"] = str(lead.get("id", number))
+            yield lead
+
+
+def format_lead(lead: Dict[str, Any]) -> str:
+    """The lead as the text the pipeline expects from a user."""
+    for column in TEXT_COLUMNS:
+        if column in lead:
+            return str(lead[column])
+    lines = [
+        f"{key.replace('_', ' ').title()}: {value}"
+        for key, value in lead.items()
+        if key != "id"
+    ]
+    return "Lead Information:\n" + "\n".join(lines)
+
+
+def read_checkpoint(path: str) -> Set[str]:
+    """IDs of the leads already written; a last line cut off by a crash is ignored."""
+    if not os.path.exists(path):
+        return set()
+    with open(path) as file:
+        content = file.read()
+    lines = content.split("\n")
+    # Everything after the last newline was never completed
+    return {line for line in lines[:-1] if line}
+
+
+# ===== PART 3: Incremental output =====
+def ends_with_newline(path: str) -> bool:
+    with open(path, "rb") as file:
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) == b"\n"
+
+
+def default_errors_path(output_path: str) -> str:
+    """The default errors file: qualified.csv -> qualified.errors.csv."""
+    root, extension = os.path.splitext(output_path)
+    return f"{root}.errors{extension}"
+
+
+class _ResultFile:
+    """Appends result rows to a CSV or JSONL file, flushing every row."""
+
+    def __init__(self, path: str):
+        self.is_csv = path.endswith(".csv")
+        new_file = not os.path.exists(path) or not os.path.getsize(path)
+        self.file = open(path, "a", newline="")
+        # Finish a row cut off by a crash so the next result starts cleanly
+        if not new_file and not ends_with_newline(path):
+            self.file.write("\n")
+        if self.is_csv:
+            self.csv = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            if new_file:
+                self.csv.writeheader()
+
+    def write(self, result: Dict[str, Any]) -> None:
+        if self.is_csv:
+            self.csv.writerow({field: result.get(field) for field in RESULT_FIELDS})
+        else:
+            self.file.write(json.dumps(result) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ResultWriter:
+    """
+    Appends finished leads to the output and records their IDs; failed
+    leads go to the errors file.
+
+    The result is flushed before its ID reaches the checkpoint, so a lead in
+    the checkpoint is always in the output. A crash between the two writes
+    the lead once more on restart. Failed leads are not checkpointed and run
+    again on restart, so each attempt adds a row to the errors file, never
+    to the output. The errors file is only created once a lead fails.
+    """
+
+    def __init__(self, output_path: str, checkpoint_path: str, errors_path: str):
+        self.output = _ResultFile(output_path)
+        self.checkpoint = open(checkpoint_path, "a")
+        self.errors_path = errors_path
+        self.errors: Optional[_ResultFile] = None
+        self.errors_written = 0
+
+    def write(self, result: Dict[str, Any]) -> None:
+        if result["status"] != "ok":
+            if self.errors is None:
+                self.errors = _ResultFile(self.errors_path)
+            self.errors.write(result)
+            self.errors_written += 1
+            return
+        self.output.write(result)
+        self.checkpoint.write(result["id"] + "\n")
+        self.checkpoint.flush()
+
+    def close(self) -> None:
+        self.output.close()
+        self.checkpoint.close()
+        if self.errors is not None:
+            self.errors.close()
+
+
+# ===== PART 4: Running one lead =====
+async def qualify_lead(
+    runner: Runner, lead: Dict[str, Any], timeout: float
+) -> Dict[str, Any]:
+    """Run the pipeline for one lead in a fresh session."""
+    session = runner.session_service.create_session(
+        app_name=APP_NAME, user_id=USER_ID, state={"lead_id": lead["id"]}
+    )
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"id": lead["id"]}
+
+    async def run():
+        async for _ in runner.run_async(
+            user_id=USER_ID,
+            session_id=session.id,
+            new_message=types.Content(
+                role="user", parts=[types.Part(text=format_lead(lead))]
+            ),
+        ):
+            pass
+
+    try:
+        await asyncio.wait_for(run(), timeout)
+        state = runner.session_service.get_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+        ).state
+        result["status"] = "ok"
+        for key in ("validation_status", "lead_score", "action_recommendation"):
+            result[key] = state.get(key)
+    except asyncio.TimeoutError:
+        result.update({"status": "error", "error": f"Timed out after {timeout}s"})
+    except Exception as e:
+        result.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        # Sessions are only needed while the lead runs
+        runner.session_service.delete_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+        )
+    result["latency_sec"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+# ===== PART 5: The batch =====
+async def run_batch(
+    input_path: str,
+    output_path: str,
+    checkpoint_path: Optional[str] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT_SEC,
+    runner: Optional[Runner] = None,
+    errors_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Qualify every lead that is not in the checkpoint yet.
+
+    Args:
+        input_path: CSV or JSONL file of leads
+        output_path: CSV or JSONL file results are appended to
+        checkpoint_path: File of finished lead IDs (default: output + ".checkpoint")
+        concurrency: Maximum number of leads in flight
+        timeout: Seconds before a lead is given up on
+        runner: Runner to use (defaults to one for root_agent)
+        errors_path: CSV or JSONL file failed leads are appended to (default:
+            the output path with ".errors" before the extension)
+
+    Returns:
+        Dict[str, Any]: Summary of this run (see ``summarize``)
+    """
+    runner = runner or Runner(
+        agent=root_agent, app_name=APP_NAME, session_service=InMemorySessionService()
+    )
+    checkpoint_path = checkpoint_path or output_path + ".checkpoint"
+    done = read_checkpoint(checkpoint_path)
+    print(f"{len(done)} leads already done, concurrency {concurrency}")
+
+    # A small queue keeps reading just ahead of the workers
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    writer = ResultWriter(
+        output_path, checkpoint_path, errors_path or default_errors_path(output_path)
+    )
+    results: List[Dict[str, Any]] = []
+    # Lead hash -> result of the first lead with that text
+    first_results: Dict[str, asyncio.Future] = {}
+    skipped = 0
+    start = time.perf_counter()
+
+    async def produce():
+        nonlocal skipped
+        for lead in read_leads(input_path):
+            if lead["id"] in done:
+                skipped += 1
+                continue
+            await queue.put(lead)
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def worker():
+        while (lead := await queue.get()) is not None:
+            key = lead_hash(format_lead(lead))
+            first = first_results.get(key)
+            if first is None:
+                first = first_results[key] = asyncio.get_running_loop().create_future()
+                result = await qualify_lead(runner, lead, timeout)
+                first.set_result(result)
+            else:
+                wait_start = time.perf_counter()
+                first_result = await first
+                result = {
+                    **first_result,
+                    "id": lead["id"],
+                    "duplicate_of": first_result["id"],
+                    "latency_sec": round(time.perf_counter() - wait_start, 3),
+                }
+            writer.write(result)
+            results.append(result)
+            if len(results) % 100 == 0:
+                elapsed = time.perf_counter() - start
+                print(f"{len(results)} leads, {len(results) / elapsed:.1f}/s")
+
+    try:
+        await asyncio.gather(produce(), *(worker() for _ in range(concurrency)))
+    finally:
+        writer.close()
+    if writer.errors_written:
+        print(f"{writer.errors_written} failed leads written to {writer.errors_path}")
+
+    summary = summarize(results, time.perf_counter() - start)
+    summary["skipped"] = skipped
+    summary["duplicates"] = len(results) - len(first_results)
+    if stage_cache:
+        summary["stage_cache"] = stage_cache.stats()
+    return summary
+
+
+def summarize(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """Throughput, status counts, validation outcomes and latency percentiles."""
+    latencies = sorted(result["latency_sec"] for result in results)
+    ok = [result for result in results if result["status"] == "ok"]
+
+    def percentile(fraction: float) -> Optional[float]:
+        if not latencies:
+            return None
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)]
+
+    return {
+        "leads": len(results),
+        "elapsed_sec": round(elapsed, 2),
+        "leads_per_sec": round(len(results) / elapsed, 2) if elapsed else 0,
+        "statuses": dict(Counter(result["status"] for result in results)),
+        "validation": dict(
+            Counter(
+                (result["validation_status"] or "").split(":")[0].strip().lower()
+                for result in ok
+            )
+        ),
+        "latency_sec": {
+            "mean": round(statistics.mean(latencies), 3) if latencies else None,
+            "p50": percentile(0.5),
+            "p99": percentile(0.99),
+        },
+    }
+
+
+# ===== PART 6: Offline scoring =====
+def score_offline(
+    input_path: str,
+    output_path: str,
+    model: Optional[LeadScoringModel] = None,
+    chunk_size: int = SCORE_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Validate and score every lead with the lead rules and the local model.
+
+    Args:
+        input_path: CSV or JSONL file of leads
+        output_path: CSV or JSONL file to write (overwritten)
+        model: Scoring model (defaults to the default weights)
+        chunk_size: Leads scored per NumPy call
+
+    Returns:
+        Dict[str, Any]: Lead count, throughput, validation outcomes and the
+            number of borderline scores
+    """
+    model = model or LeadScoringModel()
+    leads = read_leads(input_path)
+    counts: Counter = Counter()
+    start = time.perf_counter()
+    with open(output_path, "w", newline="") as output:
+        if output_path.endswith(".csv"):
+            csv_writer = csv.DictWriter(output, fieldnames=SCORE_FIELDS)
+            csv_writer.writeheader()
+            write = csv_writer.writerow
+        else:
+            write = lambda row: output.write(json.dumps(row) + "\n")
+        while chunk := list(islice(leads, chunk_size)):
+            texts = [format_lead(lead) for lead in chunk]
+            checks = [prevalidate(text) for text in texts]
+            scored = model.score_texts(texts)
+            for lead, check, features, score, borderline in zip(
+                chunk,
+                checks,
+                scored["features"],
+                scored["scores"],
+                scored["borderline"],
+            ):
+                if check["clearly_invalid"]:
+                    row = {
+                        "id": lead["id"],
+                        "validation_status": f"invalid: {check['reason']}",
+                        "lead_score": 0,
+                        "borderline": False,
+                    }
+                else:
+                    row = {
+                        "id": lead["id"],
+                        "validation_status": "valid",
+                        "lead_score": f"{score}: {justify(features)}",
+                        "borderline": bool(borderline),
+                    }
+                write(row)
+                counts[row["validation_status"].split(":")[0]] += 1
+                counts["borderline"] += row["borderline"]
+    elapsed = time.perf_counter() - start
+    total = counts["valid"] + counts["invalid"]
+    return {
+        "leads": total,
+        "elapsed_sec": round(elapsed, 3),
+        "leads_per_sec": round(total / elapsed) if elapsed else 0,
+        "validation": {"valid": counts["valid"], "invalid": counts["invalid"]},
+        "borderline": counts["borderline"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch lead qualification")
+    parser.add_argument("input", help="CSV or JSONL file of leads")
+    parser.add_argument("output", help="CSV or JSONL file to append results to")
+    parser.add_argument("--checkpoint", help="File of finished lead IDs")
+    parser.add_argument("--errors", help="CSV or JSONL file to append failed leads to")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SEC)
+    parser.add_argument(
+        "--score-only",
+        action="store_true",
+        help="Score with the local model only, without model calls",
+    )
+    parser.add_argument(
+        "--rerun-from",
+        metavar="STAGE",
+        help="Run this stage and later ones again (needs LEAD_STAGE_CACHE)",
+    )
+    args = parser.parse_args()
+    if args.rerun_from:
+        if not stage_cache:
+            parser.error("--rerun-from needs LEAD_STAGE_CACHE to be set")
+        stage_cache.rerun_from(args.rerun_from)
+    if args.score_only:
+        summary = score_offline(args.input, args.output)
+    else:
+        summary = asyncio.run(
+            run_batch(
+                args.input,
+                args.output,
+                args.checkpoint,
+                args.concurrency,
+                args.timeout,
+                errors_path=args.errors,
+            )
+        )
+    print(json.dumps(summary, indent=2))
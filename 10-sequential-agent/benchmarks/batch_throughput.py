@@ -0,0 +1,94 @@
+"""
+Batch Throughput Benchmark
+
+Qualifies --leads synthetic leads with batch.py's run_batch at several
+concurrency limits. A scripted model stands in for Gemini (every call takes
+--model-latency seconds). The last part stops a batch partway through and
+restarts it, to show that the checkpoint skips finished leads.
+
+Usage (from 10-sequential-agent/):
+    python -m benchmarks.batch_throughput --leads 500 --concurrency 1 8 32
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+
+from batch import APP_NAME, read_checkpoint, run_batch
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from lead_qualification_agent.agent import root_agent
+
+from benchmarks.fake_model import ScriptedModel, use_fake_model
+from benchmarks.sample_leads import SCRIPTS, make_leads, write_csv
+
+
+def new_runner() -> Runner:
+    return Runner(
+        agent=root_agent, app_name=APP_NAME, session_service=InMemorySessionService()
+    )
+
+
+async def main(args):
+    model = ScriptedModel(
+        model="scripted", latency_sec=args.model_latency, scripts=SCRIPTS
+    )
+    use_fake_model(root_agent, model)
+    workdir = tempfile.mkdtemp()
+    input_path = os.path.join(workdir, "leads.csv")
+    write_csv(input_path, make_leads(args.leads))
+
+    print(
+        f"{'concurrency':>11} {'leads/s':>8} {'elapsed_s':>9} {'p50_s':>6} {'p99_s':>6}"
+    )
+    for concurrency in args.concurrency:
+        summary = await run_batch(
+            input_path,
+            os.path.join(workdir, f"qualified_{concurrency}.csv"),
+            concurrency=concurrency,
+            runner=new_runner(),
+        )
+        print(
+            f"{concurrency:>11} {summary['leads_per_sec']:>8.1f} "
+            f"{summary['elapsed_sec']:>9.2f} {summary['latency_sec']['p50']:>6.2f} "
+            f"{summary['latency_sec']['p99']:>6.2f}"
+        )
+
+    # Stop a batch halfway, then restart it
+    output_path = os.path.join(workdir, "qualified_resumed.jsonl")
+    checkpoint_path = output_path + ".checkpoint"
+    concurrency = args.concurrency[-1]
+    batch = asyncio.ensure_future(
+        run_batch(input_path, output_path, concurrency=concurrency, runner=new_runner())
+    )
+    while (
+        not os.path.exists(checkpoint_path)
+        or len(read_checkpoint(checkpoint_path)) < args.leads // 2
+    ):
+        await asyncio.sleep(0.05)
+    batch.cancel()
+    await asyncio.gather(batch, return_exceptions=True)
+    finished = len(read_checkpoint(checkpoint_path))
+    resumed = await run_batch(
+        input_path, output_path, concurrency=concurrency, runner=new_runner()
+    )
+    with open(output_path) as file:
+        rows = sum(1 for _ in file)
+    print(
+        f"stopped after {finished} leads; the restart skipped {resumed['skipped']} "
+        f"and ran {resumed['leads']}; {rows} rows in the output"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch lead qualification")
+    parser.add_argument("--leads", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument(
+        "--model-latency",
+        type=float,
+        default=0.2,
+        help="Seconds each model call takes",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,160 @@
+"""
+Company Index Benchmark
+
+Generates a synthetic company dataset of --companies rows (plus the
+companies the sample leads come from), builds the enrichment index and
+measures:
+
+- build time, index size and the time to open the index (memory-mapped)
+- lookups by domain (hits and misses), exact name and name prefix, in
+  microseconds, next to a full scan of the domain column for comparison
+- how many sample leads get a company profile, and by which field
+
+Usage (from 10-sequential-agent/):
+    python -m benchmarks.company_index --companies 2000000
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+
+import numpy as np
+from batch import format_lead
+from lead_qualification_agent.enrichment import CompanyIndex, build_index
+from lead_qualification_agent.lead_rules import extract_fields
+
+from benchmarks.sample_leads import COMPANIES, make_leads
+
+WORDS = [
+    "Acme", "Apex", "Blue", "Bright", "Cedar", "Delta", "Echo", "Falcon",
+    "Granite", "Harbor", "Iron", "Juniper", "Keystone", "Lumen", "Maple",
+    "Nova", "Orion", "Pine", "Quartz", "River", "Summit", "Titan", "Vertex",
+    "Willow",
+]  # fmt: skip
+KINDS = [
+    "Analytics", "Bank", "Health", "Labs", "Logistics", "Manufacturing",
+    "Media", "Retail", "Software", "Systems", "Energy", "Foods",
+]  # fmt: skip
+INDUSTRIES = {
+    "Analytics": "Software", "Bank": "Financial Services", "Health": "Healthcare",
+    "Labs": "Biotech", "Logistics": "Logistics", "Manufacturing": "Manufacturing",
+    "Media": "Media", "Retail": "Retail", "Software": "Software",
+    "Systems": "Software", "Energy": "Energy", "Foods": "Food & Beverage",
+}  # fmt: skip
+COUNTRIES = ["US", "GB", "DE", "IN", "JP", "BR", "CA", "FR"]
+
+
+def company_row(name: str, rng: random.Random) -> dict:
+    kind = next((kind for kind in KINDS if kind in name), "Software")
+    employees = int(rng.lognormvariate(4.5, 1.6)) + 1
+    return {
+        "name": name,
+        "domain": name.split()[0].lower() + ".com",
+        "industry": INDUSTRIES[kind],
+        "country": rng.choice(COUNTRIES),
+        "employees": employees,
+        "revenue_musd": round(employees * rng.uniform(0.05, 0.4), 1),
+    }
+
+
+def write_companies(path: str, count: int) -> list:
+    """Write the dataset; returns the synthetic names (for lookups)."""
+    rng = random.Random(3)
+    names = []
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(
+            file,
+            fieldnames=[
+                "name",
+                "domain",
+                "industry",
+                "country",
+                "employees",
+                "revenue_musd",
+            ],
+        )
+        writer.writeheader()
+        for company in COMPANIES:
+            writer.writerow(company_row(company, rng))
+        for index in range(count):
+            # The number keeps names and domains unique
+            name = f"{rng.choice(WORDS)}{index} {rng.choice(KINDS)}"
+            names.append(name)
+            writer.writerow(company_row(name, rng))
+    return names
+
+
+def time_lookups(function, queries) -> float:
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for query in queries:
+        function(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main(args):
+    workdir = tempfile.mkdtemp()
+    csv_path = os.path.join(workdir, "companies.csv")
+    index_dir = os.path.join(workdir, "company_index")
+    names = write_companies(csv_path, args.companies)
+
+    start = time.perf_counter()
+    meta = build_index(csv_path, index_dir)
+    build_sec = time.perf_counter() - start
+    size_mb = (
+        sum(
+            os.path.getsize(os.path.join(index_dir, name))
+            for name in os.listdir(index_dir)
+        )
+        / 1e6
+    )
+    start = time.perf_counter()
+    index = CompanyIndex(index_dir)
+    open_ms = (time.perf_counter() - start) * 1e3
+    print(
+        f"{meta['records']:,} companies: built in {build_sec:.1f}s, "
+        f"{size_mb:.0f} MB on disk, opened in {open_ms:.2f} ms"
+    )
+
+    rng = random.Random(5)
+    sample = rng.sample(names, args.queries)
+    domains = [name.split()[0].lower() + ".com" for name in sample]
+    missing = [f"unknown{i}.example" for i in range(args.queries)]
+    # "Apex123 Logistics" -> "Apex123 Log": unique prefixes
+    prefixes = [name[: len(name.split()[0]) + 4] for name in sample]
+    scan_queries = domains[:20]
+    scan_us = time_lookups(
+        lambda domain: np.flatnonzero(index.records["domain"] == domain.encode()),
+        scan_queries,
+    )
+    print(f"\n{'lookup':<22} {'us/lookup':>10} {'found':>7}")
+    for label, function, queries in (
+        ("domain (hit)", index.by_domain, domains),
+        ("domain (miss)", index.by_domain, missing),
+        ("exact name", index.by_name, sample),
+        ("name prefix", index.by_name, prefixes),
+    ):
+        found = sum(function(query) is not None for query in queries)
+        print(
+            f"{label:<22} {time_lookups(function, queries):>10.1f} "
+            f"{found / len(queries):>7.0%}"
+        )
+    print(f"{'domain (full scan)':<22} {scan_us:>10.0f}")
+
+    matches = Counter()
+    for lead in make_leads(args.leads):
+        company = index.lookup(extract_fields(format_lead(lead)))
+        matches[company["matched_by"] if company else "no match"] += 1
+    print(f"\nsample leads enriched ({args.leads}): {dict(matches)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the company index")
+    parser.add_argument("--companies", type=int, default=2_000_000)
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--leads", type=int, default=1000)
+    main(parser.parse_args())
@@ -0,0 +1,89 @@
+"""
+Scripted Model for Benchmarks
+
+A stand-in for Gemini that needs no network access or API key, so
+benchmarks measure the pipeline itself. Each agent is recognized by a marker
+in its instruction and answered by a script: a function of the lead text
+(the first user message) and the request.
+"""
+
+import asyncio
+import json
+from collections import Counter
+from typing import Callable, Dict
+
+from google.adk.agents import BaseAgent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+from pydantic import Field
+
+CHARS_PER_TOKEN = 4
+
+# Script: (lead text, request) -> reply text
+Script = Callable[[str, LlmRequest], str]
+
+
+def lead_text(llm_request: LlmRequest) -> str:
+    """The first user message, which is the lead."""
+    for content in llm_request.contents:
+        if content.role == "user" and content.parts and content.parts[0].text:
+            return content.parts[0].text
+    return ""
+
+
+def instruction(llm_request: LlmRequest) -> str:
+    return llm_request.config.system_instruction or ""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)."""
+    return max(round(len(text) / CHARS_PER_TOKEN), 1)
+
+
+def input_tokens(llm_request: LlmRequest) -> int:
+    """Rough size of the prompt: the instruction plus every content part."""
+    size = len(instruction(llm_request))
+    for content in llm_request.contents:
+        for part in content.parts or []:
+            size += len(part.text or "")
+    if llm_request.config.response_schema is not None:
+        size += len(json.dumps(llm_request.config.response_schema.model_json_schema()))
+    return max(round(size / CHARS_PER_TOKEN), 1)
+
+
+class ScriptedModel(BaseLlm):
+    """Answers each agent (by instruction marker) with its script."""
+
+    scripts: Dict[str, Script]
+    # Each call takes latency_sec plus the time to generate its output
+    latency_sec: float = 0.0
+    sec_per_output_token: float = 0.0
+    # Model calls and tokens per marker
+    calls: Counter = Field(default_factory=Counter)
+    input_tokens: Counter = Field(default_factory=Counter)
+    output_tokens: Counter = Field(default_factory=Counter)
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        system = instruction(llm_request)
+        marker = next((marker for marker in self.scripts if marker in system), None)
+        if marker is None:
+            raise ValueError("No script for this agent")
+        reply = self.scripts[marker](lead_text(llm_request), llm_request)
+        tokens = estimate_tokens(reply)
+        self.calls[marker] += 1
+        self.input_tokens[marker] += input_tokens(llm_request)
+        self.output_tokens[marker] += tokens
+        latency = self.latency_sec + tokens * self.sec_per_output_token
+        if latency:
+            await asyncio.sleep(latency)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=reply)])
+        )
+
+
+def use_fake_model(agent: BaseAgent, model: BaseLlm) -> None:
+    """Point an agent and all of its sub-agents at the fake model."""
+    if hasattr(agent, "model"):
+        agent.model = model
+    for sub_agent in agent.sub_agents:
+        use_fake_model(sub_agent, model)
@@ -0,0 +1,142 @@
+"""
+Fused Pipeline Benchmark
+
+Compares the three-stage pipeline (LEAD_PIPELINE_MODE=staged: validator,
+scorer, recommender) with the fused mode (LEAD_PIPELINE_MODE=fused: one
+structured-output assessment, then the recommender) on synthetic leads. A
+scripted model stands in for Gemini; each call takes --model-latency seconds
+plus --sec-per-token for every output token. Cost is estimated from the
+prompt and output sizes at PRICE_PER_M_INPUT/OUTPUT.
+
+Each mode runs in its own process, because the pipeline is assembled at
+import from LEAD_PIPELINE_MODE.
+
+Usage (from 10-sequential-agent/):
+    python -m benchmarks.fused_pipeline --leads 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+
+from benchmarks.fake_model import ScriptedModel, use_fake_model
+from benchmarks.sample_leads import SCRIPTS, make_leads, write_csv
+
+# Illustrative prices in USD per million tokens (gemini-2.0-flash list prices)
+PRICE_PER_M_INPUT = 0.10
+PRICE_PER_M_OUTPUT = 0.40
+
+
+async def child(args):
+    """Qualify the leads in the mode set through LEAD_PIPELINE_MODE."""
+    from batch import APP_NAME, run_batch
+    from lead_qualification_agent.agent import PIPELINE_MODE, root_agent
+
+    model = ScriptedModel(
+        model="scripted",
+        latency_sec=args.model_latency,
+        sec_per_output_token=args.sec_per_token,
+        scripts=SCRIPTS,
+    )
+    use_fake_model(root_agent, model)
+    workdir = tempfile.mkdtemp()
+    input_path = os.path.join(workdir, "leads.csv")
+    output_path = os.path.join(workdir, "qualified.jsonl")
+    write_csv(input_path, make_leads(args.leads))
+    summary = await run_batch(
+        input_path,
+        output_path,
+        concurrency=16,
+        runner=Runner(
+            agent=root_agent,
+            app_name=APP_NAME,
+            session_service=InMemorySessionService(),
+        ),
+    )
+    with open(output_path) as file:
+        results = [json.loads(line) for line in file]
+    leads = len(results)
+    input_tokens = sum(model.input_tokens.values())
+    output_tokens = sum(model.output_tokens.values())
+    cost = (input_tokens * PRICE_PER_M_INPUT + output_tokens * PRICE_PER_M_OUTPUT) / 1e6
+    print(
+        json.dumps(
+            {
+                "mode": PIPELINE_MODE,
+                "calls": sum(model.calls.values()) / leads,
+                "input_tokens": input_tokens / leads,
+                "output_tokens": output_tokens / leads,
+                "cost_per_1k_leads": cost / leads * 1000,
+                "mean_sec": summary["latency_sec"]["mean"],
+                "p99_sec": summary["latency_sec"]["p99"],
+                "valid": sum(r["validation_status"] == "valid" for r in results),
+                "scores": sorted(
+                    (r["id"], r["lead_score"].split(":")[0]) for r in results
+                ),
+            }
+        )
+    )
+
+
+def main(args):
+    print(
+        f"{'mode':<7} {'calls/lead':>10} {'in tok':>7} {'out tok':>7} "
+        f"{'$/1k leads':>10} {'mean_s':>7} {'p99_s':>6} {'valid':>6}"
+    )
+    results = {}
+    for mode in ("staged", "fused"):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.fused_pipeline",
+                "--child",
+                "--leads",
+                str(args.leads),
+                "--model-latency",
+                str(args.model_latency),
+                "--sec-per-token",
+                str(args.sec_per_token),
+            ],
+            env={**os.environ, "LEAD_PIPELINE_MODE": mode},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        results[mode] = result
+        print(
+            f"{result['mode']:<7} {result['calls']:>10.2f} "
+            f"{result['input_tokens']:>7.0f} {result['output_tokens']:>7.0f} "
+            f"{result['cost_per_1k_leads']:>10.4f} {result['mean_sec']:>7.2f} "
+            f"{result['p99_sec']:>6.2f} {result['valid']:>6}"
+        )
+    same = results["staged"]["scores"] == results["fused"]["scores"]
+    print(f"same scores in both modes: {same}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the fused validate+score mode against three stages"
+    )
+    parser.add_argument("--leads", type=int, default=200)
+    parser.add_argument("--model-latency", type=float, default=0.3)
+    parser.add_argument(
+        "--sec-per-token",
+        type=float,
+        default=0.005,
+        help="Generation time per output token (0.005 = 200 tokens/s)",
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(child(args))
+    else:
+        main(args)
@@ -0,0 +1,162 @@
+"""
+Local Scoring Benchmark
+
+Measures the local lead scoring model (lead_qualification_agent/scoring.py)
+in two ways:
+
+1. Offline: scores --leads synthetic leads with ``batch.score_offline`` and
+   times feature extraction and the NumPy model separately, next to scoring
+   the same leads one at a time.
+2. In the pipeline: qualifies --pipeline-leads leads with LEAD_SCORER=llm and
+   LEAD_SCORER=local, with a scripted model that takes --model-latency
+   seconds per call, and reports the model calls and latency per lead.
+
+Each scorer runs in its own process, because the pipeline is assembled at
+import from LEAD_SCORER.
+
+Usage (from 10-sequential-agent/):
+    python -m benchmarks.local_scoring --leads 100000 --pipeline-leads 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from batch import format_lead, score_offline
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from lead_qualification_agent.lead_rules import prevalidate
+from lead_qualification_agent.scoring import LeadScoringModel, feature_matrix
+
+from benchmarks.fake_model import ScriptedModel, use_fake_model
+from benchmarks.sample_leads import SCRIPTS, make_leads, write_csv
+
+SCORER_MARKERS = ("Lead Scoring AI",)
+
+
+def offline(args):
+    leads = make_leads(args.leads)
+    workdir = tempfile.mkdtemp()
+    input_path = os.path.join(workdir, "leads.csv")
+    write_csv(input_path, leads)
+    model = LeadScoringModel()
+
+    summary = score_offline(input_path, os.path.join(workdir, "scored.csv"), model)
+    print(
+        f"score_offline: {summary['leads']} leads in {summary['elapsed_sec']:.2f}s "
+        f"({summary['leads_per_sec']}/s, CSV in and out)"
+    )
+
+    texts = [format_lead(lead) for lead in leads]
+    start = time.perf_counter()
+    valid = [text for text in texts if not prevalidate(text)["clearly_invalid"]]
+    rules_sec = time.perf_counter() - start
+    start = time.perf_counter()
+    features = feature_matrix(valid)
+    features_sec = time.perf_counter() - start
+    start = time.perf_counter()
+    scores, borderline = model.score(features)
+    vectorized_sec = time.perf_counter() - start
+    sample = features[: min(len(features), 10000)]
+    start = time.perf_counter()
+    for row in sample:
+        model.score(row[None, :])
+    per_lead_sec = (time.perf_counter() - start) / len(sample) * len(features)
+
+    print(f"  lead rules:         {rules_sec / len(texts) * 1e6:6.1f} us/lead")
+    print(f"  feature extraction: {features_sec / len(valid) * 1e6:6.1f} us/lead")
+    print(
+        f"  NumPy model:        {vectorized_sec / len(valid) * 1e6:6.3f} us/lead "
+        f"vectorized, {per_lead_sec / len(valid) * 1e6:.1f} us/lead one at a time"
+    )
+    print(
+        f"  valid leads: {len(valid)}, borderline: {borderline.mean():.1%} "
+        "(these still go to the model)"
+    )
+    distribution = np.bincount(scores, minlength=11)[1:]
+    print(
+        "  score distribution (1-10): "
+        + " ".join(f"{score}:{count}" for score, count in enumerate(distribution, 1))
+    )
+
+
+async def child(args):
+    """Qualify leads with the scorer set through LEAD_SCORER."""
+    from batch import APP_NAME, run_batch
+    from lead_qualification_agent.agent import SCORER_MODE, root_agent
+
+    model = ScriptedModel(
+        model="scripted", latency_sec=args.model_latency, scripts=SCRIPTS
+    )
+    use_fake_model(root_agent, model)
+    workdir = tempfile.mkdtemp()
+    input_path = os.path.join(workdir, "leads.csv")
+    output_path = os.path.join(workdir, "qualified.jsonl")
+    write_csv(input_path, make_leads(args.pipeline_leads))
+    summary = await run_batch(
+        input_path,
+        output_path,
+        concurrency=16,
+        runner=Runner(
+            agent=root_agent,
+            app_name=APP_NAME,
+            session_service=InMemorySessionService(),
+        ),
+    )
+    leads = summary["leads"]
+    print(
+        json.dumps(
+            {
+                "scorer": SCORER_MODE,
+                "calls": sum(model.calls.values()) / leads,
+                "scorer_calls": sum(model.calls[m] for m in SCORER_MARKERS) / leads,
+                "mean_sec": summary["latency_sec"]["mean"],
+            }
+        )
+    )
+
+
+def pipeline(args):
+    print(f"\n{'scorer':<7} {'calls/lead':>10} {'scorer calls/lead':>17} {'mean_s':>7}")
+    for scorer in ("llm", "local"):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.local_scoring",
+                "--child",
+                "--pipeline-leads",
+                str(args.pipeline_leads),
+                "--model-latency",
+                str(args.model_latency),
+            ],
+            env={**os.environ, "LEAD_SCORER": scorer},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{result['scorer']:<7} {result['calls']:>10.2f} "
+            f"{result['scorer_calls']:>17.2f} {result['mean_sec']:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark local lead scoring")
+    parser.add_argument("--leads", type=int, default=100000)
+    parser.add_argument("--pipeline-leads", type=int, default=200)
+    parser.add_argument("--model-latency", type=float, default=0.3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(child(args))
+    else:
+        offline(args)
+        pipeline(args)
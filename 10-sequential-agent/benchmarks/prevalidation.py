@@ -0,0 +1,137 @@
+"""
+Pre-Validation Benchmark
+
+Runs a sample dataset of synthetic leads through the pipeline with a
+scripted model and reports the share of model calls the rule-based
+pre-validator and the invalid-lead callbacks avoid. Without them every lead
+costs three calls (validator, scorer, recommender). It also compares the
+rules with a reference verdict that follows LeadValidatorAgent's
+instruction (sample_leads.instruction_verdict, which reads the generated
+columns and shares no pattern with the rules): a lead the rules reject but
+the instruction accepts is a lead lost without a model ever seeing it. It
+also times the rules on their own, and exits with an error if the rules
+reject a lead the instruction accepts.
+
+Usage (from 10-sequential-agent/):
+    python -m benchmarks.prevalidation --leads 1000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from batch import APP_NAME, format_lead, run_batch
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from lead_qualification_agent.agent import root_agent
+from lead_qualification_agent.lead_rules import prevalidate
+
+from benchmarks.fake_model import ScriptedModel, use_fake_model
+from benchmarks.sample_leads import (
+    SCRIPTS,
+    instruction_verdict,
+    make_leads,
+    write_csv,
+)
+
+STAGES_PER_LEAD = 3
+
+
+async def main(args):
+    leads = make_leads(args.leads)
+    texts = [format_lead(lead) for lead in leads]
+
+    # The rules alone
+    start = time.perf_counter()
+    verdicts = [prevalidate(text) for text in texts]
+    rules_us = (time.perf_counter() - start) / len(texts) * 1e6
+    expected = [instruction_verdict(lead) for lead in leads]
+    rejected = [
+        (lead, reference)
+        for lead, verdict, reference in zip(leads, verdicts, expected)
+        if verdict["clearly_invalid"]
+    ]
+    wrongly_rejected = [
+        lead["id"] for lead, reference in rejected if reference == "valid"
+    ]
+    left_to_model = sum(
+        not verdict["clearly_invalid"] and reference != "valid"
+        for verdict, reference in zip(verdicts, expected)
+    )
+
+    # The whole pipeline
+    model = ScriptedModel(model="scripted", scripts=SCRIPTS)
+    use_fake_model(root_agent, model)
+    workdir = tempfile.mkdtemp()
+    input_path = os.path.join(workdir, "leads.csv")
+    output_path = os.path.join(workdir, "qualified.jsonl")
+    write_csv(input_path, leads)
+    await run_batch(
+        input_path,
+        output_path,
+        concurrency=32,
+        runner=Runner(
+            agent=root_agent,
+            app_name=APP_NAME,
+            session_service=InMemorySessionService(),
+        ),
+    )
+    # Results are written in the order leads finish
+    with open(output_path) as file:
+        results = {result["id"]: result for result in map(json.loads, file)}
+
+    baseline = STAGES_PER_LEAD * len(leads)
+    calls = sum(model.calls.values())
+    outcomes = Counter(
+        (
+            "rejected by rules"
+            if verdict["clearly_invalid"]
+            else results[lead["id"]]["validation_status"].split(":")[0]
+        )
+        for lead, verdict in zip(leads, verdicts)
+    )
+    print(f"\nleads: {len(leads)} ({dict(outcomes)})")
+    print(f"rules: {rules_us:.1f} us per lead")
+    print(
+        f"rejected by rules: {len(rejected)}, of which the instruction accepts "
+        f"{len(wrongly_rejected)}"
+        + (f" ({', '.join(wrongly_rejected[:5])}, ...)" if wrongly_rejected else "")
+    )
+    print(f"invalid by the instruction but left to the model: {left_to_model}")
+    final = [
+        (
+            f"invalid: {verdict['reason']}"
+            if verdict["clearly_invalid"]
+            else results[lead["id"]]["validation_status"]
+        )
+        for lead, verdict in zip(leads, verdicts)
+    ]
+    agreement = sum(
+        status.split(":")[0] == reference.split(":")[0]
+        for status, reference in zip(final, expected)
+    )
+    print(
+        f"pipeline verdict agrees with the instruction for {agreement} of "
+        f"{len(leads)} leads ({agreement / len(leads):.1%})"
+    )
+    print(
+        "model calls: "
+        + ", ".join(f"{marker} {count}" for marker, count in model.calls.items())
+    )
+    print(
+        f"{calls} model calls instead of {baseline}: "
+        f"{1 - calls / baseline:.1%} avoided"
+    )
+    if wrongly_rejected:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rule-based pre-validation")
+    parser.add_argument("--leads", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,180 @@
+"""
+Sample Leads for Benchmarks
+
+Generates synthetic leads in the shapes sales teams actually receive:
+complete leads with a clear need, vague conference contacts, a name without
+an email or phone number, free-text notes such as "asked for a demo", and
+rows that are missing contact details or any stated need. Also provides the scripts the scripted model answers the
+pipeline's agents with, and a reference verdict per lead that follows
+LeadValidatorAgent's instruction.
+"""
+
+import csv
+import json
+import random
+import re
+from typing import Any, Dict, List
+
+FIRST_NAMES = ["Sarah", "John", "Priya", "Miguel", "Aiko", "Fatima", "Liam", "Zoe"]
+LAST_NAMES = ["Johnson", "Doe", "Patel", "Garcia", "Tanaka", "Khan", "Murphy", "Li"]
+COMPANIES = [
+    "Tech Innovate Solutions",
+    "Northwind Logistics",
+    "Bluefin Health",
+    "Acme Manufacturing",
+    "Summit Retail Group",
+    "Orbit Fintech",
+]
+POSITIONS = ["CTO", "VP of Operations", "Head of Support", "Engineer", "Intern", ""]
+NEEDS = [
+    "Looking for an AI solution to automate customer support",
+    "Wants to reduce manual data entry in the warehouse",
+    "Needs better fraud detection for card payments",
+    "Evaluating chatbots for the patient portal",
+    "Asked for a demo and pricing for 200 seats next quarter",
+    "Requested a quote for the enterprise plan",
+    "Signed up for a trial and booked a call with sales",
+]
+VAGUE_NEEDS = ["Something with AI maybe", "Just browsing", ""]
+BUDGETS = ["$50K-100K available for the right solution", "Budget approved", ""]
+TIMELINES = ["Hoping to implement within next quarter", "ASAP", "Next year", ""]
+# Share of each kind of lead
+LEAD_MIX = {
+    "complete": 0.45,
+    "vague": 0.2,
+    "name_only": 0.1,
+    "no_contact": 0.15,
+    "no_need": 0.05,
+    "free_text": 0.05,
+}
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+PHONE_PATTERN = re.compile(r"\d{3}[-. ]\d{3}[-. ]\d{4}")
+
+
+def make_lead(index: int, rng: random.Random) -> Dict[str, Any]:
+    """One synthetic lead as a CSV row."""
+    kind = rng.choices(list(LEAD_MIX), list(LEAD_MIX.values()))[0]
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    company = rng.choice(COMPANIES)
+    domain = company.split()[0].lower() + ".com"
+    lead = {"id": f"lead-{index}"}
+    if kind == "free_text":
+        # Pasted from an email or a call note, with no labeled fields
+        email = f"{first.lower()}@{domain}"
+        need = rng.choice(NEEDS)
+        lead["text"] = f"{first} {last} from {company} ({email}). {need}."
+        return lead
+    if kind != "no_contact":
+        lead["name"] = f"{first} {last}"
+    if kind not in ("no_contact", "name_only"):
+        lead["email"] = f"{first.lower()}.{last.lower()[0]}@{domain}"
+        if rng.random() < 0.6:
+            lead["phone"] = f"555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+    lead["company"] = company
+    if kind == "complete":
+        lead["position"] = rng.choice(POSITIONS)
+        lead["interest"] = rng.choice(NEEDS)
+        lead["budget"] = rng.choice(BUDGETS)
+        lead["timeline"] = rng.choice(TIMELINES)
+    elif kind == "vague":
+        lead["interest"] = rng.choice(VAGUE_NEEDS)
+        lead["notes"] = "Met at conference, seemed interested but was vague"
+    elif kind in ("no_contact", "name_only"):
+        lead["interest"] = rng.choice(NEEDS)
+    return {key: value for key, value in lead.items() if value}
+
+
+def make_leads(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [make_lead(index, rng) for index in range(count)]
+
+
+def instruction_verdict(lead: Dict[str, Any]) -> str:
+    """
+    The verdict LeadValidatorAgent's instruction asks for, from the row's
+    columns rather than the lead text, so it does not share any pattern with
+    the lead rules: contact information is a name, email or phone, and an
+    interest, a note, a budget or a timeline indicates a need. A free-text
+    lead always names the contact and states a need.
+    """
+    if "text" in lead:
+        return "valid"
+    if not {"name", "email", "phone"} & lead.keys():
+        return "invalid: missing contact information"
+    if not {"interest", "notes", "budget", "timeline"} & lead.keys():
+        return "invalid: no indication of interest or need"
+    return "valid"
+
+
+def write_csv(path: str, leads: List[Dict[str, Any]]) -> None:
+    columns = list(dict.fromkeys(key for lead in leads for key in lead))
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(leads)
+
+
+# --- Scripts for the scripted model: (lead text, request) -> reply ---
+
+
+def validate(lead: str, llm_request=None) -> str:
+    # A name, an email or a phone number is enough contact information
+    if not (
+        "Name:" in lead or EMAIL_PATTERN.search(lead) or PHONE_PATTERN.search(lead)
+    ):
+        return "invalid: missing contact information"
+    if not (
+        "Interest:" in lead
+        or "interested" in lead
+        or any(need in lead for need in NEEDS)
+    ):
+        return "invalid: no indication of interest or need"
+    return "valid"
+
+
+def score(lead: str, llm_request=None) -> str:
+    points = 2 + sum(
+        word in lead for word in ("Budget", "Timeline", "CTO", "VP", "Head of")
+    )
+    points += 2 * any(need in lead for need in NEEDS)
+    return f"{min(points, 10)}: Scored from the stated need, role, budget and timeline"
+
+
+def recommend(lead: str, llm_request=None) -> str:
+    return (
+        "Recommended next steps: schedule a discovery call to confirm the use "
+        "case, identify the decision maker and agree on an evaluation timeline. "
+        "Share a relevant case study ahead of the call."
+    )
+
+
+def assess(lead: str, llm_request=None) -> str:
+    """The fused assessor's structured answer: the validator's and scorer's."""
+    status = validate(lead)
+    if status != "valid":
+        return json.dumps(
+            {
+                "valid": False,
+                "invalid_reason": status.split(": ", 1)[1],
+                "score": 0,
+                "justification": "",
+            }
+        )
+    points, justification = score(lead).split(": ", 1)
+    return json.dumps(
+        {
+            "valid": True,
+            "invalid_reason": "",
+            "score": int(points),
+            "justification": justification,
+        }
+    )
+
+
+SCRIPTS = {
+    "Lead Assessment AI": assess,
+    "Lead Validation AI": validate,
+    "Lead Scoring AI": score,
+    "Action Recommendation AI": recommend,
+}
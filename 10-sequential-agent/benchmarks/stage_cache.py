@@ -0,0 +1,126 @@
+"""
+Stage Cache Benchmark
+
+Qualifies a synthetic lead list in which --duplicates of the rows repeat an
+earlier lead under a new ID (the same contact exported twice), with a
+scripted model and a fresh SQLite stage cache, three times:
+
+1. cold: empty cache; repeated leads in the batch run once
+2. warm: the same list again; every stage comes from the cache
+3. rerun: --rerun-from ActionRecommenderAgent; only the recommender runs
+
+Each run is its own process, as separate batch runs would be, so the cache
+only carries over through the SQLite file.
+
+Usage (from 10-sequential-agent/):
+    python -m benchmarks.stage_cache --leads 500 --duplicates 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+
+from benchmarks.fake_model import ScriptedModel, use_fake_model
+from benchmarks.sample_leads import SCRIPTS, make_leads, write_csv
+
+RERUN_STAGE = "ActionRecommenderAgent"
+
+
+async def child(args):
+    """Qualify the lead list once with the cache in LEAD_STAGE_CACHE."""
+    from batch import APP_NAME, run_batch
+    from lead_qualification_agent.agent import root_agent, stage_cache
+
+    if args.rerun_from:
+        stage_cache.rerun_from(args.rerun_from)
+    model = ScriptedModel(
+        model="scripted", latency_sec=args.model_latency, scripts=SCRIPTS
+    )
+    use_fake_model(root_agent, model)
+    summary = await run_batch(
+        args.input,
+        args.output,
+        concurrency=16,
+        runner=Runner(
+            agent=root_agent,
+            app_name=APP_NAME,
+            session_service=InMemorySessionService(),
+        ),
+    )
+    summary["model_calls"] = dict(model.calls)
+    print(json.dumps(summary))
+
+
+def main(args):
+    leads = make_leads(args.leads)
+    rng = random.Random(11)
+    for index in range(int(args.leads * args.duplicates)):
+        leads.append({**rng.choice(leads[: args.leads]), "id": f"repeat-{index}"})
+    rng.shuffle(leads)
+    workdir = tempfile.mkdtemp()
+    input_path = os.path.join(workdir, "leads.csv")
+    write_csv(input_path, leads)
+    cache_path = os.path.join(workdir, "stages.db")
+
+    print(
+        f"{'run':<6} {'leads':>5} {'dupes':>5} {'model calls':>11} "
+        f"{'elapsed_s':>9} {'leads/s':>8}  cache hits"
+    )
+    for run, rerun_from in (("cold", None), ("warm", None), ("rerun", RERUN_STAGE)):
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.stage_cache",
+            "--child",
+            "--input",
+            input_path,
+            "--output",
+            os.path.join(workdir, f"{run}.jsonl"),
+            "--model-latency",
+            str(args.model_latency),
+        ]
+        if rerun_from:
+            command += ["--rerun-from", rerun_from]
+        output = subprocess.run(
+            command,
+            env={**os.environ, "LEAD_STAGE_CACHE": cache_path},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        summary = json.loads(output.strip().splitlines()[-1])
+        hits = {
+            stage.replace("Agent", ""): counts["hits"]
+            for stage, counts in summary["stage_cache"].items()
+        }
+        print(
+            f"{run:<6} {summary['leads']:>5} {summary['duplicates']:>5} "
+            f"{sum(summary['model_calls'].values()):>11} "
+            f"{summary['elapsed_sec']:>9.2f} {summary['leads_per_sec']:>8.1f}  {hits}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the stage result cache")
+    parser.add_argument("--leads", type=int, default=500)
+    parser.add_argument(
+        "--duplicates", type=float, default=0.2, help="Share of repeated rows"
+    )
+    parser.add_argument("--model-latency", type=float, default=0.3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--input", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    parser.add_argument("--rerun-from", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(child(args))
+    else:
+        main(args)
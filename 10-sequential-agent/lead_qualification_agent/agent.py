@@ -3,19 +3,66 @@ Sequential Agent with a Minimal Callback
 
 This example demonstrates a lead qualification pipeline with a minimal
 before_agent_callback that only initializes state once at the beginning.
+A rule-based pre-validator runs first; leads it (or the validator) marks
+invalid skip the remaining model calls. With LEAD_PIPELINE_MODE=fused, one
+structured-output call validates and scores the lead instead of two. With
+LEAD_SCORER=local, leads are scored by a local feature model and only
+borderline scores go to the model. With LEAD_STAGE_CACHE set to a file,
+each stage's output is cached in SQLite and reused for leads seen before.
+With LEAD_COMPANY_INDEX set to a company index, the lead's company profile
+is looked up locally and given to the scorer.
 """
 
+import os
+
 from google.adk.agents import SequentialAgent
 
+from .stage_cache import StageCache
+from .subagents.assessor import lead_assessor_agent
+from .subagents.enricher import company_enricher_agent
+from .subagents.local_scorer import local_lead_scorer_agent
+from .subagents.prevalidator import lead_prevalidator_agent
 from .subagents.recommender import action_recommender_agent
 from .subagents.scorer import lead_scorer_agent
 
 # Import the subagents
 from .subagents.validator import lead_validator_agent
 
+# LEAD_PIPELINE_MODE=fused validates and scores in a single model call
+PIPELINE_MODE = os.getenv("LEAD_PIPELINE_MODE", "staged")
+# LEAD_SCORER=local scores with a local feature model (staged mode only)
+SCORER_MODE = os.getenv("LEAD_SCORER", "llm")
+# LEAD_STAGE_CACHE=path caches stage outputs in a SQLite file
+STAGE_CACHE_PATH = os.getenv("LEAD_STAGE_CACHE")
+
+# LEAD_COMPANY_INDEX=dir adds the company profile before scoring
+enrichment_steps = [company_enricher_agent] if company_enricher_agent else []
+
+if PIPELINE_MODE == "fused":
+    qualification_steps = [*enrichment_steps, lead_assessor_agent]
+elif SCORER_MODE == "local":
+    qualification_steps = [
+        lead_validator_agent,
+        *enrichment_steps,
+        local_lead_scorer_agent,
+    ]
+else:
+    qualification_steps = [lead_validator_agent, *enrichment_steps, lead_scorer_agent]
+
 # Create the sequential agent with minimal callback
 root_agent = SequentialAgent(
     name="LeadQualificationPipeline",
-    sub_agents=[lead_validator_agent, lead_scorer_agent, action_recommender_agent],
+    sub_agents=[
+        lead_prevalidator_agent,  # Rejects clearly invalid leads without a model call
+        *qualification_steps,
+        action_recommender_agent,  # Only called for valid leads
+    ],
     description="A pipeline that validates, scores, and recommends actions for sales leads",
 )
+
+stage_cache = None
+if STAGE_CACHE_PATH:
+    stage_cache = StageCache(STAGE_CACHE_PATH)
+    # The pre-validator is cheaper than a cache lookup. The enricher is not
+    # cached either, but its company index is part of the later versions
+    stage_cache.attach([*qualification_steps, action_recommender_agent])
@@ -0,0 +1,75 @@
+"""
+Invalid Lead Callbacks
+
+This module provides the before_agent_callbacks that keep invalid leads
+from costing model calls. Once a lead is invalid (marked by the
+pre-validator or by LeadValidatorAgent), each later stage is skipped and
+writes a fixed output to its state key instead, so the pipeline's outputs
+stay complete.
+"""
+
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+
+# --- Constants ---
+UNSCORED = "0: Not scored because the lead is invalid"
+
+
+def _skip(callback_context: CallbackContext, key: str, value: str) -> types.Content:
+    """Write the stage's output and return content, which skips the agent."""
+    callback_context.state[key] = value
+    return types.Content(role="model", parts=[types.Part(text=value)])
+
+
+def is_invalid(callback_context: CallbackContext) -> bool:
+    status = callback_context.state.get("validation_status") or ""
+    return status.strip().lower().startswith("invalid")
+
+
+def skip_validation_if_prevalidated(
+    callback_context: CallbackContext,
+) -> Optional[types.Content]:
+    """LeadValidatorAgent: skip leads the pre-validator already rejected."""
+    prevalidation = callback_context.state.get("prevalidation") or {}
+    if prevalidation.get("clearly_invalid"):
+        return types.Content(
+            role="model",
+            parts=[types.Part(text=callback_context.state["validation_status"])],
+        )
+    return None
+
+
+def skip_assessment_if_prevalidated(
+    callback_context: CallbackContext,
+) -> Optional[types.Content]:
+    """LeadAssessorAgent (fused mode): skip leads the pre-validator rejected."""
+    prevalidation = callback_context.state.get("prevalidation") or {}
+    if prevalidation.get("clearly_invalid"):
+        return _skip(callback_context, "lead_score", UNSCORED)
+    return None
+
+
+def skip_scoring_if_invalid(
+    callback_context: CallbackContext,
+) -> Optional[types.Content]:
+    """LeadScorerAgent: invalid leads are not scored."""
+    if is_invalid(callback_context):
+        return _skip(callback_context, "lead_score", UNSCORED)
+    return None
+
+
+def skip_recommendation_if_invalid(
+    callback_context: CallbackContext,
+) -> Optional[types.Content]:
+    """ActionRecommenderAgent: ask for the missing information instead."""
+    if is_invalid(callback_context):
+        reason = callback_context.state["validation_status"].split(":", 1)[-1]
+        return _skip(
+            callback_context,
+            "action_recommendation",
+            "Do not contact sales yet. Gather the missing information first "
+            f"({reason.strip() or 'incomplete lead'}), then qualify the lead again.",
+        )
+    return None
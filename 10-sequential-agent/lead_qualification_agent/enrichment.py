@@ -0,0 +1,311 @@
+"""
+Company Enrichment Index
+
+This module looks up a lead's company in a local company dataset, so the
+scorer can judge budget and authority from firmographics (industry, size,
+revenue) instead of guessing from what the lead typed. The dataset is a CSV
+file that ``build_index`` turns into NumPy arrays once:
+
+- records.npy: one fixed-width record per company
+- domain_hashes.npy / domain_rows.npy: 64-bit hashes of the domains, sorted,
+  with the record each one belongs to
+- names.npy / name_rows.npy: normalized company names, sorted, with their
+  records
+
+``CompanyIndex`` opens the arrays with ``np.load(mmap_mode="r")``, so
+opening an index of millions of companies takes milliseconds and only the
+pages a lookup touches are read. Lookups are binary searches
+(``np.searchsorted``): by email or website domain first, then by exact
+normalized name, then by name prefix when exactly one company matches.
+
+Usage:
+    python -m lead_qualification_agent.enrichment build companies.csv company_index
+    python -m lead_qualification_agent.enrichment lookup company_index acme.com
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# --- Constants ---
+CSV_COLUMNS = ("name", "domain", "industry", "country", "employees", "revenue_musd")
+RECORD_DTYPE = np.dtype(
+    [
+        ("name", "S48"),
+        ("domain", "S40"),
+        ("industry", "u1"),
+        ("country", "S2"),
+        ("employees", "<u4"),
+        ("revenue_musd", "<f4"),
+    ]
+)
+NAME_WIDTH = 48
+BUILD_CHUNK_SIZE = 100_000
+INDEX_FILES = ("records", "domain_hashes", "domain_rows", "names", "name_rows")
+# Prefixes shorter than this match too many companies to mean anything
+MIN_PREFIX_LENGTH = 4
+FREE_MAIL_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "googlemail.com",
+        "yahoo.com",
+        "hotmail.com",
+        "outlook.com",
+        "live.com",
+        "icloud.com",
+        "aol.com",
+        "proton.me",
+        "protonmail.com",
+    }
+)
+LEGAL_SUFFIX_PATTERN = re.compile(
+    r"\b(?:inc|incorporated|llc|ltd|limited|corp|corporation|co|gmbh|plc|ag|sa)\b"
+)
+NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+MATCH_DESCRIPTIONS = {
+    "email_domain": "email domain",
+    "website": "website",
+    "name": "company name",
+    "name_prefix": "company name prefix",
+}
+
+
+def normalize_domain(value: str) -> str:
+    """'https://www.Acme.com/about' -> 'acme.com'."""
+    domain = value.strip().lower().split("://")[-1].split("/")[0].rstrip(".")
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+def normalize_name(name: str) -> bytes:
+    """'Acme Manufacturing, Inc.' -> b'acme manufacturing', as in names.npy."""
+    name = name.lower().replace("&", " and ")
+    name = NON_ALNUM_PATTERN.sub(" ", name)
+    name = LEGAL_SUFFIX_PATTERN.sub(" ", name)
+    return " ".join(name.split()).encode("utf-8")[:NAME_WIDTH]
+
+
+def domain_hash(domain: str) -> int:
+    """64-bit hash of a normalized domain."""
+    digest = hashlib.blake2b(domain.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+# ===== Building =====
+def _read_chunks(csv_path: str, industries: Dict[str, int]) -> Iterator[tuple]:
+    """Records, domain hashes and normalized names, BUILD_CHUNK_SIZE rows at a time."""
+    with open(csv_path, newline="") as file:
+        rows = csv.DictReader(file)
+        while chunk := list(islice(rows, BUILD_CHUNK_SIZE)):
+            records = np.zeros(len(chunk), dtype=RECORD_DTYPE)
+            hashes = np.empty(len(chunk), dtype=np.uint64)
+            names = np.empty(len(chunk), dtype=f"S{NAME_WIDTH}")
+            for i, row in enumerate(chunk):
+                domain = normalize_domain(row.get("domain") or "")
+                industry = row.get("industry") or ""
+                records[i] = (
+                    row["name"].encode("utf-8")[:48],
+                    domain.encode("utf-8")[:40],
+                    industries.setdefault(industry, len(industries)),
+                    (row.get("country") or "").encode("utf-8")[:2],
+                    int(row.get("employees") or 0),
+                    float(row.get("revenue_musd") or 0),
+                )
+                hashes[i] = domain_hash(domain) if domain else 0
+                names[i] = normalize_name(row["name"])
+            yield records, hashes, names
+
+
+def build_index(csv_path: str, index_dir: str) -> Dict[str, Any]:
+    """
+    Build the index files for a company CSV.
+
+    Args:
+        csv_path: CSV with the columns in CSV_COLUMNS
+        index_dir: Directory to write the index to (created if missing)
+
+    Returns:
+        Dict[str, Any]: The index metadata (record count, industries)
+    """
+    industries: Dict[str, int] = {}
+    parts = list(_read_chunks(csv_path, industries))
+    if len(industries) > 256:
+        raise ValueError(f"{len(industries)} industries; the index holds up to 256")
+    records = np.concatenate([part[0] for part in parts])
+    hashes = np.concatenate([part[1] for part in parts])
+    names = np.concatenate([part[2] for part in parts])
+
+    os.makedirs(index_dir, exist_ok=True)
+    np.save(os.path.join(index_dir, "records.npy"), records)
+    order = np.argsort(hashes, kind="stable")
+    np.save(os.path.join(index_dir, "domain_hashes.npy"), hashes[order])
+    np.save(os.path.join(index_dir, "domain_rows.npy"), order.astype(np.uint32))
+    order = np.argsort(names, kind="stable")
+    np.save(os.path.join(index_dir, "names.npy"), names[order])
+    np.save(os.path.join(index_dir, "name_rows.npy"), order.astype(np.uint32))
+    meta = {"records": len(records), "industries": list(industries)}
+    with open(os.path.join(index_dir, "meta.json"), "w") as file:
+        json.dump(meta, file)
+    return meta
+
+
+def index_version(index_dir: str) -> str:
+    """
+    Identify one build of an index.
+
+    Hashes meta.json and the size and modification time of every index
+    file, so rebuilding the index in place, or pointing at another one,
+    gives a new version.
+    """
+    digest = hashlib.sha1()
+    with open(os.path.join(index_dir, "meta.json"), "rb") as file:
+        digest.update(file.read())
+    for name in INDEX_FILES:
+        stat = os.stat(os.path.join(index_dir, f"{name}.npy"))
+        digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:12]
+
+
+# ===== Lookups =====
+class CompanyIndex:
+    """
+    Memory-mapped company index built by ``build_index``.
+
+    Args:
+        index_dir: Directory with the index files
+    """
+
+    def __init__(self, index_dir: str):
+        self.index_dir = index_dir
+        with open(os.path.join(index_dir, "meta.json")) as file:
+            self.meta = json.load(file)
+        self.industries: List[str] = self.meta["industries"]
+
+        def load(name: str) -> np.ndarray:
+            array = np.load(os.path.join(index_dir, f"{name}.npy"), mmap_mode="r")
+            # Same mapped memory; plain ndarray indexing skips np.memmap overhead
+            return array.view(np.ndarray)
+
+        self.records = load("records")
+        self.domain_hashes = load("domain_hashes")
+        self.domain_rows = load("domain_rows")
+        self.names = load("names")
+        self.name_rows = load("name_rows")
+        self.version = index_version(index_dir)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """One company as a dictionary."""
+        # One tuple of Python values is much faster than field-by-field access
+        name, domain, industry, country, employees, revenue = self.records[row].item()
+        return {
+            "name": name.decode("utf-8", "ignore"),
+            "domain": domain.decode("utf-8", "ignore"),
+            "industry": self.industries[industry],
+            "country": country.decode("utf-8", "ignore"),
+            "employees": employees,
+            "revenue_musd": round(revenue, 1),
+        }
+
+    def by_domain(self, domain: str) -> Optional[Dict[str, Any]]:
+        """The company with this domain (or email domain), if any."""
+        domain = normalize_domain(domain)
+        if not domain:
+            return None
+        key = np.uint64(domain_hash(domain))
+        encoded = domain.encode("utf-8")[:40]
+        position = int(self.domain_hashes.searchsorted(key))
+        # Equal hashes are adjacent; compare the domains to rule out collisions
+        while (
+            position < len(self.domain_hashes) and self.domain_hashes[position] == key
+        ):
+            row = int(self.domain_rows[position])
+            if self.records[row]["domain"] == encoded:
+                return self.record(row)
+            position += 1
+        return None
+
+    def by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        The company with this name, or the only one whose name starts with it.
+
+        Returns:
+            Optional[Dict[str, Any]]: The company with ``matched_by`` set to
+                "name" or "name_prefix", or None if there is no match or the
+                prefix is ambiguous
+        """
+        key = normalize_name(name)
+        if not key:
+            return None
+        start = int(self.names.searchsorted(key, side="left"))
+        if start < len(self.names) and self.names[start] == key:
+            return {**self.record(int(self.name_rows[start])), "matched_by": "name"}
+        if len(key) < MIN_PREFIX_LENGTH:
+            return None
+        # Every name with this prefix sorts between key and key + 0xff
+        end = int(self.names.searchsorted(key + b"\xff", side="left"))
+        if end - start == 1:
+            return {
+                **self.record(int(self.name_rows[start])),
+                "matched_by": "name_prefix",
+            }
+        return None
+
+    def lookup(self, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Find the company of a lead from its extracted fields.
+
+        Args:
+            fields: Fields from ``lead_rules.extract_fields`` (email,
+                website, company)
+
+        Returns:
+            Optional[Dict[str, Any]]: The company with ``matched_by``, or None
+        """
+        email_domain = (fields.get("email") or "").rpartition("@")[2].lower()
+        if email_domain and email_domain not in FREE_MAIL_DOMAINS:
+            company = self.by_domain(email_domain)
+            if company:
+                return {**company, "matched_by": "email_domain"}
+        if fields.get("website"):
+            company = self.by_domain(fields["website"])
+            if company:
+                return {**company, "matched_by": "website"}
+        if fields.get("company"):
+            return self.by_name(fields["company"])
+        return None
+
+
+def format_profile(company: Optional[Dict[str, Any]]) -> str:
+    """The company as one line for the scorer's instruction."""
+    if not company:
+        return "Not found in the company dataset"
+    return (
+        f"{company['name']} ({company['domain']}): {company['industry']}, "
+        f"{company['employees']:,} employees, "
+        f"${company['revenue_musd']:,.1f}M annual revenue, {company['country']} "
+        f"(matched by {MATCH_DESCRIPTIONS[company['matched_by']]})"
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "build":
+        print(json.dumps(build_index(sys.argv[2], sys.argv[3])))
+    elif len(sys.argv) == 4 and sys.argv[1] == "lookup":
+        index = CompanyIndex(sys.argv[2])
+        query = sys.argv[3]
+        fields = (
+            {"email": query} if "@" in query else {"website": query, "company": query}
+        )
+        company = index.lookup(fields)
+        print(format_profile(company) if company else "No match")
+    else:
+        print(__doc__)
@@ -0,0 +1,115 @@
+"""
+Lead Rules
+
+This module extracts contact details and labeled fields from a lead with
+precompiled patterns and decides, without a model call, whether a lead is
+clearly invalid by the validator's own criteria: a lead filled in as labeled
+fields has no contact information at all (no name, email or phone number), or
+no field or wording that indicates interest or need. Anything less clear-cut,
+including every free-text lead, is left to LeadValidatorAgent.
+"""
+
+import re
+from typing import Any, Dict, List
+
+# --- Constants ---
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(
+    r"(?<![\w.])(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}(?!\w)"
+)
+# "Label: value" lines, as leads are usually pasted from a form or CRM
+FIELD_PATTERN = re.compile(
+    r"^[ \t]*([A-Za-z][A-Za-z /_-]{0,30}?)[ \t]*:[ \t]*(.+?)[ \t]*$", re.M
+)
+NEED_PATTERN = re.compile(
+    r"\b(?:need|needs|looking for|interested|want|wants|evaluat\w*|"
+    r"automate|replace|improve|reduce|problem|solution|help with|"
+    r"demo|quote|pricing|price|trial|proposal|seats|licen[cs]es?)\b",
+    re.I,
+)
+
+# Field -> labels it may appear under (lowercase)
+FIELD_LABELS = {
+    "name": ("name", "contact", "full name", "contact name"),
+    "company": ("company", "organization", "organisation", "account"),
+    "website": ("website", "web", "url", "domain"),
+    "position": ("position", "title", "role", "job title"),
+    "interest": ("interest", "need", "needs", "requirement", "use case"),
+    "budget": ("budget",),
+    "timeline": ("timeline", "timeframe", "timing"),
+    "notes": ("notes", "note", "comments"),
+}
+LABEL_FIELDS = {
+    label: field for field, labels in FIELD_LABELS.items() for label in labels
+}
+# Any one of these is enough contact information
+CONTACT_FIELDS = frozenset({"name", "email", "phone"})
+# Any one of these may indicate interest or need
+NEED_FIELDS = frozenset({"interest", "notes", "budget", "timeline"})
+MISSING_MESSAGES = {
+    "contact": "missing contact information",
+    "need": "no indication of interest or need",
+}
+
+
+def extract_fields(text: str) -> Dict[str, Any]:
+    """
+    Pull the contact details and known labeled fields out of a lead.
+
+    Args:
+        text: The lead as the user wrote it
+
+    Returns:
+        Dict[str, Any]: The fields found (name, email, phone, company,
+            website, position, interest, budget, timeline, notes)
+    """
+    fields: Dict[str, Any] = {}
+    for label, value in FIELD_PATTERN.findall(text):
+        field = LABEL_FIELDS.get(label.strip().lower())
+        if field and field not in fields:
+            fields[field] = value
+    email = EMAIL_PATTERN.search(text)
+    if email:
+        fields["email"] = email.group(0)
+    phone = PHONE_PATTERN.search(text)
+    if phone:
+        fields["phone"] = phone.group(0)
+    return fields
+
+
+def prevalidate(text: str) -> Dict[str, Any]:
+    """
+    Check a lead for the information every valid lead needs.
+
+    Only leads filled in as labeled fields ("Name: ...") are checked. A name
+    counts as contact information, as it does for LeadValidatorAgent, and an
+    interest, notes, budget or timeline field or any need wording counts as
+    an indication of need. A free-text lead is always left to the validator:
+    its first words may well be a name, and a request such as "asked for a
+    demo" is a need in words no pattern lists.
+
+    Returns:
+        Dict[str, Any]: ``clearly_invalid``, the ``missing`` checks
+            ("contact", "need"), the ``reason`` in the validator's wording
+            and the extracted ``fields``
+    """
+    fields = extract_fields(text)
+    missing: List[str] = []
+    if FIELD_PATTERN.search(text):
+        if not CONTACT_FIELDS & fields.keys():
+            missing.append("contact")
+        if not NEED_FIELDS & fields.keys() and not NEED_PATTERN.search(text):
+            missing.append("need")
+    return {
+        "clearly_invalid": bool(missing),
+        "missing": missing,
+        "reason": ", ".join(MISSING_MESSAGES[check] for check in missing),
+        "fields": fields,
+    }
+
+
+def format_fields(fields: Dict[str, Any]) -> str:
+    """The extracted fields as lines for an agent instruction."""
+    if not fields:
+        return "None found"
+    return "\n".join(f"- {field}: {value}" for field, value in fields.items())
@@ -0,0 +1,188 @@
+"""
+Local Lead Scoring
+
+This module scores leads without a model call. Four features, the same
+criteria LeadScorerAgent is asked about (need, authority, budget and
+timeline), are extracted with precompiled patterns and keyword lexicons as
+values between 0 and 1. A weighted logistic model then turns a whole matrix
+of leads into 1-10 scores at once with NumPy, so lead lists can be scored
+offline at thousands of leads per second. Scores close to a recommendation
+boundary (3/4 and 7/8) are flagged as borderline, for the model to decide.
+"""
+
+import json
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# --- Constants ---
+FEATURES = ("need", "authority", "budget", "timeline")
+DEFAULT_WEIGHTS = {"need": 2.5, "authority": 2.0, "budget": 2.0, "timeline": 1.5}
+DEFAULT_BIAS = -3.5
+# Score boundaries where the recommended action changes (nurture / qualify /
+# sell), and how close to one a score must be to count as borderline
+ACTION_BOUNDARIES = (3.5, 7.5)
+BORDERLINE_MARGIN = 0.35
+
+# Feature -> (pattern, value) pairs; the first pattern that matches wins
+FEATURE_LEXICONS: Dict[str, List[Tuple[re.Pattern, float]]] = {
+    "need": [
+        (re.compile(r"\b(?:just browsing|not sure|maybe|no need)\b", re.I), 0.2),
+        (
+            re.compile(
+                r"\b(?:urgent|unhappy|replace|pain|struggl\w*|automate|reduce|"
+                r"fraud|manual)\b",
+                re.I,
+            ),
+            1.0,
+        ),
+        (
+            re.compile(
+                r"\b(?:looking for|need|needs|evaluat\w*|interested in|want|wants)\b",
+                re.I,
+            ),
+            0.7,
+        ),
+    ],
+    "authority": [
+        (
+            re.compile(
+                r"\b(?:CEO|CTO|CFO|COO|CIO|chief|founder|owner|president|VP|"
+                r"vice president|head of|director)\b",
+                re.I,
+            ),
+            1.0,
+        ),
+        # "Lead" alone would match the "Lead Information:" header
+        (re.compile(r"\b(?:manager|team lead|tech lead|principal)\b", re.I), 0.6),
+        (re.compile(r"\b(?:engineer|analyst|specialist|consultant)\b", re.I), 0.3),
+        (re.compile(r"\b(?:intern|student|assistant)\b", re.I), 0.0),
+    ],
+    "budget": [
+        (re.compile(r"\b(?:no budget|budget unknown|limited budget)\b", re.I), 0.0),
+        (
+            re.compile(r"\$\s?\d|\b(?:budget (?:is )?approved|allocated)\b", re.I),
+            1.0,
+        ),
+        (re.compile(r"\bbudget\b", re.I), 0.5),
+    ],
+    "timeline": [
+        (re.compile(r"\b(?:no timeline|no rush|someday)\b", re.I), 0.0),
+        (
+            re.compile(
+                r"\b(?:asap|immediately|urgent|this (?:month|quarter)|"
+                r"(?:within|in) (?:the )?(?:next )?(?:\d+ )?(?:weeks?|months?|quarter)|"
+                r"next quarter|Q[1-4])\b",
+                re.I,
+            ),
+            1.0,
+        ),
+        (re.compile(r"\b(?:next year|later this year|\d+ months)\b", re.I), 0.4),
+    ],
+}
+FEATURE_PHRASES = {
+    "need": "a clear need",
+    "authority": "decision-making authority",
+    "budget": "a stated budget",
+    "timeline": "a near-term timeline",
+}
+
+
+def extract_features(text: str) -> List[float]:
+    """The need, authority, budget and timeline features of one lead (0-1)."""
+    values = []
+    for feature in FEATURES:
+        value = 0.0
+        for pattern, pattern_value in FEATURE_LEXICONS[feature]:
+            if pattern.search(text):
+                value = pattern_value
+                break
+        values.append(value)
+    return values
+
+
+def feature_matrix(texts: Sequence[str]) -> np.ndarray:
+    """Features of many leads as an (n, 4) matrix."""
+    return np.array([extract_features(text) for text in texts], dtype=np.float64)
+
+
+def justify(features: Sequence[float]) -> str:
+    """One-sentence justification from the features."""
+    strong = [
+        FEATURE_PHRASES[name] for name, value in zip(FEATURES, features) if value >= 0.7
+    ]
+    weak = [
+        FEATURE_PHRASES[name] for name, value in zip(FEATURES, features) if value < 0.3
+    ]
+    parts = []
+    if strong:
+        parts.append("Shows " + ", ".join(strong))
+    if weak:
+        parts.append(("but lacks " if strong else "Lacks ") + ", ".join(weak))
+    return (" ".join(parts) or "Moderate signals on every criterion") + "."
+
+
+class LeadScoringModel:
+    """
+    Weighted logistic model over the four lead features.
+
+    Args:
+        weights: Weight per feature (defaults to DEFAULT_WEIGHTS)
+        bias: Intercept of the logistic model
+        borderline_margin: Distance in score points from an action boundary
+            within which a score counts as borderline
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        bias: float = DEFAULT_BIAS,
+        borderline_margin: float = BORDERLINE_MARGIN,
+    ):
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.weights = np.array([weights[name] for name in FEATURES])
+        self.bias = bias
+        self.borderline_margin = borderline_margin
+
+    def __repr__(self) -> str:
+        weights = dict(zip(FEATURES, self.weights.tolist()))
+        return (
+            f"LeadScoringModel(weights={weights}, bias={self.bias}, "
+            f"borderline_margin={self.borderline_margin})"
+        )
+
+    @classmethod
+    def from_json(cls, path: str) -> "LeadScoringModel":
+        """Load ``{"weights": {...}, "bias": ..., "borderline_margin": ...}``."""
+        with open(path) as file:
+            return cls(**json.load(file))
+
+    def raw_scores(self, features: np.ndarray) -> np.ndarray:
+        """Unrounded 1-10 scores for an (n, 4) feature matrix."""
+        probabilities = 1.0 / (1.0 + np.exp(-(features @ self.weights + self.bias)))
+        return 1.0 + 9.0 * probabilities
+
+    def score(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score a batch of leads.
+
+        Args:
+            features: (n, 4) matrix from ``feature_matrix``
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Integer scores (1-10) and a mask of
+                the borderline ones
+        """
+        raw = self.raw_scores(features)
+        distance = np.min(
+            np.abs(raw[:, None] - np.array(ACTION_BOUNDARIES)[None, :]), axis=1
+        )
+        scores = np.clip(np.rint(raw), 1, 10).astype(np.int64)
+        return scores, distance < self.borderline_margin
+
+    def score_texts(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Features, scores and borderline flags for many lead texts."""
+        features = feature_matrix(texts)
+        scores, borderline = self.score(features)
+        return {"features": features, "scores": scores, "borderline": borderline}
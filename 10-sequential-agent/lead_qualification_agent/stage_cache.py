@@ -0,0 +1,238 @@
+"""
+Stage Result Cache
+
+This module stores what each stage of the pipeline wrote to state, in a
+local SQLite file, so qualifying the same lead again does not repeat the
+model calls. Entries are keyed by the stage, the hash of the
+whitespace-normalized lead text and a stage version. A stage's version
+hashes its model, instruction and output schema together with the versions
+of the stages before it, so editing the scorer's prompt invalidates the
+scorer and the recommender, but the validator's answers are still reused.
+Steps that are not cached, such as the company enricher, still take part in
+the chain: turning enrichment on, or pointing it at another company index,
+invalidates the stages after it.
+
+A stage can also be re-run on purpose with ``rerun_from``: it and every
+stage after it skip the lookup (and overwrite their entries), while the
+stages before it still come from the cache. The pre-validator and the
+company enricher are not cached; they take microseconds. After changing
+``lead_rules.py`` or ``scoring.py`` code, delete the cache file.
+
+Usage:
+    LEAD_STAGE_CACHE=stage_cache.db adk web
+    python -m lead_qualification_agent.stage_cache stage_cache.db
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+
+# --- Constants ---
+# Stage -> state keys it writes; the first one is the stage's answer
+STAGE_OUTPUTS = {
+    "LeadValidatorAgent": ("validation_status",),
+    "LeadScorerAgent": ("lead_score",),
+    "LocalLeadScorerAgent": ("lead_score", "local_score"),
+    "LeadAssessorAgent": ("lead_assessment", "validation_status", "lead_score"),
+    "ActionRecommenderAgent": ("action_recommendation",),
+}
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stage_results (
+    stage TEXT NOT NULL,
+    version TEXT NOT NULL,
+    lead_hash TEXT NOT NULL,
+    outputs TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (stage, version, lead_hash)
+) WITHOUT ROWID
+"""
+
+
+def lead_hash(text: str) -> str:
+    """Hash of the lead with runs of whitespace collapsed."""
+    return hashlib.sha1(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def describe_stage(agent: BaseAgent) -> str:
+    """Everything besides the lead that a stage's output depends on."""
+    parts = [type(agent).__name__, agent.name]
+    if isinstance(agent, LlmAgent):
+        parts += [str(agent.model), str(agent.instruction)]
+        if agent.output_schema:
+            parts.append(json.dumps(agent.output_schema.model_json_schema()))
+    scoring_model = getattr(agent, "scoring_model", None)
+    if scoring_model is not None:
+        parts.append(repr(scoring_model))
+    company_index = getattr(agent, "company_index", None)
+    if company_index is not None:
+        parts.append(company_index.version)
+    parts += [describe_stage(sub_agent) for sub_agent in agent.sub_agents]
+    return "\n".join(parts)
+
+
+class StageCache:
+    """
+    SQLite cache of stage outputs, with the callbacks that use it.
+
+    Args:
+        path: SQLite file (created if missing)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.versions: Dict[str, str] = {}
+        self.stages: List[str] = []
+        self.rerun: set = set()
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._lock = threading.Lock()
+        # One connection shared by every session; the lock serializes it
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(SCHEMA)
+
+    def attach(self, stages: Sequence[BaseAgent]) -> None:
+        """
+        Cache the given pipeline stages, in pipeline order.
+
+        Each stage's version includes the versions of the stages before it.
+        Steps without outputs in STAGE_OUTPUTS (the company enricher) are not
+        cached, but their description is part of the later stages' versions.
+        """
+        version = ""
+        for stage in stages:
+            version = hashlib.sha1(
+                (version + describe_stage(stage)).encode("utf-8")
+            ).hexdigest()[:12]
+            if stage.name not in STAGE_OUTPUTS:
+                continue
+            self.versions[stage.name] = version
+            self.stages.append(stage.name)
+            self._install_callbacks(stage)
+
+    def rerun_from(self, stage: str) -> None:
+        """Run this stage and every later one again; earlier ones stay cached."""
+        if stage not in self.stages:
+            raise ValueError(f"Unknown stage {stage!r}; cached stages: {self.stages}")
+        self.rerun = set(self.stages[self.stages.index(stage) :])
+
+    def get(self, stage: str, lead: str) -> Optional[Dict[str, Any]]:
+        """The cached outputs of a stage for a lead (counts a hit or a miss)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT outputs FROM stage_results "
+                "WHERE stage = ? AND version = ? AND lead_hash = ?",
+                (stage, self.versions[stage], lead_hash(lead)),
+            ).fetchone()
+            if row is None:
+                self.misses[stage] += 1
+                return None
+            self.hits[stage] += 1
+        return json.loads(row[0])
+
+    def put(self, stage: str, lead: str, outputs: Dict[str, Any]) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO stage_results VALUES (?, ?, ?, ?, ?)",
+                (
+                    stage,
+                    self.versions[stage],
+                    lead_hash(lead),
+                    json.dumps(outputs),
+                    time.time(),
+                ),
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            stage: {"hits": self.hits[stage], "misses": self.misses[stage]}
+            for stage in self.stages
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # --- Stage callbacks ---
+
+    def _install_callbacks(self, stage: BaseAgent) -> None:
+        """
+        Put the cache behind the stage's own callbacks.
+
+        The stage's before_agent callback runs first: when it skips the
+        stage (an invalid lead), the cache is neither read nor written. Its
+        after_agent callback also runs first, since it may write the
+        outputs (the assessor stores its assessment there).
+        """
+        own_before = stage.before_agent_callback
+        own_after = stage.after_agent_callback
+
+        def before_agent(callback_context):
+            if own_before is not None:
+                skipped = own_before(callback_context)
+                if skipped is not None:
+                    return skipped
+            return self.before_stage(callback_context)
+
+        def after_agent(callback_context):
+            result = own_after(callback_context) if own_after is not None else None
+            self.after_stage(callback_context)
+            return result
+
+        stage.before_agent_callback = before_agent
+        stage.after_agent_callback = after_agent
+
+    def before_stage(
+        self, callback_context: CallbackContext
+    ) -> Optional[types.Content]:
+        """Restore the stage's outputs from the cache instead of running it."""
+        stage = callback_context.agent_name
+        if stage in self.rerun:
+            return None
+        outputs = self.get(stage, _lead_text(callback_context))
+        if outputs is None:
+            return None
+        for key, value in outputs.items():
+            callback_context.state[key] = value
+        answer = outputs[STAGE_OUTPUTS[stage][0]]
+        if not isinstance(answer, str):
+            answer = json.dumps(answer)
+        return types.Content(role="model", parts=[types.Part(text=answer)])
+
+    def after_stage(self, callback_context: CallbackContext) -> None:
+        """Store the outputs of a stage that ran."""
+        stage = callback_context.agent_name
+        state = callback_context.state
+        keys = STAGE_OUTPUTS[stage]
+        # A stage that failed or was cut short leaves its outputs unset
+        if all(state.get(key) is not None for key in keys):
+            self.put(
+                stage,
+                _lead_text(callback_context),
+                {key: state.get(key) for key in keys},
+            )
+
+
+def _lead_text(callback_context: CallbackContext) -> str:
+    content = callback_context.user_content
+    if not content or not content.parts:
+        return ""
+    return "".join(part.text or "" for part in content.parts)
+
+
+if __name__ == "__main__":
+    db = sqlite3.connect(sys.argv[1])
+    for stage, version, entries in db.execute(
+        "SELECT stage, version, COUNT(*) FROM stage_results "
+        "GROUP BY stage, version ORDER BY stage"
+    ):
+        print(f"{stage:<24} {version}  {entries} leads")
@@ -1,3 +1,11 @@
 """Subagents for the lead qualification pipeline."""
 
-from . import recommender, scorer, validator
+from . import (
+    assessor,
+    enricher,
+    local_scorer,
+    prevalidator,
+    recommender,
+    scorer,
+    validator,
+)
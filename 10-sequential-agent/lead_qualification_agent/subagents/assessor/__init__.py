@@ -0,0 +1,3 @@
+"""Fused validation and scoring agent for lead qualification."""
+
+from .agent import LeadAssessment, lead_assessor_agent
@@ -0,0 +1,87 @@
+"""
+Lead Assessor Agent
+
+This agent validates and scores a lead in a single model call, replacing
+LeadValidatorAgent and LeadScorerAgent when LEAD_PIPELINE_MODE=fused. It
+returns structured output (validity, reason, score and justification), so
+nothing has to be parsed out of free text. The result is also written to
+``validation_status`` and ``lead_score`` in the format the two separate
+agents use, so the recommender and batch output work unchanged.
+"""
+
+from typing import Optional
+
+from google.adk.agents import LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+from pydantic import BaseModel, Field
+
+from ...callbacks import UNSCORED, skip_assessment_if_prevalidated
+
+# --- Constants ---
+GEMINI_MODEL = "gemini-2.0-flash"
+
+
+# --- Define Output Schema ---
+class LeadAssessment(BaseModel):
+    # Descriptions are sent with every call, so they are kept short
+    valid: bool = Field(description="Complete enough to qualify")
+    invalid_reason: str = Field(default="", description="Empty if valid")
+    score: int = Field(ge=0, le=10, description="1-10, or 0 if invalid")
+    justification: str = Field(description="One sentence; empty if invalid")
+
+
+def store_assessment(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Write the assessment as validation_status and lead_score."""
+    assessment = callback_context.state.get("lead_assessment")
+    if not assessment:
+        return None
+    if assessment["valid"]:
+        callback_context.state["validation_status"] = "valid"
+        callback_context.state["lead_score"] = (
+            f"{assessment['score']}: {assessment['justification']}"
+        )
+    else:
+        reason = assessment["invalid_reason"] or "incomplete lead information"
+        callback_context.state["validation_status"] = f"invalid: {reason}"
+        callback_context.state["lead_score"] = UNSCORED
+    return None
+
+
+# Create the assessor agent
+lead_assessor_agent = LlmAgent(
+    name="LeadAssessorAgent",
+    model=GEMINI_MODEL,
+    instruction="""You are a Lead Assessment AI.
+    
+    Examine the lead information provided by the user. In one answer, decide
+    whether it is complete enough for qualification and, if it is, score it.
+    
+    A complete (valid) lead should include:
+    - Contact information (name, email or phone)
+    - Some indication of interest or need
+    - Company or context information if applicable
+    
+    Score valid leads from 1-10 based on:
+    - Expressed need (urgency/clarity of problem)
+    - Decision-making authority
+    - Budget indicators
+    - Timeline indicators
+    
+    Fields extracted from the lead by a rule-based parser:
+    {lead_fields_summary?}
+    
+    Company profile from the company dataset (size and revenue indicate budget):
+    {company_profile?}
+    
+    Respond ONLY with JSON matching the schema.
+    """,
+    description="Validates and scores a lead in one call with structured output.",
+    output_schema=LeadAssessment,
+    output_key="lead_assessment",
+    # Structured output cannot be combined with agent transfers
+    disallow_transfer_to_parent=True,
+    disallow_transfer_to_peers=True,
+    before_agent_callback=skip_assessment_if_prevalidated,
+    after_agent_callback=store_assessment,
+)
@@ -0,0 +1,3 @@
+"""Company enrichment from a local, memory-mapped company index (no model call)."""
+
+from .agent import company_enricher_agent
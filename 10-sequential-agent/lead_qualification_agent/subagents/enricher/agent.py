@@ -0,0 +1,57 @@
+"""
+Company Enricher Agent
+
+This agent runs before the scorer and looks up the lead's company in a local
+company index (see ``enrichment.py``) by email domain, website or company
+name, without a model call. It writes the company's firmographics to
+``company_profile``, which the scorer's instruction includes. It is only
+part of the pipeline when LEAD_COMPANY_INDEX names an index directory.
+"""
+
+import os
+from typing import AsyncGenerator, Optional
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from ...enrichment import CompanyIndex, format_profile
+
+# --- Constants ---
+COMPANY_INDEX_DIR = os.getenv("LEAD_COMPANY_INDEX")
+
+
+class CompanyEnricherAgent(BaseAgent):
+    """Adds the lead's company profile from the local company index."""
+
+    company_index: CompanyIndex
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        # Invalid leads are not scored, so they need no profile
+        if (state.get("validation_status") or "").strip().lower().startswith("invalid"):
+            return
+        company = self.company_index.lookup(state.get("lead_fields") or {})
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(
+                state_delta={
+                    "company": company,
+                    "company_profile": format_profile(company),
+                }
+            ),
+        )
+
+
+# Create the enricher agent if a company index is configured
+company_enricher_agent: Optional[CompanyEnricherAgent] = None
+if COMPANY_INDEX_DIR:
+    company_enricher_agent = CompanyEnricherAgent(
+        name="CompanyEnricherAgent",
+        company_index=CompanyIndex(COMPANY_INDEX_DIR),
+        description="Adds firmographics from a local company index, without a model call.",
+    )
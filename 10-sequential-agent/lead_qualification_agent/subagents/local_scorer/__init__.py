@@ -0,0 +1,3 @@
+"""Local feature-based lead scorer with a model fallback for borderline leads."""
+
+from .agent import local_lead_scorer_agent
@@ -0,0 +1,86 @@
+"""
+Local Lead Scorer Agent
+
+This agent scores a lead with the local logistic model in ``scoring.py``
+instead of a model call, and writes ``lead_score`` in the same
+'score: justification' format as LeadScorerAgent. Only when the score lands
+close to a boundary where the recommended action changes does it hand the
+lead to BorderlineScorerAgent, which asks the model as before. The weights
+can be replaced with a JSON file named by LEAD_SCORING_WEIGHTS.
+"""
+
+import os
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from ...callbacks import skip_scoring_if_invalid
+from ...scoring import FEATURES, LeadScoringModel, feature_matrix, justify
+from ..scorer import SCORER_INSTRUCTION
+
+# --- Constants ---
+GEMINI_MODEL = "gemini-2.0-flash"
+
+
+class LocalLeadScorerAgent(BaseAgent):
+    """Scores locally and defers borderline leads to the model."""
+
+    scoring_model: LeadScoringModel
+    borderline_scorer: LlmAgent
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        lead = ctx.user_content.parts[0].text if ctx.user_content else ""
+        features = feature_matrix([lead or ""])
+        scores, borderline = self.scoring_model.score(features)
+        score, is_borderline = int(scores[0]), bool(borderline[0])
+        state_delta = {
+            "local_score": {
+                "score": score,
+                "borderline": is_borderline,
+                "features": dict(zip(FEATURES, features[0].tolist())),
+            }
+        }
+        if not is_borderline:
+            state_delta["lead_score"] = f"{score}: {justify(features[0])}"
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta=state_delta),
+        )
+        if is_borderline:
+            async for event in self.borderline_scorer.run_async(ctx):
+                yield event
+
+
+# Model scorer for the leads the local model cannot place confidently
+borderline_scorer_agent = LlmAgent(
+    name="BorderlineScorerAgent",
+    model=GEMINI_MODEL,
+    instruction=SCORER_INSTRUCTION + """
+    A local scoring model put this lead close to a score boundary:
+    {local_score?}
+    """,
+    description="Scores leads the local model rated as borderline.",
+    output_key="lead_score",
+)
+
+scoring_weights = os.getenv("LEAD_SCORING_WEIGHTS")
+
+# Create the local scorer agent
+local_lead_scorer_agent = LocalLeadScorerAgent(
+    name="LocalLeadScorerAgent",
+    scoring_model=(
+        LeadScoringModel.from_json(scoring_weights)
+        if scoring_weights
+        else LeadScoringModel()
+    ),
+    borderline_scorer=borderline_scorer_agent,
+    sub_agents=[borderline_scorer_agent],
+    description="Scores leads with a local feature model; borderline leads go to the model.",
+    before_agent_callback=skip_scoring_if_invalid,
+)
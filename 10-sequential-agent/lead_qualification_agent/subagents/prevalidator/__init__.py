@@ -0,0 +1,3 @@
+"""Rule-based lead pre-validator (no model call)."""
+
+from .agent import lead_prevalidator_agent
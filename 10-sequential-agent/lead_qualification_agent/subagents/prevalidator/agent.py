@@ -0,0 +1,50 @@
+"""
+Lead Pre-Validator Agent
+
+This agent runs before LeadValidatorAgent and checks the lead with
+precompiled patterns instead of a model call. It stores the fields it
+extracts (email, phone, name, company, ...) for the scorer. A lead with no
+contact details or no stated need at all is marked invalid right away, and
+the later stages skip it.
+"""
+
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from ...lead_rules import format_fields, prevalidate
+
+
+class LeadPreValidatorAgent(BaseAgent):
+    """Extracts lead fields and marks clearly invalid leads."""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        lead = ctx.user_content.parts[0].text if ctx.user_content else ""
+        result = prevalidate(lead or "")
+        state_delta = {
+            "prevalidation": {
+                "clearly_invalid": result["clearly_invalid"],
+                "missing": result["missing"],
+            },
+            "lead_fields": result["fields"],
+            "lead_fields_summary": format_fields(result["fields"]),
+        }
+        if result["clearly_invalid"]:
+            state_delta["validation_status"] = f"invalid: {result['reason']}"
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta=state_delta),
+        )
+
+
+# Create the pre-validator agent
+lead_prevalidator_agent = LeadPreValidatorAgent(
+    name="LeadPreValidatorAgent",
+    description="Extracts lead fields and rejects leads without contact details or need, without a model call.",
+)
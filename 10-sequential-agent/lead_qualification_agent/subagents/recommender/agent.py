@@ -2,11 +2,15 @@
 Action Recommender Agent
 
 This agent is responsible for recommending appropriate next actions
-based on the lead validation and scoring results.
+based on the lead validation and scoring results. For invalid leads the
+recommendation to gather the missing information is written without a model
+call.
 """
 
 from google.adk.agents import LlmAgent
 
+from ...callbacks import skip_recommendation_if_invalid
+
 # --- Constants ---
 GEMINI_MODEL = "gemini-2.0-flash"
 
@@ -33,4 +37,5 @@ action_recommender_agent = LlmAgent(
     """,
     description="Recommends next actions based on lead qualification.",
     output_key="action_recommendation",
+    before_agent_callback=skip_recommendation_if_invalid,
 )
@@ -1,3 +1,3 @@
 """Scorer agent for lead qualification."""
 
-from .agent import lead_scorer_agent
+from .agent import SCORER_INSTRUCTION, lead_scorer_agent
@@ -2,19 +2,17 @@
 Lead Scorer Agent
 
 This agent is responsible for scoring a lead's qualification level
-based on various criteria.
+based on various criteria. Invalid leads are not scored.
 """
 
 from google.adk.agents import LlmAgent
 
+from ...callbacks import skip_scoring_if_invalid
+
 # --- Constants ---
 GEMINI_MODEL = "gemini-2.0-flash"
 
-# Create the scorer agent
-lead_scorer_agent = LlmAgent(
-    name="LeadScorerAgent",
-    model=GEMINI_MODEL,
-    instruction="""You are a Lead Scoring AI.
+SCORER_INSTRUCTION = """You are a Lead Scoring AI.
     
     Analyze the lead information and assign a qualification score from 1-10 based on:
     - Expressed need (urgency/clarity of problem)
@@ -22,11 +20,24 @@ lead_scorer_agent = LlmAgent(
     - Budget indicators
     - Timeline indicators
     
+    Fields extracted from the lead by a rule-based parser:
+    {lead_fields_summary?}
+    
+    Company profile from the company dataset (size and revenue indicate budget):
+    {company_profile?}
+    
     Output ONLY a numeric score and ONE sentence justification.
     
     Example output: '8: Decision maker with clear budget and immediate need'
     Example output: '3: Vague interest with no timeline or budget mentioned'
-    """,
+    """
+
+# Create the scorer agent
+lead_scorer_agent = LlmAgent(
+    name="LeadScorerAgent",
+    model=GEMINI_MODEL,
+    instruction=SCORER_INSTRUCTION,
     description="Scores qualified leads on a scale of 1-10.",
     output_key="lead_score",
+    before_agent_callback=skip_scoring_if_invalid,
 )
@@ -2,11 +2,14 @@
 Lead Validator Agent
 
 This agent is responsible for validating if a lead has all the necessary information
-for qualification.
+for qualification. Leads the rule-based pre-validator already rejected are
+skipped without a model call.
 """
 
 from google.adk.agents import LlmAgent
 
+from ...callbacks import skip_validation_if_prevalidated
+
 # --- Constants ---
 GEMINI_MODEL = "gemini-2.0-flash"
 
@@ -29,4 +32,5 @@ lead_validator_agent = LlmAgent(
     """,
     description="Validates lead information for completeness.",
     output_key="validation_status",
+    before_agent_callback=skip_validation_if_prevalidated,
 )
@@ -0,0 +1,107 @@
+"""
+Alert Rules Benchmark
+
+Times the bundled alert rules over thousands of series (partitions, disks
+and interfaces of a large host or a whole fleet):
+
+- one batch evaluation of every rule, with every series healthy and with
+  random load (where building the fired alert records dominates)
+- one monitoring run as the collectors do it: each tool evaluates the metric
+  it recorded, then the alert evaluator reads every fired alert with
+  ``active()``, next to the previous pattern of one full evaluation per tool
+
+Usage (from 11-parallel-agent/):
+    python -m benchmarks.alert_rules --partitions 4000 --disks 500 --nics 500
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+from system_monitor_agent.alerts import AlertEngine, load_rules
+
+
+def timed(function, rounds: int, before=None) -> list:
+    """Microseconds per call; ``before`` runs untimed ahead of each call."""
+    timings = []
+    for _ in range(rounds):
+        if before:
+            before()
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1e6)
+    return sorted(timings)
+
+
+def summary(label: str, timings: list) -> str:
+    return (
+        f"{label:<40} mean {statistics.mean(timings):>7,.0f} us, "
+        f"p50 {timings[len(timings) // 2]:>7,.0f} us, "
+        f"p99 {timings[int(len(timings) * 0.99)]:>7,.0f} us"
+    )
+
+
+def main(args):
+    rng = np.random.default_rng(0)
+    engine = AlertEngine(load_rules())
+    series = {
+        "cpu_percent": {"": 0.0},
+        "memory_percent": {"": 0.0},
+        "swap_percent": {"": 0.0},
+        "disk_percent": {f"/mnt/vol{i}": 0.0 for i in range(args.partitions)},
+        "disk_busy_percent": {f"sd{i}": 0.0 for i in range(args.disks)},
+        "net_errors_per_sec": {f"eth{i}": 0.0 for i in range(args.nics)},
+    }
+    series_count = sum(len(labels) for labels in series.values())
+
+    def record(high: float):
+        for metric, labels in series.items():
+            values = rng.uniform(0, high, len(labels))
+            if metric == "net_errors_per_sec":
+                values = (values > 99).astype(float)
+            engine.record_many(metric, dict(zip(labels, values)))
+
+    # The first evaluation compiles the (rule, series) pairs; report it apart
+    record(100)
+    compile_us = timed(engine.evaluate, 1)[0]
+    fired = len(engine.evaluate())
+    print(f"series: {series_count}, rules: {len(engine.rules)}")
+    print(f"first evaluation (includes compiling pairs): {compile_us:,.0f} us\n")
+
+    healthy = timed(engine.evaluate, args.rounds, before=lambda: record(50))
+    print(summary("evaluate(), all healthy", healthy))
+    loaded = timed(engine.evaluate, args.rounds, before=lambda: record(100))
+    print(summary(f"evaluate(), {fired} alerts fired", loaded))
+
+    def run_per_tool():
+        for metric in series:
+            engine.evaluate(metrics=[metric])
+        engine.active()
+
+    def run_full_per_tool():
+        for metric in series:
+            engine.evaluate()
+        engine.evaluate()
+
+    print(
+        summary(
+            "run: per-metric evaluate + active",
+            timed(run_per_tool, args.rounds, before=lambda: record(100)),
+        )
+    )
+    print(
+        summary(
+            "run: full evaluate per tool (old)",
+            timed(run_full_per_tool, args.rounds, before=lambda: record(100)),
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark alert rule evaluation")
+    parser.add_argument("--partitions", type=int, default=4000)
+    parser.add_argument("--disks", type=int, default=500)
+    parser.add_argument("--nics", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=200)
+    main(parser.parse_args())
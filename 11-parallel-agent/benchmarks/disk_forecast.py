@@ -0,0 +1,87 @@
+"""
+Disk Forecast Benchmark
+
+Fills a disk usage history for a synthetic host with hundreds of partitions
+and days of 5-minute samples (each partition growing linearly at its own
+rate, plus noise), then times recording and one forecast over all
+partitions, reports the history's memory, and compares the forecast
+time-to-full with the true one.
+
+Usage (from 11-parallel-agent/):
+    python -m benchmarks.disk_forecast --partitions 500 --days 7
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+from system_monitor_agent.forecast import GB, SECONDS_PER_DAY, DiskUsageHistory
+
+# --- Constants ---
+SAMPLE_INTERVAL_SEC = 300.0
+
+
+def main(args):
+    rng = np.random.default_rng(0)
+    mountpoints = [f"/mnt/vol{i}" for i in range(args.partitions)]
+    total = rng.integers(100, 4000, args.partitions) * GB
+    start_used = total * rng.uniform(0.1, 0.6, args.partitions)
+    # A third of the partitions are static, the rest grow up to 2% per day
+    growth_per_sec = (
+        total * rng.uniform(0, 0.02, args.partitions) / SECONDS_PER_DAY
+    ) * (rng.random(args.partitions) > 1 / 3)
+    noise = total * 0.0005
+
+    history = DiskUsageHistory()
+    rounds = int(args.days * SECONDS_PER_DAY / SAMPLE_INTERVAL_SEC)
+    start = time.time() - rounds * SAMPLE_INTERVAL_SEC
+    totals = dict(zip(mountpoints, total))
+    record_timings = []
+    for round_index in range(rounds):
+        elapsed = round_index * SAMPLE_INTERVAL_SEC
+        used = start_used + growth_per_sec * elapsed
+        used = used + rng.normal(0, 1, args.partitions) * noise
+        began = time.perf_counter()
+        history.record(dict(zip(mountpoints, used)), totals, start + elapsed)
+        record_timings.append((time.perf_counter() - began) * 1000)
+
+    now = start + (rounds - 1) * SAMPLE_INTERVAL_SEC
+    forecast_timings = []
+    for _ in range(args.repeats):
+        began = time.perf_counter()
+        forecasts = history.forecast(now=now)
+        forecast_timings.append((time.perf_counter() - began) * 1000)
+
+    # Compare against the true time-to-full of the growing partitions
+    final_used = start_used + growth_per_sec * (now - start)
+    errors = []
+    for index, forecast in enumerate(forecasts):
+        if growth_per_sec[index] > 0 and forecast["days_to_full"] is not None:
+            true_days = (total[index] - final_used[index]) / growth_per_sec[index]
+            true_days /= SECONDS_PER_DAY
+            errors.append(abs(forecast["days_to_full"] - true_days) / true_days)
+
+    print(
+        f"{args.partitions} partitions, {rounds} samples each "
+        f"({args.days:g} days at {SAMPLE_INTERVAL_SEC:g}s), "
+        f"history capacity {history.capacity} rows"
+    )
+    print(f"history memory: {history.nbytes / 1024**2:.1f} MB")
+    print(f"record one round: {statistics.mean(record_timings):.3f} ms mean")
+    print(
+        f"forecast all partitions: {statistics.median(forecast_timings):.1f} ms "
+        f"median over {args.repeats} runs"
+    )
+    print(
+        f"time-to-full error vs truth: median {statistics.median(errors) * 100:.1f}%, "
+        f"max {max(errors) * 100:.1f}% ({len(errors)} growing partitions)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark disk forecasting")
+    parser.add_argument("--partitions", type=int, default=500)
+    parser.add_argument("--days", type=float, default=7)
+    parser.add_argument("--repeats", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,116 @@
+"""
+Exporter Load Benchmark
+
+Starts the metrics exporter in its own process and scrapes it as fast as
+possible with an increasing number of concurrent keep-alive scrapers. Reports
+scrapes per second and scrape latency per level, plus how many collector
+samples the exporter took meanwhile: that number follows the sample
+interval, not the scrape rate.
+
+The scrapers share one Python process, so at high concurrency the client can
+be the bottleneck rather than the exporter.
+
+Usage (from 11-parallel-agent/):
+    python -m benchmarks.exporter_load --concurrency 1 8 32 128 --duration 5
+"""
+
+import argparse
+import asyncio
+import re
+import socket
+import subprocess
+import sys
+import time
+
+from system_monitor_agent.fleet import ConnectionPool
+
+# --- Constants ---
+SAMPLES_PATTERN = re.compile(rb"^system_monitor_samples_total (\S+)$", re.M)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_until_ready(pool: ConnectionPool, url: str, timeout: float = 60.0):
+    """Poll the exporter until it answers (importing ADK takes a while)."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return await pool.get(url, timeout=1.0)
+        except (OSError, asyncio.TimeoutError):
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.25)
+
+
+def samples_taken(body: bytes) -> int:
+    return int(float(SAMPLES_PATTERN.search(body).group(1)))
+
+
+async def scrape_for(pool: ConnectionPool, url: str, deadline: float) -> list:
+    """Scrape back to back until the deadline; return latencies in ms."""
+    latencies = []
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await pool.get(url, timeout=5.0)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def run_benchmark(args):
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/metrics"
+    exporter = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "system_monitor_agent.exporter",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--interval",
+            str(args.interval),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        pool = ConnectionPool(max_per_origin=max(args.concurrency))
+        body = await wait_until_ready(pool, url)
+        print(f"Exporter body: {len(body)} bytes, sampled every {args.interval:g}s")
+        print(
+            f"{'scrapers':>8} {'scrapes':>8} {'scrapes/s':>10} {'p50_ms':>8}"
+            f" {'p99_ms':>8} {'samples':>8}"
+        )
+        for concurrency in args.concurrency:
+            samples_before = samples_taken(await pool.get(url, timeout=5.0))
+            deadline = time.perf_counter() + args.duration
+            results = await asyncio.gather(
+                *(scrape_for(pool, url, deadline) for _ in range(concurrency))
+            )
+            samples_after = samples_taken(await pool.get(url, timeout=5.0))
+
+            latencies = sorted(latency for result in results for latency in result)
+            print(
+                f"{concurrency:>8} {len(latencies):>8}"
+                f" {len(latencies) / args.duration:>10.0f}"
+                f" {latencies[len(latencies) // 2]:>8.2f}"
+                f" {latencies[int(len(latencies) * 0.99)]:>8.2f}"
+                f" {samples_after - samples_before:>8}"
+            )
+        pool.close()
+    finally:
+        exporter.terminate()
+        exporter.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the metrics exporter")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--interval", type=float, default=5.0)
+    asyncio.run(run_benchmark(parser.parse_args()))
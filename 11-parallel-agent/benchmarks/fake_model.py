@@ -0,0 +1,44 @@
+"""
+Fake Model for Benchmarks
+
+A stand-in for Gemini that answers instantly (or after a fixed latency)
+without network access or an API key, so benchmarks measure the agent
+pipeline itself. Every agent with tools calls its first tool once and then
+answers with a short text; agents without tools answer with text directly.
+"""
+
+import asyncio
+
+from google.adk.agents import BaseAgent
+from google.adk.models import BaseLlm, LlmResponse
+from google.genai import types
+
+
+class FakeModel(BaseLlm):
+    """Scripted model: call the agent's first tool, then reply with text."""
+
+    latency_sec: float = 0.0
+    calls: int = 0
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        self.calls += 1
+        if self.latency_sec:
+            await asyncio.sleep(self.latency_sec)
+        last = llm_request.contents[-1] if llm_request.contents else None
+        answered = last is not None and any(
+            part.function_response for part in last.parts or []
+        )
+        tools = list(llm_request.tools_dict)
+        if tools and not answered:
+            part = types.Part(function_call=types.FunctionCall(name=tools[0], args={}))
+        else:
+            part = types.Part(text="Report section.")
+        yield LlmResponse(content=types.Content(role="model", parts=[part]))
+
+
+def use_fake_model(agent: BaseAgent, model: FakeModel) -> None:
+    """Point an agent and all of its sub-agents at the fake model."""
+    if hasattr(agent, "model"):
+        agent.model = model
+    for sub_agent in agent.sub_agents:
+        use_fake_model(sub_agent, model)
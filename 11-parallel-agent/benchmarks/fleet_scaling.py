@@ -0,0 +1,65 @@
+"""
+Fleet Scaling Benchmark
+
+Polls a simulated fleet of increasing size with the fleet collector and
+reports wall time, throughput and per-host latency. A share of the hosts hang
+or fail so partial-failure handling is exercised at every size.
+
+Usage (from 11-parallel-agent/):
+    python -m benchmarks.fleet_scaling --sizes 10 50 100 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from system_monitor_agent.fleet import ConnectionPool, collect_fleet
+from system_monitor_agent.fleet.simulator import start_simulated_fleet
+
+
+async def run_benchmark(args):
+    print(
+        f"{'hosts':>6} {'wall_ms':>9} {'hosts/s':>9} {'p50_ms':>8} {'p99_ms':>8}"
+        f" {'ok':>5} {'failed':>6} {'conns':>6} {'serial_est_ms':>14}"
+    )
+    for size in args.sizes:
+        server, endpoints = await start_simulated_fleet(
+            size,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            hung_fraction=args.hung_fraction,
+            error_fraction=args.error_fraction,
+        )
+        pool = ConnectionPool(max_per_origin=args.max_connections)
+        async with server:
+            # Warm-up round opens the keep-alive connections
+            await collect_fleet(endpoints, timeout=args.timeout, pool=pool)
+            opened_before = pool.connections_opened
+
+            start = time.perf_counter()
+            summary = await collect_fleet(endpoints, timeout=args.timeout, pool=pool)
+            wall_ms = (time.perf_counter() - start) * 1000
+            pool.close()
+
+        stats = summary["stats"]
+        serial_estimate = size * (args.latency_ms + args.jitter_ms / 2)
+        print(
+            f"{size:>6} {wall_ms:>9.1f} {size / wall_ms * 1000:>9.0f}"
+            f" {stats['p50_poll_latency_ms'] or 0:>8.1f}"
+            f" {stats['p99_poll_latency_ms'] or 0:>8.1f}"
+            f" {stats['reachable_hosts']:>5} {stats['unreachable_hosts']:>6}"
+            f" {pool.connections_opened - opened_before:>6}"
+            f" {serial_estimate:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fleet collection")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 250, 500])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--hung-fraction", type=float, default=0.02)
+    parser.add_argument("--error-fraction", type=float, default=0.02)
+    parser.add_argument("--timeout", type=float, default=0.5)
+    parser.add_argument("--max-connections", type=int, default=64)
+    asyncio.run(run_benchmark(parser.parse_args()))
@@ -0,0 +1,69 @@
+"""
+Parallel Gatherer Benchmark
+
+Runs the system_info_gatherer ParallelAgent with the instrumentation from
+system_monitor_agent.instrumentation, then prints when each branch ran, how
+long it spent in its collector, how long the event loop was blocked, and the
+effective parallelism factor: the time the branches spent in their
+collectors over the gatherer's wall time. The gatherers are collector agents
+(no model calls) that run their collector in a worker thread.
+
+Usage (from 11-parallel-agent/):
+    python -m benchmarks.parallel_gatherer --rounds 3
+    python -m benchmarks.parallel_gatherer --trace gatherer.json
+"""
+
+import argparse
+import asyncio
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from system_monitor_agent.agent import system_info_gatherer
+from system_monitor_agent.instrumentation import ParallelTrace, instrument
+
+APP_NAME = "parallel_gatherer_benchmark"
+USER_ID = "benchmark"
+
+
+async def main(args):
+    # The trace is reset before and written after every round, so the file
+    # holds the last one
+    trace = ParallelTrace(args.trace)
+    instrument(system_info_gatherer, trace)
+
+    sessions = InMemorySessionService()
+    runner = Runner(
+        agent=system_info_gatherer, app_name=APP_NAME, session_service=sessions
+    )
+    factors = []
+    for round_number in range(1, args.rounds + 1):
+        session = sessions.create_session(app_name=APP_NAME, user_id=USER_ID)
+        async for _ in runner.run_async(
+            user_id=USER_ID,
+            session_id=session.id,
+            new_message=types.Content(
+                role="user", parts=[types.Part(text="Gather system information")]
+            ),
+        ):
+            pass
+        summary = trace.summary()
+        factors.append(
+            summary["parallel_agents"][system_info_gatherer.name]["parallelism_factor"]
+        )
+        # The first round includes priming the rate trackers
+        print(f"--- round {round_number}{' (cold)' if round_number == 1 else ''}")
+        print(trace.format_summary())
+
+    print(f"\nparallelism factor per round {factors}")
+    if args.trace:
+        print(f"Chrome trace of the last round written to {args.trace}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark how concurrently the gatherer branches run"
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--trace", help="Write the last round as Chrome trace JSON")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,53 @@
+"""
+Report Rendering Benchmark
+
+Collects this host's metrics once, then times the template-rendered health
+report: the healthy path (no firing alerts, so no model call at all) and the
+path with the alerts currently firing on this host, whose anomalies would be
+handed to the AnomalyExplainer.
+
+Usage (from 11-parallel-agent/):
+    python -m benchmarks.report_rendering --rounds 2000
+"""
+
+import argparse
+import time
+
+from monitor import collect_all
+from system_monitor_agent.alerts import ALERT_ENGINE
+from system_monitor_agent.report import find_anomalies, render_report
+
+
+def time_render(results: dict, alerts: list, rounds: int) -> list:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        render_report(results, alerts)
+        find_anomalies(results, alerts)
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)
+
+
+def main(rounds: int):
+    print("Collecting metrics (takes about a second)...")
+    results = collect_all()
+    alerts = ALERT_ENGINE.active()
+    anomalies = find_anomalies(results, alerts)
+
+    print(f"{'path':<22} {'p50_ms':>8} {'p99_ms':>8} {'chars':>7} {'model calls':>12}")
+    for name, path_alerts in (("healthy (no alerts)", []), ("this host", alerts)):
+        timings = time_render(results, path_alerts, rounds)
+        report = render_report(results, path_alerts)
+        model_calls = 1 if find_anomalies(results, path_alerts) else 0
+        print(
+            f"{name:<22} {timings[len(timings) // 2]:>8.3f}"
+            f" {timings[int(len(timings) * 0.99)]:>8.3f}"
+            f" {len(report):>7} {model_calls:>12}"
+        )
+    print(f"\nAnomalies on this host: {len(anomalies)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark report rendering")
+    parser.add_argument("--rounds", type=int, default=2000)
+    main(parser.parse_args().rounds)
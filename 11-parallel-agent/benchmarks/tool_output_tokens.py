@@ -0,0 +1,170 @@
+"""
+Tool Output Token Benchmark
+
+Measures how many tokens the cpu/memory/disk tool results add to a report on
+a simulated 128-core host, comparing the previous pre-formatted string output
+with the current numeric output.
+
+psutil is patched with a synthetic 128-core machine so the numbers do not
+depend on the host running the benchmark. Tokens are estimated offline
+(Gemini tokenizes every digit separately); pass --gemini to count them with
+the Gemini API instead (needs GOOGLE_API_KEY).
+
+Usage (from 11-parallel-agent/):
+    python -m benchmarks.tool_output_tokens
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+from types import SimpleNamespace
+from unittest import mock
+
+from system_monitor_agent.subagents.cpu_info_agent.tools import get_cpu_info
+from system_monitor_agent.subagents.disk_info_agent.tools import get_disk_info
+from system_monitor_agent.subagents.memory_info_agent.tools import get_memory_info
+
+# --- Constants ---
+LOGICAL_CORES = 128
+GB = 1024**3
+TOKEN_PATTERN = re.compile(r"\d|[A-Za-z]+|[^\sA-Za-z\d]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough offline token count: one per digit/symbol, ~4 letters per token."""
+    count = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group()
+        count += math.ceil(len(token) / 4) if token.isalpha() else 1
+    return count
+
+
+def simulated_host():
+    """Build psutil patches for a synthetic 128-core host with six partitions."""
+    rng = random.Random(0)
+    per_core = [rng.uniform(0, 100) for _ in range(LOGICAL_CORES)]
+    partitions = [
+        SimpleNamespace(device=f"/dev/nvme0n1p{i}", mountpoint=mount, fstype="ext4")
+        for i, mount in enumerate(
+            ["/", "/boot", "/home", "/var", "/var/lib/docker", "/data"], start=1
+        )
+    ]
+
+    def disk_usage(mountpoint):
+        total = rng.randint(50, 4000) * GB
+        used = int(total * rng.uniform(0.1, 0.95))
+        return SimpleNamespace(
+            total=total,
+            used=used,
+            free=total - used,
+            percent=round(used / total * 100, 1),
+        )
+
+    def cpu_percent(interval=None, percpu=False):
+        return per_core if percpu else sum(per_core) / len(per_core)
+
+    patches = [
+        mock.patch("psutil.cpu_percent", cpu_percent),
+        mock.patch(
+            "psutil.cpu_count",
+            lambda logical=True: LOGICAL_CORES if logical else LOGICAL_CORES // 2,
+        ),
+        mock.patch(
+            "psutil.virtual_memory",
+            lambda: SimpleNamespace(
+                total=512 * GB, available=201 * GB, used=311 * GB, percent=60.7
+            ),
+        ),
+        mock.patch(
+            "psutil.swap_memory",
+            lambda: SimpleNamespace(total=16 * GB, used=2 * GB, percent=12.5),
+        ),
+        mock.patch("psutil.disk_partitions", lambda: partitions),
+        mock.patch("psutil.disk_usage", disk_usage),
+    ]
+    return patches, per_core
+
+
+def legacy_result(cpu, per_core, memory, disk):
+    """Re-create the string-formatted result sections the tools used to return."""
+    cpu_result = {
+        "physical_cores": cpu["physical_cores"],
+        "logical_cores": cpu["logical_cores"],
+        "cpu_usage_per_core": [
+            f"Core {i}: {value:.1f}%" for i, value in enumerate(per_core)
+        ],
+        "avg_cpu_usage": f"{cpu['avg_usage_percent']:.1f}%",
+    }
+    memory_result = {
+        "total_memory": f"{memory['total_gb']:.2f} GB",
+        "available_memory": f"{memory['available_gb']:.2f} GB",
+        "used_memory": f"{memory['used_gb']:.2f} GB",
+        "memory_percentage": f"{memory['memory_percent']:.1f}%",
+        "swap_total": f"{memory['swap_total_gb']:.2f} GB",
+        "swap_used": f"{memory['swap_used_gb']:.2f} GB",
+        "swap_percentage": f"{memory['swap_percent']:.1f}%",
+    }
+    disk_result = {
+        "partitions": [
+            {
+                "device": partition["device"],
+                "mountpoint": partition["mountpoint"],
+                "filesystem_type": partition["filesystem_type"],
+                "total_size": f"{partition['total_gb']:.2f} GB",
+                "used": f"{partition['used_gb']:.2f} GB",
+                "free": f"{partition['free_gb']:.2f} GB",
+                "percentage": f"{partition['percent']:.1f}%",
+            }
+            for partition in disk["partitions"]
+        ]
+    }
+    return cpu_result, memory_result, disk_result
+
+
+def main(use_gemini: bool):
+    patches, per_core = simulated_host()
+    for patch in patches:
+        patch.start()
+    try:
+        reports = {"numeric": [get_cpu_info(), get_memory_info(), get_disk_info()]}
+    finally:
+        for patch in patches:
+            patch.stop()
+
+    cpu, memory, disk = (output["result"] for output in reports["numeric"])
+    legacy = legacy_result(cpu, per_core, memory, disk)
+    reports["legacy strings"] = [
+        {**tool_output, "result": result}
+        for tool_output, result in zip(reports["numeric"], legacy)
+    ]
+
+    if use_gemini:
+        from google import genai
+
+        client = genai.Client()
+
+        def count(text):
+            return client.models.count_tokens(
+                model="gemini-2.0-flash", contents=text
+            ).total_tokens
+
+    else:
+        count = estimate_tokens
+
+    print(f"Tool output tokens per report on a {LOGICAL_CORES}-core host")
+    print(f"{'format':<16} {'cpu':>6} {'memory':>7} {'disk':>6} {'total':>7}")
+    for name in ("legacy strings", "numeric"):
+        counts = [count(json.dumps(output)) for output in reports[name]]
+        print(
+            f"{name:<16} {counts[0]:>6} {counts[1]:>7} {counts[2]:>6} {sum(counts):>7}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure tool output tokens")
+    parser.add_argument(
+        "--gemini", action="store_true", help="Count tokens with the Gemini API"
+    )
+    main(parser.parse_args().gemini)
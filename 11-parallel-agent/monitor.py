@@ -0,0 +1,167 @@
+"""
+Continuous System Monitor
+
+Runs the collector tools at a fixed interval and only writes a report when
+the state changed materially since the last one (an alert started firing or
+cleared, or a metric drifted a lot). Reports are rendered from a template; the AnomalyExplainer is
+only called when the report lists anomalies. Quiet periods cost nothing; the
+number of skipped reports is printed as it runs.
+
+Usage:
+    python monitor.py --interval 60
+    python monitor.py --interval 5 --iterations 12
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+
+from dotenv import load_dotenv
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from system_monitor_agent.alerts import ALERT_ENGINE
+from system_monitor_agent.change_gate import ChangeGate
+from system_monitor_agent.report import find_anomalies, render_report
+from system_monitor_agent.subagents.cpu_info_agent.tools import get_cpu_info
+from system_monitor_agent.subagents.disk_forecast_agent.tools import (
+    get_disk_forecast,
+)
+from system_monitor_agent.subagents.disk_info_agent.tools import get_disk_info
+from system_monitor_agent.subagents.disk_io_agent.tools import get_disk_io_info
+from system_monitor_agent.subagents.memory_info_agent.tools import get_memory_info
+from system_monitor_agent.subagents.network_info_agent.tools import (
+    get_network_info,
+)
+from system_monitor_agent.subagents.synthesizer_agent import anomaly_explainer
+
+load_dotenv("system_monitor_agent/.env")
+
+# ===== PART 1: Collectors and the metrics the change gate watches =====
+APP_NAME = "System Monitor"
+USER_ID = "continuous_monitor"
+
+# Result key (as used by the report template) -> collector tool; the disk
+# forecast runs right after the disk collector has recorded its sample
+COLLECTORS = {
+    "cpu_info": get_cpu_info,
+    "memory_info": get_memory_info,
+    "disk_info": get_disk_info,
+    "disk_forecast": get_disk_forecast,
+    "net_info": get_network_info,
+    "io_info": get_disk_io_info,
+}
+
+# Headline metric whose drift the gate watches -> (state key, stats field)
+GATED_METRICS = {
+    "cpu_percent": ("cpu_info", "avg_usage_percentage"),
+    "memory_percent": ("memory_info", "memory_usage_percentage"),
+    "swap_percent": ("memory_info", "swap_usage_percentage"),
+    "disk_percent": ("disk_info", "overall_usage_percent"),
+}
+
+
+def collect_all() -> dict:
+    """Run every collector tool once."""
+    return {key: collector() for key, collector in COLLECTORS.items()}
+
+
+def headline_metrics(results: dict) -> dict:
+    """Pick the numbers the change gate watches out of the tool results."""
+    metrics = {}
+    for name, (key, field) in GATED_METRICS.items():
+        value = results[key].get("stats", {}).get(field)
+        if value is not None:
+            metrics[name] = value
+    return metrics
+
+
+# ===== PART 2: Report on demand =====
+async def build_report(runner, results: dict, reasons: list) -> str:
+    """Render the report; call the explainer only if it lists anomalies."""
+    alerts = ALERT_ENGINE.active()
+    report = render_report(results, alerts)
+    anomalies = find_anomalies(results, alerts)
+    if not anomalies:
+        return report
+
+    session = runner.session_service.create_session(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+        state={"health_report": report, "anomalies": json.dumps(anomalies)},
+    )
+    message = types.Content(
+        role="user",
+        parts=[
+            types.Part(
+                text="Explain the anomalies in the health report. Changes since "
+                f"the last report: {'; '.join(reasons)}"
+            )
+        ],
+    )
+
+    explanation = ""
+    async for event in runner.run_async(
+        user_id=USER_ID, session_id=session.id, new_message=message
+    ):
+        if event.is_final_response() and event.content and event.content.parts:
+            explanation = event.content.parts[0].text
+    runner.session_service.delete_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+    )
+    return f"{report}\n{explanation}\n"
+
+
+# ===== PART 3: Fixed-interval monitoring loop =====
+async def main_async(interval: float, iterations: int):
+    runner = Runner(
+        agent=anomaly_explainer,
+        app_name=APP_NAME,
+        session_service=InMemorySessionService(),
+    )
+    gate = ChangeGate()
+
+    print(f"Monitoring every {interval:g}s (Ctrl+C to stop)\n")
+    next_tick = time.monotonic()
+    try:
+        while not iterations or gate.evaluations < iterations:
+            # The collectors block (cpu sampling sleeps), so keep them off the loop
+            results = await asyncio.to_thread(collect_all)
+            # The collectors evaluated the alert rules on what they recorded
+            reasons = gate.check(headline_metrics(results), ALERT_ENGINE.active())
+            timestamp = datetime.now().strftime("%H:%M:%S")
+
+            if reasons:
+                print(f"[{timestamp}] Reporting: {'; '.join(reasons)}")
+                print(await build_report(runner, results, reasons))
+            else:
+                print(
+                    f"[{timestamp}] No material change, report skipped "
+                    f"({gate.skipped} of {gate.evaluations} skipped so far)"
+                )
+
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+    finally:
+        print(
+            f"\nCollections: {gate.evaluations}, reports: {gate.reports}, "
+            f"skipped: {gate.skipped}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Continuous system monitor")
+    parser.add_argument("--interval", type=float, default=60.0)
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=0,
+        help="Stop after N collections (0 = run forever)",
+    )
+    args = parser.parse_args()
+    try:
+        asyncio.run(main_async(args.interval, args.iterations))
+    except KeyboardInterrupt:
+        pass
@@ -3,24 +3,86 @@ System Monitor Root Agent
 
 This module defines the root agent for the system monitoring application.
 It uses a parallel agent for system information gathering and a sequential
-pipeline for the overall flow.
+pipeline for the overall flow. Inside a container with resource limits, the
+cgroup-aware collectors replace the host-wide CPU, memory and disk I/O
+agents. When SYSTEM_MONITOR_FLEET_HOSTS is set, the root agent monitors those
+remote hosts instead of the local machine. Setting SYSTEM_MONITOR_TRACE
+records a timeline of each run to that file.
 """
 
+import os
+
 from google.adk.agents import ParallelAgent, SequentialAgent
 
+from .cgroups import current_cgroup, use_cgroup_collectors
+from .instrumentation import ParallelTrace, instrument
+from .subagents.alert_evaluator_agent import alert_evaluator_agent
+from .subagents.container_info_agent import (
+    container_cpu_info_agent,
+    container_io_agent,
+    container_memory_info_agent,
+)
 from .subagents.cpu_info_agent import cpu_info_agent
+from .subagents.disk_forecast_agent import disk_forecast_agent
 from .subagents.disk_info_agent import disk_info_agent
+from .subagents.disk_io_agent import disk_io_agent
+from .subagents.fleet_info_agent import fleet_info_agent
+from .subagents.health_report_agent import health_report_agent
 from .subagents.memory_info_agent import memory_info_agent
-from .subagents.synthesizer_agent import system_report_synthesizer
+from .subagents.network_info_agent import network_info_agent
+from .subagents.synthesizer_agent import fleet_report_synthesizer
 
 # --- 1. Create Parallel Agent to gather information concurrently ---
+# psutil reports host-wide CPU, memory and I/O; inside a limited container
+# read the container's own usage from its cgroup instead (disk space and the
+# network namespace are already container-scoped)
+if use_cgroup_collectors(current_cgroup()):
+    gatherer_agents = [
+        container_cpu_info_agent,
+        container_memory_info_agent,
+        disk_info_agent,
+        network_info_agent,
+        container_io_agent,
+    ]
+else:
+    gatherer_agents = [
+        cpu_info_agent,
+        memory_info_agent,
+        disk_info_agent,
+        network_info_agent,
+        disk_io_agent,
+    ]
+
 system_info_gatherer = ParallelAgent(
     name="system_info_gatherer",
-    sub_agents=[cpu_info_agent, memory_info_agent, disk_info_agent],
+    sub_agents=gatherer_agents,
 )
 
-# --- 2. Create Sequential Pipeline to gather info in parallel, then synthesize ---
-root_agent = SequentialAgent(
+# --- 2. Create Sequential Pipeline to gather info in parallel, evaluate the
+# alert rules and forecast disk usage over everything collected, then render
+# the report (the model is only called to explain anomalies) ---
+local_monitor_agent = SequentialAgent(
     name="system_monitor_agent",
-    sub_agents=[system_info_gatherer, system_report_synthesizer],
+    sub_agents=[
+        system_info_gatherer,
+        alert_evaluator_agent,
+        disk_forecast_agent,
+        health_report_agent,
+    ],
+)
+
+# --- 3. Fleet mode: poll many host endpoints concurrently, then synthesize ---
+fleet_monitor_agent = SequentialAgent(
+    name="fleet_monitor_agent",
+    sub_agents=[fleet_info_agent, fleet_report_synthesizer],
+)
+
+root_agent = (
+    fleet_monitor_agent
+    if os.getenv("SYSTEM_MONITOR_FLEET_HOSTS")
+    else local_monitor_agent
 )
+
+# --- 4. Optional timeline of the run (see instrumentation.py) ---
+if os.getenv("SYSTEM_MONITOR_TRACE"):
+    instrument(root_agent, ParallelTrace(os.getenv("SYSTEM_MONITOR_TRACE")))
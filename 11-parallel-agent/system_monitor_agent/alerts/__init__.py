@@ -0,0 +1,11 @@
+"""
+Alert Rules
+
+This package evaluates the declarative alert rules in rules.json against the
+samples recorded by the collector tools. ALERT_ENGINE is shared by every
+collector in the process.
+"""
+
+from .engine import AlertEngine, load_rules
+
+ALERT_ENGINE = AlertEngine.from_file()
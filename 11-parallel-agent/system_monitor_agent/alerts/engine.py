@@ -0,0 +1,338 @@
+"""
+Alert Rules Engine
+
+This module compiles declarative alert rules (metric, comparator, threshold,
+duration window, severity) into NumPy arrays once, and evaluates every rule
+against the latest sample of every matching series in one batch.
+
+Each collector tool evaluates only the metrics it just recorded, so in one
+run every (rule, series) pair is evaluated once. The fired state is kept, and
+``active`` reads it (for the alert evaluator and the report) without
+evaluating again.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# --- Constants ---
+DEFAULT_RULES_PATH = Path(__file__).with_name("rules.json")
+# Samples older than this no longer fire alerts (e.g. a partition unmounted)
+DEFAULT_STALE_AFTER_SEC = 600.0
+COMPARATORS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+REQUIRED_RULE_FIELDS = ("name", "metric", "comparator", "threshold", "severity")
+
+
+def load_rules(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Load and validate alert rules from a JSON file.
+
+    Args:
+        path: Rules file; defaults to SYSTEM_MONITOR_ALERT_RULES or the
+            bundled rules.json
+
+    Returns:
+        List[Dict[str, Any]]: The validated rules
+
+    Raises:
+        ValueError: If a rule is missing fields or uses an unknown comparator
+    """
+    path = path or os.getenv("SYSTEM_MONITOR_ALERT_RULES") or DEFAULT_RULES_PATH
+    rules = json.loads(Path(path).read_text())
+    for rule in rules:
+        missing = [field for field in REQUIRED_RULE_FIELDS if field not in rule]
+        if missing:
+            raise ValueError(
+                f"Alert rule {rule.get('name', '<unnamed>')} is missing: "
+                f"{', '.join(missing)}"
+            )
+        if rule["comparator"] not in COMPARATORS:
+            raise ValueError(
+                f"Alert rule {rule['name']} has unknown comparator "
+                f"{rule['comparator']!r}; expected one of {', '.join(COMPARATORS)}"
+            )
+    return rules
+
+
+class AlertEngine:
+    """
+    Stores the latest sample per series and evaluates compiled alert rules.
+
+    A series is a metric plus an optional label (a mountpoint, a disk, an
+    interface). Every rule applies to every series of its metric. Each
+    (rule, series) pair is one slot in flat NumPy arrays, grouped by metric
+    and comparator, so evaluation is a handful of vectorized operations per
+    group no matter how many series there are, and one metric can be
+    evaluated without touching the others.
+
+    A rule with ``duration_sec`` only fires once its condition has held for
+    that long, across evaluations (like a Prometheus ``for:`` clause).
+    """
+
+    def __init__(
+        self,
+        rules: List[Dict[str, Any]],
+        stale_after_sec: float = DEFAULT_STALE_AFTER_SEC,
+    ):
+        self.rules = rules
+        self.stale_after_sec = stale_after_sec
+        self._lock = threading.Lock()
+
+        # Series storage, grown geometrically as new series appear
+        self._series_index: Dict[Tuple[str, str], int] = {}
+        self._series_keys: List[Tuple[str, str]] = []
+        self._latest = np.full(64, np.nan)
+        self._latest_time = np.full(64, np.nan)
+
+        # Compiled (rule, series) pairs, rebuilt only when series are added
+        self._pairs_stale = True
+        self._pair_rule = np.empty(0, dtype=np.int32)
+        self._pair_series = np.empty(0, dtype=np.int32)
+        self._pair_threshold = np.empty(0)
+        self._pair_duration = np.empty(0)
+        self._pending_since = np.empty(0)
+        self._fired = np.empty(0, dtype=bool)
+        # The parts of an alert record that only depend on the rule
+        self._rule_fields = [
+            (r["name"], r["severity"], r["metric"], r["comparator"], r["threshold"])
+            for r in rules
+        ]
+        # (metric, comparator ufunc, slice of the pair arrays) per group
+        self._groups: List[Tuple[str, Any, slice]] = []
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> "AlertEngine":
+        """Create an engine from a rules file (see ``load_rules``)."""
+        return cls(load_rules(path))
+
+    def record(
+        self,
+        metric: str,
+        value: float,
+        label: str = "",
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Store the latest sample for one series."""
+        self.record_many(metric, {label: value}, timestamp)
+
+    def record_many(
+        self,
+        metric: str,
+        values: Dict[str, float],
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Store the latest sample for several series of one metric.
+
+        Args:
+            metric: Metric name, as used by the rules
+            values: Value per series label ("" for unlabelled metrics)
+            timestamp: Sample time (defaults to now)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            for label, value in values.items():
+                row = self._series_index.get((metric, label))
+                if row is None:
+                    row = self._add_series(metric, label)
+                self._latest[row] = value
+                self._latest_time[row] = timestamp
+
+    def _add_series(self, metric: str, label: str) -> int:
+        row = len(self._series_keys)
+        if row == len(self._latest):
+            self._latest = np.concatenate([self._latest, np.full(row, np.nan)])
+            self._latest_time = np.concatenate(
+                [self._latest_time, np.full(row, np.nan)]
+            )
+        self._series_index[(metric, label)] = row
+        self._series_keys.append((metric, label))
+        self._pairs_stale = True
+        return row
+
+    def _compile_pairs(self) -> None:
+        """Expand rules x matching series into flat arrays grouped by metric."""
+        rows_by_metric: Dict[str, List[int]] = {}
+        for row, (metric, _) in enumerate(self._series_keys):
+            rows_by_metric.setdefault(metric, []).append(row)
+
+        # Duration windows and fired state carry over to the new layout
+        previous = {
+            (rule, series): (pending, fired)
+            for rule, series, pending, fired in zip(
+                self._pair_rule.tolist(),
+                self._pair_series.tolist(),
+                self._pending_since.tolist(),
+                self._fired.tolist(),
+            )
+        }
+
+        pairs = []
+        self._groups = []
+        for metric in dict.fromkeys(rule["metric"] for rule in self.rules):
+            rows = rows_by_metric.get(metric, [])
+            for comparator, ufunc in COMPARATORS.items():
+                start = len(pairs)
+                for rule_index, rule in enumerate(self.rules):
+                    if rule["metric"] == metric and rule["comparator"] == comparator:
+                        pairs.extend((rule_index, row) for row in rows)
+                if len(pairs) > start:
+                    self._groups.append((metric, ufunc, slice(start, len(pairs))))
+
+        self._pair_rule = np.array([rule for rule, _ in pairs], dtype=np.int32)
+        self._pair_series = np.array([row for _, row in pairs], dtype=np.int32)
+        self._pair_threshold = np.array(
+            [float(self.rules[rule]["threshold"]) for rule, _ in pairs]
+        )
+        self._pair_duration = np.array(
+            [float(self.rules[rule].get("duration_sec", 0)) for rule, _ in pairs]
+        )
+        carried = [previous.get(pair, (np.nan, False)) for pair in pairs]
+        self._pending_since = np.array([p for p, _ in carried], dtype=float)
+        self._fired = np.array([f for _, f in carried], dtype=bool)
+        self._pairs_stale = False
+
+    def _selected_spans(
+        self, metrics: Optional[Iterable[str]]
+    ) -> List[Tuple[slice, List[Tuple[Any, slice]]]]:
+        """
+        Contiguous stretches of the pair arrays to evaluate.
+
+        Returns:
+            List[Tuple[slice, List[Tuple[Any, slice]]]]: Per stretch, its slice
+                and the (comparator ufunc, slice relative to the stretch) of
+                each group in it; all metrics form one stretch
+        """
+        if self._pairs_stale:
+            self._compile_pairs()
+        wanted = None if metrics is None else set(metrics)
+        spans: List[Tuple[int, int, List[Tuple[Any, slice]]]] = []
+        for metric, ufunc, group in self._groups:
+            if wanted is not None and metric not in wanted:
+                continue
+            if spans and spans[-1][1] == group.start:
+                start, _, groups = spans[-1]
+                spans[-1] = (start, group.stop, groups)
+            else:
+                start, groups = group.start, []
+                spans.append((start, group.stop, groups))
+            groups.append((ufunc, slice(group.start - start, group.stop - start)))
+        return [(slice(start, stop), groups) for start, stop, groups in spans]
+
+    def evaluate(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        now: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate the rules of some or all metrics and return the fired alerts.
+
+        Args:
+            metrics: Only evaluate (and return alerts for) these metrics; the
+                duration windows and fired state of other metrics are left
+                as they are
+            now: Evaluation time (defaults to now)
+
+        Returns:
+            List[Dict[str, Any]]: One record per firing (rule, series) pair
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            fired_pairs = []
+            for span, groups in self._selected_spans(metrics):
+                rows = self._pair_series[span]
+                values = self._latest[rows]
+                sample_times = self._latest_time[rows]
+                condition = np.empty(len(rows), dtype=bool)
+                thresholds = self._pair_threshold[span]
+                for ufunc, group in groups:
+                    ufunc(values[group], thresholds[group], out=condition[group])
+                condition &= now - sample_times <= self.stale_after_sec
+
+                pending = self._pending_since[span]
+                pending = np.where(
+                    condition,
+                    np.where(np.isnan(pending), sample_times, pending),
+                    np.nan,
+                )
+                self._pending_since[span] = pending
+                with np.errstate(invalid="ignore"):
+                    fired = condition & (now - pending >= self._pair_duration[span])
+                self._fired[span] = fired
+                fired_pairs.append(np.flatnonzero(fired) + span.start)
+            return self._alert_records(fired_pairs, now)
+
+    def active(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        now: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        The alerts that fired when their metrics were last evaluated.
+
+        Nothing is evaluated: pairs keep the state of their last ``evaluate``
+        call, except that alerts on samples gone stale are left out.
+
+        Args:
+            metrics: Only return alerts for these metrics
+            now: Current time, for staleness (defaults to now)
+
+        Returns:
+            List[Dict[str, Any]]: One record per firing (rule, series) pair
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            fired_pairs = []
+            for span, _ in self._selected_spans(metrics):
+                sample_times = self._latest_time[self._pair_series[span]]
+                firing = self._fired[span] & (
+                    now - sample_times <= self.stale_after_sec
+                )
+                fired_pairs.append(np.flatnonzero(firing) + span.start)
+            return self._alert_records(fired_pairs, now)
+
+    def _alert_records(
+        self, fired_pairs: List[np.ndarray], now: float
+    ) -> List[Dict[str, Any]]:
+        """Build the alert dictionaries of the given (fired) pairs."""
+        if not fired_pairs:
+            return []
+        pairs = np.concatenate(fired_pairs)
+        # Plain Python values for the fired pairs only, rounded in NumPy and
+        # converted in one go each; the per-pair loop just assembles dicts
+        rows = self._pair_series[pairs]
+        labels = [self._series_keys[row][1] or None for row in rows.tolist()]
+        fields = [self._rule_fields[rule] for rule in self._pair_rule[pairs].tolist()]
+        fired_values = np.round(self._latest[rows], 2).tolist()
+        active_for = np.round(now - self._pending_since[pairs], 1).tolist()
+        return [
+            {
+                "rule": name,
+                "severity": severity,
+                "metric": metric,
+                "series": label,
+                "value": value,
+                "comparator": comparator,
+                "threshold": threshold,
+                "active_for_sec": seconds,
+            }
+            for (
+                name,
+                severity,
+                metric,
+                comparator,
+                threshold,
+            ), label, value, seconds in zip(fields, labels, fired_values, active_for)
+        ]
@@ -0,0 +1,325 @@
+"""
+cgroup Resource Readers
+
+This module reads CPU, memory and I/O accounting for the current process's
+cgroup directly from the cgroup filesystem (v1 or v2). Inside a container
+these are the numbers that matter: psutil reports host-wide usage, and a
+container at its memory limit can look idle next to a large host.
+
+Each accounting file is opened once and re-read with ``os.pread``, so a
+repeated sample costs one system call per file and no path lookups. The
+process's cgroup is detected once (``current_cgroup``) and shared, so its
+files are only open once per process.
+"""
+
+import functools
+import os
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# --- Constants ---
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+PROC_CGROUP = Path("/proc/self/cgroup")
+READ_CHUNK_BYTES = 64 * 1024
+# cgroup v1 reports "no limit" as a page-aligned LONG_MAX
+UNLIMITED_THRESHOLD = 2**62
+CFS_DEFAULT_PERIOD_USEC = 100_000
+V1_CONTROLLERS = ("cpu", "cpuacct", "memory", "blkio")
+
+CpuCounters = namedtuple(
+    "CpuCounters", ["usage_usec", "nr_periods", "nr_throttled", "throttled_usec"]
+)
+IoCounters = namedtuple(
+    "IoCounters", ["read_bytes", "write_bytes", "read_count", "write_count"]
+)
+
+
+class CgroupFile:
+    """
+    An accounting file kept open and re-read from offset 0 on demand.
+
+    The descriptor is released by ``close``, on leaving a ``with`` block, or
+    when the object is garbage collected.
+    """
+
+    _fd: Optional[int] = None
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd = os.open(path, os.O_RDONLY)
+
+    def __enter__(self) -> "CgroupFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def read(self) -> str:
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(self._fd, READ_CHUNK_BYTES, offset)
+            chunks.append(chunk)
+            if len(chunk) < READ_CHUNK_BYTES:
+                return b"".join(chunks).decode()
+            offset += len(chunk)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _parse_flat_keyed(text: str) -> Dict[str, int]:
+    """Parse "key value" lines (cpu.stat, memory.stat)."""
+    values = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(" ")
+        if value.strip().lstrip("-").isdigit():
+            values[key] = int(value)
+    return values
+
+
+def _parse_limit(text: str) -> Optional[int]:
+    """Parse a byte limit; None when unlimited ("max" or v1's huge value)."""
+    text = text.strip()
+    if text == "max" or int(text) >= UNLIMITED_THRESHOLD:
+        return None
+    return int(text)
+
+
+_device_names: Dict[str, str] = {}
+
+
+def device_name(major_minor: str) -> str:
+    """Map a "major:minor" block device number to its kernel name (cached)."""
+    if major_minor not in _device_names:
+        name = major_minor
+        try:
+            uevent = Path(f"/sys/dev/block/{major_minor}/uevent").read_text()
+            for line in uevent.splitlines():
+                if line.startswith("DEVNAME="):
+                    name = line.split("=", 1)[1]
+        except OSError:
+            pass
+        _device_names[major_minor] = name
+    return _device_names[major_minor]
+
+
+class Cgroup:
+    """
+    Accounting reader for one cgroup.
+
+    Args:
+        version: 1 or 2
+        directories: Directory per controller (v1) or the single cgroup
+            directory under the "" key (v2)
+    """
+
+    def __init__(self, version: int, directories: Dict[str, Path]):
+        self.version = version
+        self.directories = directories
+        self._files: Dict[Tuple[str, str], Optional[CgroupFile]] = {}
+
+    def _read(self, controller: str, name: str) -> Optional[str]:
+        """Read an accounting file, or None if this cgroup does not have it."""
+        key = (controller, name)
+        if key not in self._files:
+            directory = self.directories.get("" if self.version == 2 else controller)
+            try:
+                self._files[key] = CgroupFile(directory / name) if directory else None
+            except OSError:
+                # Missing controller or file; remember that and stop trying
+                self._files[key] = None
+        cgroup_file = self._files[key]
+        return cgroup_file.read() if cgroup_file else None
+
+    def close(self) -> None:
+        """Close every accounting file opened so far."""
+        for cgroup_file in self._files.values():
+            if cgroup_file is not None:
+                cgroup_file.close()
+        self._files = {}
+
+    def __enter__(self) -> "Cgroup":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def cpu_counters(self) -> CpuCounters:
+        """CPU time used and CFS throttling counters, in microseconds."""
+        stat = _parse_flat_keyed(self._read("cpu", "cpu.stat") or "")
+        if self.version == 2:
+            return CpuCounters(
+                stat.get("usage_usec", 0),
+                stat.get("nr_periods", 0),
+                stat.get("nr_throttled", 0),
+                stat.get("throttled_usec", 0),
+            )
+        usage_ns = int(self._read("cpuacct", "cpuacct.usage") or 0)
+        return CpuCounters(
+            usage_ns // 1000,
+            stat.get("nr_periods", 0),
+            stat.get("nr_throttled", 0),
+            stat.get("throttled_time", 0) // 1000,
+        )
+
+    def cpu_limit_cores(self) -> Optional[float]:
+        """CPU quota in cores, or None when the cgroup has no quota."""
+        if self.version == 2:
+            # "max 100000" (no quota) or "<quota> <period>" in microseconds
+            fields = (self._read("cpu", "cpu.max") or "max").split()
+            if fields[0] == "max":
+                return None
+            period = int(fields[1]) if len(fields) > 1 else CFS_DEFAULT_PERIOD_USEC
+            return int(fields[0]) / period
+        quota = self._read("cpu", "cpu.cfs_quota_us")
+        period = self._read("cpu", "cpu.cfs_period_us")
+        if not quota or not period or int(quota) <= 0:
+            return None
+        return int(quota) / int(period)
+
+    def memory_bytes(self) -> Dict[str, Optional[int]]:
+        """
+        Memory usage and limits in bytes.
+
+        ``working_set`` is usage minus inactive page cache, which the kernel
+        can reclaim before the limit is hit (what the OOM killer and
+        ``kubectl top`` go by).
+        """
+        if self.version == 2:
+            usage = int(self._read("memory", "memory.current") or 0)
+            limit = _parse_limit(self._read("memory", "memory.max") or "max")
+            stat = _parse_flat_keyed(self._read("memory", "memory.stat") or "")
+            inactive_file = stat.get("inactive_file", 0)
+            swap_usage = int(self._read("memory", "memory.swap.current") or 0)
+            swap_limit = _parse_limit(self._read("memory", "memory.swap.max") or "max")
+        else:
+            usage = int(self._read("memory", "memory.usage_in_bytes") or 0)
+            limit = _parse_limit(self._read("memory", "memory.limit_in_bytes") or "max")
+            stat = _parse_flat_keyed(self._read("memory", "memory.stat") or "")
+            inactive_file = stat.get("total_inactive_file", 0)
+            # memsw counts memory plus swap; absent without swap accounting
+            memsw_usage = self._read("memory", "memory.memsw.usage_in_bytes")
+            memsw_limit = self._read("memory", "memory.memsw.limit_in_bytes")
+            swap_usage = max(int(memsw_usage) - usage, 0) if memsw_usage else 0
+            swap_limit = _parse_limit(memsw_limit) if memsw_limit else None
+            if swap_limit is not None and limit is not None:
+                swap_limit = max(swap_limit - limit, 0)
+        return {
+            "usage": usage,
+            "working_set": max(usage - inactive_file, 0),
+            "limit": limit,
+            "swap_usage": swap_usage,
+            "swap_limit": swap_limit,
+        }
+
+    def io_counters(self) -> Dict[str, IoCounters]:
+        """Cumulative I/O bytes and operations per block device."""
+        counters = {}
+        if self.version == 2:
+            for line in (self._read("io", "io.stat") or "").splitlines():
+                major_minor, *fields = line.split()
+                values = dict(field.split("=", 1) for field in fields if "=" in field)
+                counters[device_name(major_minor)] = IoCounters(
+                    int(values.get("rbytes", 0)),
+                    int(values.get("wbytes", 0)),
+                    int(values.get("rios", 0)),
+                    int(values.get("wios", 0)),
+                )
+            return counters
+
+        totals: Dict[str, Dict[str, int]] = {}
+        for name, suffix in (
+            ("blkio.throttle.io_service_bytes", "bytes"),
+            ("blkio.throttle.io_serviced", "count"),
+        ):
+            for line in (self._read("blkio", name) or "").splitlines():
+                parts = line.split()
+                # Lines are "8:0 Read 1234"; the last line is a "Total" row
+                if len(parts) != 3 or parts[1] not in ("Read", "Write"):
+                    continue
+                device = totals.setdefault(parts[0], {})
+                device[f"{parts[1].lower()}_{suffix}"] = int(parts[2])
+        for major_minor, values in totals.items():
+            counters[device_name(major_minor)] = IoCounters(
+                values.get("read_bytes", 0),
+                values.get("write_bytes", 0),
+                values.get("read_count", 0),
+                values.get("write_count", 0),
+            )
+        return counters
+
+    def has_limits(self) -> bool:
+        """Whether a CPU quota or memory limit is set on this cgroup."""
+        return (
+            self.cpu_limit_cores() is not None
+            or self.memory_bytes()["limit"] is not None
+        )
+
+
+def detect_cgroup(
+    root: Path = CGROUP_ROOT, proc_cgroup: Path = PROC_CGROUP
+) -> Optional[Cgroup]:
+    """
+    Locate the current process's cgroup.
+
+    Containers usually mount their own cgroup at the root of the cgroup
+    filesystem; otherwise the path from /proc/self/cgroup is used.
+
+    Returns:
+        Optional[Cgroup]: The reader, or None when no cgroup filesystem is
+        mounted (e.g. not running on Linux)
+    """
+    try:
+        memberships = proc_cgroup.read_text().splitlines()
+    except OSError:
+        return None
+    paths = {}
+    for line in memberships:
+        _, controllers, path = line.split(":", 2)
+        for controller in controllers.split(","):
+            paths[controller] = path.lstrip("/")
+
+    if (root / "cgroup.controllers").exists():
+        directory = root / paths.get("", "")
+        return Cgroup(2, {"": directory if directory.is_dir() else root})
+
+    directories = {}
+    for controller in V1_CONTROLLERS:
+        mount = root / controller
+        if not mount.is_dir():
+            continue
+        directory = mount / paths.get(controller, "")
+        directories[controller] = directory if directory.is_dir() else mount
+    return Cgroup(1, directories) if directories else None
+
+
+@functools.lru_cache(maxsize=None)
+def current_cgroup() -> Optional[Cgroup]:
+    """The current process's cgroup, detected on first use and then shared."""
+    return detect_cgroup()
+
+
+def use_cgroup_collectors(cgroup: Optional[Cgroup]) -> bool:
+    """
+    Decide whether the gatherer should use the cgroup collectors.
+
+    SYSTEM_MONITOR_COLLECTORS selects "cgroup", "host" or "auto" (default).
+    In auto mode the cgroup collectors are used when the cgroup has a CPU
+    quota or memory limit, i.e. when host-wide numbers would mislead.
+    """
+    mode = os.getenv("SYSTEM_MONITOR_COLLECTORS", "auto").lower()
+    if cgroup is None or mode == "host":
+        return False
+    if mode == "cgroup":
+        return True
+    try:
+        return cgroup.has_limits()
+    except (OSError, ValueError):
+        return False
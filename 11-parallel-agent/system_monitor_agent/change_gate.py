@@ -0,0 +1,111 @@
+"""
+Change Gate
+
+This module decides whether a new set of metrics and alerts is different
+enough from the last reported one to be worth a synthesizer (model) call.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# --- Constants ---
+# Change (in percentage points) of a headline metric since the last report
+# that is material even when no alert starts or stops firing
+GATE_DRIFT = {
+    "cpu_percent": 15,
+    "memory_percent": 10,
+    "swap_percent": 10,
+    "disk_percent": 5,
+}
+# An alert only counts as cleared once it has been absent from this many
+# checks in a row, so an alert flickering around its threshold does not
+# cause a report on every tick
+CLEAR_AFTER_CHECKS = 3
+
+
+def alert_key(alert: Dict[str, Any]) -> Tuple[str, str]:
+    """The (rule, series) an alert record fires for."""
+    return alert["rule"], alert["series"] or ""
+
+
+def describe_alert(rule: str, series: str) -> str:
+    """An alert's rule name, with its series if it has one."""
+    return f"{rule} on {series}" if series else rule
+
+
+class ChangeGate:
+    """
+    Tracks the last reported state and gates synthesis on material change.
+
+    A report is due when an alert starts firing, when a reported alert has
+    cleared, when a headline metric drifted by at least its ``drift`` since
+    the last report, or when nothing has been reported yet. Alerts are
+    compared as (rule, series) pairs, so a second partition filling up is a
+    change even while the first one is still alerting.
+
+    Args:
+        drift: Drift allowance per headline metric (defaults to GATE_DRIFT)
+        clear_after: Checks in a row an alert must be absent to count as
+            cleared
+    """
+
+    def __init__(
+        self,
+        drift: Optional[Dict[str, float]] = None,
+        clear_after: int = CLEAR_AFTER_CHECKS,
+    ):
+        self.drift = drift or GATE_DRIFT
+        self.clear_after = clear_after
+        self.reported: Optional[Dict[str, float]] = None
+        # Alerts considered firing -> checks in a row they have been absent
+        self.alerting: Dict[Tuple[str, str], int] = {}
+        self.evaluations = 0
+        self.reports = 0
+
+    @property
+    def skipped(self) -> int:
+        """Number of evaluations that did not lead to a report."""
+        return self.evaluations - self.reports
+
+    def check(
+        self, metrics: Dict[str, float], alerts: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Compare with the last report and record a report if one is due.
+
+        Args:
+            metrics: Current value per headline metric name
+            alerts: The firing alerts, as returned by ``AlertEngine.active``
+
+        Returns:
+            List[str]: Reasons to synthesize a report; empty means skip
+        """
+        self.evaluations += 1
+        reasons = [] if self.reported is not None else ["first report"]
+
+        firing = {alert_key(alert): alert for alert in alerts}
+        for key, alert in firing.items():
+            if key not in self.alerting:
+                reasons.append(
+                    f"{describe_alert(*key)} fired "
+                    f"({alert['metric']} {alert['value']:g})"
+                )
+            self.alerting[key] = 0
+        for key in [key for key in self.alerting if key not in firing]:
+            self.alerting[key] += 1
+            if self.alerting[key] >= self.clear_after:
+                del self.alerting[key]
+                reasons.append(f"{describe_alert(*key)} cleared")
+
+        if self.reported is not None:
+            for name, drift in self.drift.items():
+                value = metrics.get(name)
+                if value is None or name not in self.reported:
+                    continue
+                change = value - self.reported[name]
+                if abs(change) >= drift:
+                    reasons.append(f"{name} drifted by {change:+.1f} points")
+
+        if reasons:
+            self.reported = dict(metrics)
+            self.reports += 1
+        return reasons
@@ -0,0 +1,40 @@
+"""
+Collector Agent
+
+This module provides the agent type of the information gatherers. A
+CollectorAgent calls one collector tool directly, without a model call, and
+stores the tool's result dictionary in session state under its output key.
+The HealthReport agent renders the report from those results, so writing a
+text section per collector (and the model call that took) is not needed.
+"""
+
+import asyncio
+from typing import Any, AsyncGenerator, Callable, Dict
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+
+class CollectorAgent(BaseAgent):
+    """
+    Runs one collector tool and writes its result to ``output_key``.
+
+    The collectors block (the CPU collector samples for a second), so the
+    tool runs in a worker thread; the branches of a ParallelAgent made of
+    collector agents therefore overlap instead of waiting for each other.
+    """
+
+    collector: Callable[[], Dict[str, Any]]
+    output_key: str
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        result = await asyncio.to_thread(self.collector)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={self.output_key: result}),
+        )
@@ -0,0 +1,100 @@
+"""
+Counter Rate Helpers
+
+This module turns monotonically increasing OS counters (network and disk I/O)
+into per-second rates by diffing successive samples.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# --- Constants ---
+COUNTER_32_LIMIT = 2**32
+COUNTER_64_LIMIT = 2**64
+
+
+def counter_delta(current: int, previous: int) -> int:
+    """
+    Difference between two readings of an increasing counter.
+
+    Kernel counters are 32 or 64 bits wide and restart from zero when they
+    overflow. A reading lower than the previous one is treated as a single
+    wrap of the narrowest width that could hold the previous value.
+
+    Args:
+        current: The latest counter reading
+        previous: The reading from the previous sample
+
+    Returns:
+        int: The non-negative amount the counter advanced by
+    """
+    if current >= previous:
+        return current - previous
+    limit = COUNTER_32_LIMIT if previous < COUNTER_32_LIMIT else COUNTER_64_LIMIT
+    return limit - previous + current
+
+
+class CounterRateTracker:
+    """
+    Keeps the last counter sample and converts the next one into rates.
+
+    The first call (or a call after the previous sample went stale) takes a
+    priming sample and waits ``min_interval`` seconds, mirroring
+    ``psutil.cpu_percent(interval=1)``. Later calls reuse the sample left by
+    the previous call, so periodic callers do not pay for the wait again.
+    """
+
+    def __init__(
+        self,
+        sampler: Callable[[], Dict[str, Any]],
+        fields: Iterable[str],
+        min_interval: float = 1.0,
+        max_age: float = 300.0,
+    ):
+        self._sampler = sampler
+        self._fields = tuple(fields)
+        self._min_interval = min_interval
+        self._max_age = max_age
+        self._previous: Optional[Dict[str, Any]] = None
+        self._previous_time = 0.0
+        self._lock = threading.Lock()
+
+    def rates(self) -> Tuple[Dict[str, Dict[str, float]], float]:
+        """
+        Sample the counters and compute per-second rates since the last sample.
+
+        Returns:
+            Tuple[Dict[str, Dict[str, float]], float]: Rates keyed by device
+            name then counter field, and the interval in seconds they cover
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._previous is None or now - self._previous_time > self._max_age:
+                self._previous = self._sampler()
+                self._previous_time = now
+            elapsed = now - self._previous_time
+            if elapsed < self._min_interval:
+                time.sleep(self._min_interval - elapsed)
+
+            current = self._sampler()
+            current_time = time.monotonic()
+            interval = current_time - self._previous_time
+
+            rates = {}
+            for name, counters in current.items():
+                previous = self._previous.get(name)
+                if previous is None:
+                    # Device appeared since the last sample; no baseline yet
+                    continue
+                rates[name] = {
+                    field: counter_delta(
+                        getattr(counters, field), getattr(previous, field)
+                    )
+                    / interval
+                    for field in self._fields
+                }
+
+            self._previous = current
+            self._previous_time = current_time
+            return rates, interval
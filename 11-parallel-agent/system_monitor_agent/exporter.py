@@ -0,0 +1,364 @@
+"""
+Metrics Exporter
+
+This module serves the cpu/memory/disk collector results in the Prometheus
+text exposition format, so dashboards can scrape them without an agent run.
+
+Scrapes never run the collectors. A background task samples them at a fixed
+interval and renders the response body once; every scrape in between is
+answered from that cached body, so scrape cost does not depend on how often
+(or by how many scrapers) the endpoint is scraped.
+
+Sizes are exported in bytes, as Prometheus expects, straight from psutil
+rather than from the rounded gigabyte values the agent tools return. A
+sample that fails is logged and the previous body keeps being served, with
+``last_success_timestamp_seconds`` showing how old it is.
+
+Usage:
+    python -m system_monitor_agent.exporter --port 9108 --interval 15
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+from .fleet.http import serve_http
+from .subagents.cpu_info_agent.tools import get_cpu_info
+
+# --- Constants ---
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRIC_PREFIX = "system_monitor"
+DEFAULT_SAMPLE_INTERVAL_SEC = 15.0
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _MetricWriter:
+    """Collects metric families and renders them in exposition format."""
+
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def family(
+        self,
+        name: str,
+        help_text: str,
+        samples: List[Tuple[Dict[str, Any], float]],
+        metric_type: str = "gauge",
+    ) -> None:
+        """Add one metric family with its (labels, value) samples."""
+        name = f"{METRIC_PREFIX}_{name}"
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in samples:
+            label_text = ",".join(
+                f'{key}="{_escape(label)}"' for key, label in labels.items()
+            )
+            series = f"{name}{{{label_text}}}" if label_text else name
+            self._lines.append(f"{series} {float(value)!r}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def _memory_bytes() -> Dict[str, Any]:
+    memory = psutil.virtual_memory()
+    swap = psutil.swap_memory()
+    return {
+        "total_bytes": memory.total,
+        "available_bytes": memory.available,
+        "used_bytes": memory.used,
+        "memory_percent": memory.percent,
+        "swap_total_bytes": swap.total,
+        "swap_used_bytes": swap.used,
+        "swap_percent": swap.percent,
+    }
+
+
+def _disk_bytes() -> Dict[str, Any]:
+    partitions = []
+    for partition in psutil.disk_partitions():
+        try:
+            usage = psutil.disk_usage(partition.mountpoint)
+        except (PermissionError, FileNotFoundError):
+            # Some partitions may not be accessible
+            continue
+        partitions.append(
+            {
+                "device": partition.device,
+                "mountpoint": partition.mountpoint,
+                "filesystem_type": partition.fstype,
+                "total_bytes": usage.total,
+                "used_bytes": usage.used,
+                "free_bytes": usage.free,
+                "percent": usage.percent,
+            }
+        )
+    return {"partitions": partitions}
+
+
+def _guarded(collector: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Run a collector; a failure becomes an error dict like the tools return."""
+    try:
+        return collector()
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def collect_metrics() -> Dict[str, Any]:
+    """
+    Sample the collectors for one exposition body.
+
+    CPU comes from the cpu collector tool (it samples for a second); memory
+    and disk sizes are read from psutil in bytes.
+
+    Returns:
+        Dict[str, Any]: cpu, memory and disk results; a failed collector's
+            entry is a dict with an ``error`` key
+    """
+    return {
+        "cpu": get_cpu_info()["result"],
+        "memory": _guarded(_memory_bytes),
+        "disk": _guarded(_disk_bytes),
+    }
+
+
+def render_metrics(
+    metrics: Dict[str, Any],
+    sample_duration: float,
+    samples_taken: int,
+    last_success: float,
+    sample_failures: int = 0,
+) -> str:
+    """
+    Render one set of collector results in the text exposition format.
+
+    Args:
+        metrics: Results returned by ``collect_metrics``
+        sample_duration: Seconds the collectors took
+        samples_taken: Number of successful samples since the exporter started
+        last_success: Unix time of the sample ``metrics`` come from
+        sample_failures: Number of samples that failed since the start
+
+    Returns:
+        str: The exposition-format response body
+    """
+    writer = _MetricWriter()
+    cpu = metrics["cpu"]
+    memory = metrics["memory"]
+    disk = metrics["disk"]
+
+    # A collector that failed returns an error dict; report it as down and
+    # leave its metrics out rather than failing the whole scrape
+    writer.family(
+        "collector_up",
+        "Whether the last sample of the collector succeeded.",
+        [
+            ({"collector": name}, 0 if "error" in metrics[name] else 1)
+            for name in ("cpu", "memory", "disk")
+        ],
+    )
+    writer.family(
+        "sample_duration_seconds",
+        "Seconds the last sample of all collectors took.",
+        [({}, sample_duration)],
+    )
+    writer.family(
+        "samples_total",
+        "Collector samples taken since the exporter started.",
+        [({}, samples_taken)],
+        metric_type="counter",
+    )
+    writer.family(
+        "sample_failures_total",
+        "Collector samples that failed since the exporter started.",
+        [({}, sample_failures)],
+        metric_type="counter",
+    )
+    writer.family(
+        "last_success_timestamp_seconds",
+        "Unix time of the last successful sample; the metrics below are from it.",
+        [({}, last_success)],
+    )
+
+    if "error" not in cpu:
+        writer.family(
+            "cpu_usage_percent",
+            "Average CPU usage across all cores.",
+            [({}, cpu["avg_usage_percent"])],
+        )
+        writer.family(
+            "cpu_core_usage_percent",
+            "CPU usage per logical core.",
+            [
+                ({"core": core}, value)
+                for core, value in enumerate(cpu["per_core_percent"])
+            ],
+        )
+        writer.family(
+            "cpu_cores",
+            "Number of CPU cores.",
+            [
+                ({"kind": "physical"}, cpu["physical_cores"] or 0),
+                ({"kind": "logical"}, cpu["logical_cores"] or 0),
+            ],
+        )
+
+    if "error" not in memory:
+        for name, field, help_text in (
+            ("memory_total_bytes", "total_bytes", "Total memory"),
+            ("memory_available_bytes", "available_bytes", "Available memory"),
+            ("memory_used_bytes", "used_bytes", "Used memory"),
+            ("swap_total_bytes", "swap_total_bytes", "Total swap"),
+            ("swap_used_bytes", "swap_used_bytes", "Used swap"),
+        ):
+            writer.family(name, f"{help_text} in bytes.", [({}, memory[field])])
+        writer.family(
+            "memory_usage_percent",
+            "Memory usage.",
+            [({}, memory["memory_percent"])],
+        )
+        writer.family(
+            "swap_usage_percent", "Swap usage.", [({}, memory["swap_percent"])]
+        )
+
+    if "error" not in disk:
+        partition_labels = [
+            (
+                {
+                    "device": partition["device"],
+                    "mountpoint": partition["mountpoint"],
+                    "fstype": partition["filesystem_type"],
+                },
+                partition,
+            )
+            for partition in disk["partitions"]
+        ]
+        for field, help_text in (
+            ("total_bytes", "Partition size"),
+            ("used_bytes", "Used partition space"),
+            ("free_bytes", "Free partition space"),
+        ):
+            writer.family(
+                f"disk_{field}",
+                f"{help_text} in bytes.",
+                [(labels, partition[field]) for labels, partition in partition_labels],
+            )
+        writer.family(
+            "disk_usage_percent",
+            "Partition usage.",
+            [(labels, partition["percent"]) for labels, partition in partition_labels],
+        )
+
+    return writer.render()
+
+
+class SampledMetricsCache:
+    """
+    Pre-rendered exposition body, refreshed by a background sampling task.
+
+    ``body`` is replaced atomically after each sample, so scrapes only read
+    an attribute and never wait for, or trigger, a collection. When a sample
+    fails, the last good metrics are re-rendered with the failure counted.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL_SEC):
+        self.interval = interval
+        self.body = b""
+        self.samples_taken = 0
+        self.sample_failures = 0
+        self.last_success = 0.0
+        self._metrics: Optional[Dict[str, Any]] = None
+        self._sample_duration = 0.0
+
+    def _render(self) -> None:
+        self.body = render_metrics(
+            self._metrics,
+            self._sample_duration,
+            self.samples_taken,
+            self.last_success,
+            self.sample_failures,
+        ).encode()
+
+    def sample(self) -> None:
+        """Run the collectors once and re-render the cached body (blocking)."""
+        start = time.perf_counter()
+        metrics = collect_metrics()
+        self._sample_duration = time.perf_counter() - start
+        self._metrics = metrics
+        self.samples_taken += 1
+        self.last_success = time.time()
+        self._render()
+
+    def record_failure(self, error: Exception) -> None:
+        """Log a failed sample and count it in the served body."""
+        self.sample_failures += 1
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        print(
+            f"[{timestamp}] Sample failed, serving the previous one: "
+            f"{type(error).__name__}: {error}",
+            file=sys.stderr,
+        )
+        if self._metrics is not None:
+            self._render()
+
+    async def run(self) -> None:
+        """Sample at a fixed interval; the collectors run in a worker thread."""
+        next_tick = time.monotonic()
+        while True:
+            next_tick += self.interval
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+            try:
+                await asyncio.to_thread(self.sample)
+            except Exception as e:
+                # One failed sample must not stop sampling for good
+                self.record_failure(e)
+
+
+async def main_async(host: str, port: int, interval: float):
+    cache = SampledMetricsCache(interval)
+    # Take the first sample before accepting scrapes, so none sees an empty body
+    await asyncio.to_thread(cache.sample)
+    # run() waits one interval before its first sample
+    sampler = asyncio.create_task(cache.run())
+
+    async def handle_request(path: str) -> Tuple[int, str, bytes]:
+        if path != "/metrics":
+            return 404, CONTENT_TYPE, f"Unknown path: {path}\n".encode()
+        return 200, CONTENT_TYPE, cache.body
+
+    server = await serve_http(handle_request, host, port)
+    print(
+        f"Exporting metrics on http://{host}:{port}/metrics "
+        f"(sampled every {interval:g}s)"
+    )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        sampler.cancel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve collector metrics")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9108)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_SAMPLE_INTERVAL_SEC,
+        help="Seconds between collector samples",
+    )
+    args = parser.parse_args()
+    try:
+        asyncio.run(main_async(args.host, args.port, args.interval))
+    except KeyboardInterrupt:
+        pass
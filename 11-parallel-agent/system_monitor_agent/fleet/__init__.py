@@ -0,0 +1,9 @@
+"""
+Fleet Mode
+
+This package lets one system monitor process poll many host metrics endpoints
+concurrently and summarize them before synthesis.
+"""
+
+from .collector import collect_fleet, summarize_fleet
+from .http import ConnectionPool
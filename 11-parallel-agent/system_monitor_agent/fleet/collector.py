@@ -0,0 +1,222 @@
+"""
+Fleet Collector
+
+This module polls many host metrics endpoints concurrently and aggregates the
+answers into a compact fleet summary for the synthesizer.
+"""
+
+import asyncio
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..alerts import ALERT_ENGINE
+from ..alerts.engine import COMPARATORS
+from .http import ConnectionPool
+
+# --- Constants ---
+DEFAULT_TIMEOUT = 2.0
+DEFAULT_MAX_PER_ORIGIN = 32
+WORST_HOSTS_LIMIT = 10
+FAILED_HOSTS_LIMIT = 20
+# Fleet resource -> alert rule metric its threshold comes from
+RESOURCE_METRICS = {
+    "cpu": "cpu_percent",
+    "memory": "memory_percent",
+    "disk": "disk_percent",
+}
+RISING_COMPARATORS = (">", ">=")
+
+
+def metrics_url(endpoint: str) -> str:
+    """Accept bare host:port endpoints as well as full metrics URLs."""
+    if "://" not in endpoint:
+        endpoint = f"http://{endpoint}"
+    scheme, _, rest = endpoint.partition("://")
+    if "/" not in rest:
+        return f"{scheme}://{rest}/metrics"
+    return endpoint
+
+
+async def poll_host(
+    pool: ConnectionPool, endpoint: str, timeout: float
+) -> Dict[str, Any]:
+    """
+    Fetch one host's metrics, converting any failure into a result record.
+
+    Args:
+        pool: Shared keep-alive connection pool
+        endpoint: Host endpoint (host:port or full URL)
+        timeout: Seconds the host has to answer
+
+    Returns:
+        Dict[str, Any]: Record with ``ok`` plus either the payload or an error
+    """
+    start = time.perf_counter()
+    try:
+        payload = await pool.get_json(metrics_url(endpoint), timeout)
+        return {
+            "endpoint": endpoint,
+            "ok": True,
+            "latency_ms": (time.perf_counter() - start) * 1000,
+            "payload": payload,
+        }
+    except asyncio.TimeoutError:
+        error = f"timed out after {timeout:g}s"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {
+        "endpoint": endpoint,
+        "ok": False,
+        "latency_ms": (time.perf_counter() - start) * 1000,
+        "error": error,
+    }
+
+
+def fleet_thresholds(
+    alert_rules: List[Dict[str, Any]],
+) -> Dict[str, Tuple[str, float]]:
+    """
+    The threshold each fleet resource is held to, from the alert rules.
+
+    Args:
+        alert_rules: Rules as returned by ``alerts.load_rules``
+
+    Returns:
+        Dict[str, Tuple[str, float]]: Comparator and threshold per resource,
+            from the lowest rising (">"/">=") rule of its metric. A resource
+            without one is never over its threshold.
+    """
+    thresholds = {}
+    for resource, metric in RESOURCE_METRICS.items():
+        rules = [
+            (float(rule["threshold"]), rule["comparator"])
+            for rule in alert_rules
+            if rule["metric"] == metric and rule["comparator"] in RISING_COMPARATORS
+        ]
+        threshold, comparator = min(rules, default=(math.inf, ">"))
+        thresholds[resource] = (comparator, threshold)
+    return thresholds
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return round(sorted_values[index], 1)
+
+
+def _host_metrics(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Pull the headline numbers out of one host's cpu/memory/disk dicts."""
+    payload = record["payload"]
+    return {
+        "host": payload.get("host", record["endpoint"]),
+        "cpu": payload["cpu"]["stats"]["avg_usage_percentage"],
+        "memory": payload["memory"]["stats"]["memory_usage_percentage"],
+        "disk": payload["disk"]["stats"]["overall_usage_percent"],
+    }
+
+
+def summarize_fleet(
+    records: List[Dict[str, Any]],
+    thresholds: Optional[Dict[str, Tuple[str, float]]] = None,
+) -> Dict[str, Any]:
+    """
+    Aggregate per-host records into a fleet summary.
+
+    Only distributions, the worst hosts per resource and a bounded list of
+    failures are kept, so the summary stays small for large fleets.
+
+    Args:
+        records: Results from ``poll_host``
+        thresholds: Comparator and threshold per resource (defaults to
+            ``fleet_thresholds`` on the loaded alert rules)
+
+    Returns:
+        Dict[str, Any]: Fleet summary structured for ADK
+    """
+    hosts = []
+    failures = []
+    for record in records:
+        if record["ok"]:
+            try:
+                hosts.append(_host_metrics(record))
+                continue
+            except (KeyError, TypeError):
+                record = {**record, "error": "malformed metrics payload"}
+        failures.append({"endpoint": record["endpoint"], "error": record["error"]})
+
+    thresholds = thresholds or fleet_thresholds(ALERT_ENGINE.rules)
+    resources = {}
+    for resource, (comparator, threshold) in thresholds.items():
+        over = COMPARATORS[comparator]
+        values = sorted(host[resource] for host in hosts)
+        worst = sorted(hosts, key=lambda host: host[resource], reverse=True)
+        resources[resource] = {
+            "avg_percent": round(sum(values) / len(values), 1) if values else None,
+            "p50_percent": _percentile(values, 0.50),
+            "p95_percent": _percentile(values, 0.95),
+            "max_percent": round(values[-1], 1) if values else None,
+            "threshold_percent": threshold if math.isfinite(threshold) else None,
+            "hosts_over_threshold": sum(
+                bool(over(value, threshold)) for value in values
+            ),
+            "worst_hosts": [
+                {"host": host["host"], "percent": round(host[resource], 1)}
+                for host in worst[:WORST_HOSTS_LIMIT]
+                if over(host[resource], threshold)
+            ],
+        }
+
+    latencies = sorted(record["latency_ms"] for record in records if record["ok"])
+    return {
+        "result": {
+            "resources": resources,
+            "failed_hosts": failures[:FAILED_HOSTS_LIMIT],
+        },
+        "stats": {
+            "host_count": len(records),
+            "reachable_hosts": len(hosts),
+            "unreachable_hosts": len(failures),
+            "p50_poll_latency_ms": _percentile(latencies, 0.50),
+            "p99_poll_latency_ms": _percentile(latencies, 0.99),
+        },
+        "additional_info": {
+            "data_format": "dictionary",
+            "collection_timestamp": time.time(),
+            "failed_hosts_truncated": len(failures) > FAILED_HOSTS_LIMIT,
+        },
+    }
+
+
+async def collect_fleet(
+    endpoints: List[str],
+    timeout: float = DEFAULT_TIMEOUT,
+    pool: Optional[ConnectionPool] = None,
+) -> Dict[str, Any]:
+    """
+    Poll every endpoint concurrently and summarize the fleet.
+
+    A slow or failing host only costs its own timeout; it is reported in the
+    summary while the rest of the fleet is still aggregated.
+
+    Args:
+        endpoints: Host endpoints to poll
+        timeout: Per-host timeout in seconds
+        pool: Connection pool to reuse across calls (a temporary one is
+            created and closed when omitted)
+
+    Returns:
+        Dict[str, Any]: Fleet summary from ``summarize_fleet``
+    """
+    owns_pool = pool is None
+    pool = pool or ConnectionPool(max_per_origin=DEFAULT_MAX_PER_ORIGIN)
+    try:
+        records = await asyncio.gather(
+            *(poll_host(pool, endpoint, timeout) for endpoint in endpoints)
+        )
+    finally:
+        if owns_pool:
+            pool.close()
+    return summarize_fleet(records)
@@ -0,0 +1,51 @@
+"""
+Host Metrics Endpoint
+
+This module runs the tiny per-host agent that fleet mode polls. It serves the
+same cpu/memory/disk dictionaries the local collector tools return.
+
+Usage:
+    python -m system_monitor_agent.fleet.host_endpoint --port 9100
+"""
+
+import argparse
+import asyncio
+import socket
+from typing import Any, Tuple
+
+from ..subagents.cpu_info_agent.tools import get_cpu_info
+from ..subagents.disk_info_agent.tools import get_disk_info
+from ..subagents.memory_info_agent.tools import get_memory_info
+from .http import serve_json
+
+
+def collect_host_metrics() -> dict:
+    """Run the local collectors and bundle their results."""
+    return {
+        "host": socket.gethostname(),
+        "cpu": get_cpu_info(),
+        "memory": get_memory_info(),
+        "disk": get_disk_info(),
+    }
+
+
+async def handle_request(path: str) -> Tuple[int, Any]:
+    """Serve /metrics; the collectors block, so they run in a worker thread."""
+    if path != "/metrics":
+        return 404, {"error": f"Unknown path: {path}"}
+    return 200, await asyncio.to_thread(collect_host_metrics)
+
+
+async def main_async(host: str, port: int):
+    server = await serve_json(handle_request, host, port)
+    print(f"Serving host metrics on http://{host}:{port}/metrics")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve this host's metrics")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9100)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.host, args.port))
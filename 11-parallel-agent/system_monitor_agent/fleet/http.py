@@ -0,0 +1,213 @@
+"""
+Minimal HTTP/1.1 Transport for Fleet Mode
+
+This module provides just enough HTTP/1.1 to serve and poll host metrics
+endpoints with asyncio: a server with keep-alive support (for JSON or any
+pre-encoded body) and a client connection pool that reuses connections per
+origin.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+# --- Constants ---
+REASONS = {200: "OK", 404: "Not Found", 500: "Internal Server Error"}
+MAX_HEADER_LINES = 100
+
+JSON_CONTENT_TYPE = "application/json"
+
+JsonHandler = Callable[[str], Awaitable[Tuple[int, Any]]]
+# Returns (status code, content type, encoded body)
+BodyHandler = Callable[[str], Awaitable[Tuple[int, str, bytes]]]
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    """Read header lines up to the blank line that ends them."""
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            return headers
+        if not line:
+            raise ConnectionError("Connection closed while reading headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raise ValueError("Too many header lines")
+
+
+async def serve_http(
+    handler: BodyHandler, host: str = "127.0.0.1", port: int = 0
+) -> asyncio.AbstractServer:
+    """
+    Start a keep-alive HTTP server that answers GET requests.
+
+    Args:
+        handler: Coroutine called with the request path, returning
+            (status code, content type, encoded body)
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        asyncio.AbstractServer: The running server
+    """
+
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                _, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = await _read_headers(reader)
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                status, content_type, body = await handler(path)
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}\r\n"
+                        f"Content-Type: {content_type}\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                        "\r\n"
+                    ).encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.CancelledError):
+            # Malformed request, client went away or server shutting down
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle_connection, host, port)
+
+
+async def serve_json(
+    handler: JsonHandler, host: str = "127.0.0.1", port: int = 0
+) -> asyncio.AbstractServer:
+    """
+    Start a keep-alive HTTP server that answers GET requests with JSON.
+
+    Args:
+        handler: Coroutine called with the request path, returning
+            (status code, JSON-serializable payload)
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        asyncio.AbstractServer: The running server
+    """
+
+    async def handle_json(path: str) -> Tuple[int, str, bytes]:
+        status, payload = await handler(path)
+        return (
+            status,
+            JSON_CONTENT_TYPE,
+            json.dumps(payload, separators=(",", ":")).encode(),
+        )
+
+    return await serve_http(handle_json, host, port)
+
+
+class ConnectionPool:
+    """
+    Pool of keep-alive HTTP/1.1 client connections, bounded per origin.
+
+    Requests to the same host:port reuse idle connections instead of paying
+    for a new TCP handshake on every poll. At most ``max_per_origin``
+    requests are in flight to one origin; further requests wait for a slot.
+    """
+
+    def __init__(self, max_per_origin: int = 32):
+        self._max_per_origin = max_per_origin
+        self._idle: Dict[Tuple[str, int], List[Connection]] = {}
+        self._slots: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+        self.connections_opened = 0
+
+    async def get(self, url: str, timeout: float) -> bytes:
+        """
+        GET a URL and return its raw body.
+
+        Args:
+            url: Absolute http:// URL
+            timeout: Seconds allowed for the request once a connection slot
+                is available (time spent queueing for a slot is not counted)
+
+        Returns:
+            bytes: The response body
+
+        Raises:
+            asyncio.TimeoutError: If the host does not answer in time
+            ConnectionError: If the host answers with a non-200 status
+        """
+        parts = urlsplit(url)
+        origin = (parts.hostname, parts.port or 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        slots = self._slots.setdefault(origin, asyncio.Semaphore(self._max_per_origin))
+        async with slots:
+            status, body = await asyncio.wait_for(self._request(origin, path), timeout)
+        if status != 200:
+            raise ConnectionError(f"HTTP {status} from {parts.netloc}")
+        return body
+
+    async def get_json(self, url: str, timeout: float) -> Any:
+        """GET a URL and decode its JSON body (see ``get``)."""
+        return json.loads(await self.get(url, timeout))
+
+    async def _request(self, origin: Tuple[str, int], path: str) -> Tuple[int, bytes]:
+        """Send one request, retrying once if a reused connection was stale."""
+        idle = self._idle.setdefault(origin, [])
+        while True:
+            reused = bool(idle)
+            if reused:
+                reader, writer = idle.pop()
+            else:
+                reader, writer = await asyncio.open_connection(*origin)
+                self.connections_opened += 1
+
+            keep_alive = False
+            try:
+                writer.write(
+                    (
+                        f"GET {path} HTTP/1.1\r\n"
+                        f"Host: {origin[0]}:{origin[1]}\r\n"
+                        "Connection: keep-alive\r\n"
+                        "\r\n"
+                    ).encode("latin-1")
+                )
+                await writer.drain()
+                status_line = await reader.readline()
+                if not status_line:
+                    raise ConnectionResetError("Connection closed by host")
+                status = int(status_line.split()[1])
+                headers = await _read_headers(reader)
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                keep_alive = headers.get("connection", "").lower() != "close"
+                return status, body
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if reused:
+                    # The host closed an idle connection; try a fresh one
+                    continue
+                raise
+            finally:
+                # Cancelled or failed requests leave the stream in an unknown
+                # state, so only cleanly finished connections go back
+                if keep_alive:
+                    idle.append((reader, writer))
+                else:
+                    writer.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
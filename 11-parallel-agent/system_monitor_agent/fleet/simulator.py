@@ -0,0 +1,81 @@
+"""
+Simulated Fleet
+
+This module provides a local stand-in for a fleet of host endpoints. One
+server answers ``/hosts/<n>/metrics`` for every simulated host with synthetic
+cpu/memory/disk dictionaries shaped like the real collector output, so the
+fleet collector can be exercised and benchmarked without real machines.
+"""
+
+import asyncio
+import random
+from typing import Any, List, Tuple
+
+from .http import serve_json
+
+
+def synthetic_host_metrics(host_id: int, rng: random.Random) -> dict:
+    """Build a payload with the same stats keys as the real collectors."""
+    return {
+        "host": f"sim-host-{host_id:04d}",
+        "cpu": {"stats": {"avg_usage_percentage": rng.uniform(2, 99)}},
+        "memory": {"stats": {"memory_usage_percentage": rng.uniform(10, 97)}},
+        "disk": {"stats": {"overall_usage_percent": rng.uniform(5, 98)}},
+    }
+
+
+async def start_simulated_fleet(
+    host_count: int,
+    latency_ms: float = 20.0,
+    jitter_ms: float = 10.0,
+    hung_fraction: float = 0.0,
+    error_fraction: float = 0.0,
+    seed: int = 0,
+) -> Tuple[asyncio.AbstractServer, List[str]]:
+    """
+    Start the stand-in server and return the endpoint URL of every host.
+
+    Args:
+        host_count: Number of simulated hosts
+        latency_ms: Base response latency per request
+        jitter_ms: Uniform random latency added on top of the base
+        hung_fraction: Share of hosts that never answer in time
+        error_fraction: Share of hosts that answer with HTTP 500
+        seed: Seed for the synthetic metrics and failure assignment
+
+    Returns:
+        Tuple[asyncio.AbstractServer, List[str]]: The server and endpoints
+    """
+    rng = random.Random(seed)
+    behaviours = {}
+    for host_id in range(host_count):
+        roll = rng.random()
+        if roll < hung_fraction:
+            behaviours[host_id] = "hung"
+        elif roll < hung_fraction + error_fraction:
+            behaviours[host_id] = "error"
+        else:
+            behaviours[host_id] = "ok"
+
+    async def handle_request(path: str) -> Tuple[int, Any]:
+        parts = path.strip("/").split("/")
+        if len(parts) != 3 or parts[0] != "hosts" or parts[2] != "metrics":
+            return 404, {"error": f"Unknown path: {path}"}
+        host_id = int(parts[1])
+        behaviour = behaviours.get(host_id)
+        if behaviour is None:
+            return 404, {"error": f"Unknown host: {host_id}"}
+        if behaviour == "hung":
+            await asyncio.sleep(3600)
+        await asyncio.sleep((latency_ms + rng.uniform(0, jitter_ms)) / 1000)
+        if behaviour == "error":
+            return 500, {"error": "collector crashed"}
+        return 200, synthetic_host_metrics(host_id, rng)
+
+    server = await serve_json(handle_request)
+    port = server.sockets[0].getsockname()[1]
+    endpoints = [
+        f"http://127.0.0.1:{port}/hosts/{host_id}/metrics"
+        for host_id in range(host_count)
+    ]
+    return server, endpoints
@@ -0,0 +1,257 @@
+"""
+Disk Usage Forecasting
+
+This module keeps a bounded history of used bytes per partition and fits a
+least-squares trend to every partition at once, to estimate growth rates and
+when each partition will be full.
+
+The history is a fixed-size ring buffer (one row per sample round, one
+column per mountpoint), so memory stays bounded however long the monitor
+runs: 500 partitions x 2,016 rows (one week at 5-minute resolution) is about
+8 MB.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# --- Constants ---
+DEFAULT_CAPACITY = 2016
+# Samples closer together than this replace the latest row instead of
+# adding one, so frequent polling does not shorten the covered time span
+DEFAULT_MIN_INTERVAL_SEC = 300.0
+DEFAULT_WINDOW_SEC = 7 * 24 * 3600.0
+MIN_SAMPLES = 3
+SECONDS_PER_DAY = 86400.0
+GB = 1024**3
+
+
+class DiskUsageHistory:
+    """
+    Ring buffer of (timestamp, used bytes per mountpoint) sample rounds.
+
+    Args:
+        capacity: Number of sample rounds kept
+        min_interval_sec: Minimum spacing between stored rounds
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        min_interval_sec: float = DEFAULT_MIN_INTERVAL_SEC,
+    ):
+        self.capacity = capacity
+        self.min_interval_sec = min_interval_sec
+        self._lock = threading.Lock()
+        self._columns: Dict[str, int] = {}
+        self._times = np.full(capacity, np.nan)
+        self._used = np.full((capacity, 16), np.nan)
+        self._total = np.full(16, np.nan)
+        self._next_row = 0
+        self._rows = 0
+
+    @property
+    def span_sec(self) -> float:
+        """Time between the oldest and newest stored sample round."""
+        if not self._rows:
+            return 0.0
+        return float(np.nanmax(self._times) - np.nanmin(self._times))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the sample arrays."""
+        return self._times.nbytes + self._used.nbytes + self._total.nbytes
+
+    def _column(self, mountpoint: str) -> int:
+        column = self._columns.get(mountpoint)
+        if column is None:
+            column = len(self._columns)
+            if column == self._used.shape[1]:
+                # Grow geometrically; new columns have no history yet
+                self._used = np.hstack([self._used, np.full_like(self._used, np.nan)])
+                self._total = np.concatenate(
+                    [self._total, np.full_like(self._total, np.nan)]
+                )
+            self._columns[mountpoint] = column
+        return column
+
+    def record(
+        self,
+        used_bytes: Dict[str, float],
+        total_bytes: Dict[str, float],
+        timestamp: Optional[float] = None,
+    ) -> bool:
+        """
+        Store one sample round.
+
+        Args:
+            used_bytes: Used bytes per mountpoint
+            total_bytes: Size in bytes per mountpoint
+            timestamp: Sample time (defaults to now)
+
+        Returns:
+            bool: True if a new row was added, False if the latest row was
+            replaced because it is less than ``min_interval_sec`` old
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            latest = (self._next_row - 1) % self.capacity
+            new_row = (
+                self._rows == 0
+                or timestamp - self._times[latest] >= self.min_interval_sec
+            )
+            if new_row:
+                row = self._next_row
+                self._next_row = (self._next_row + 1) % self.capacity
+                self._rows = min(self._rows + 1, self.capacity)
+                self._times[row] = timestamp
+            else:
+                row = latest
+            self._used[row] = np.nan
+            for mountpoint, used in used_bytes.items():
+                column = self._column(mountpoint)
+                self._used[row, column] = used
+                self._total[column] = total_bytes[mountpoint]
+            return new_row
+
+    def forecast(
+        self, window_sec: float = DEFAULT_WINDOW_SEC, now: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fit a linear trend per partition over the recent window.
+
+        All partitions are fitted together: with the samples as a
+        (rows x partitions) matrix and missing samples masked out, the
+        slope of every column is a handful of NumPy reductions.
+
+        Args:
+            window_sec: Only samples this recent are fitted
+            now: Reference time for the window (defaults to now)
+
+        Returns:
+            List[Dict[str, Any]]: One record per partition present in the
+            latest sample round with at least ``MIN_SAMPLES`` samples
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            if not self._rows:
+                return []
+            columns = len(self._columns)
+            times = self._times
+            used = self._used[:, :columns]
+            total = self._total[:columns]
+            latest_row = (self._next_row - 1) % self.capacity
+            latest_used = used[latest_row].copy()
+
+            in_window = times >= now - window_sec
+            valid = ~np.isnan(used) & in_window[:, None]
+            weights = valid.astype(float)
+            counts = weights.sum(axis=0)
+
+            # Ordinary least squares for every column from sums: the sums
+            # over time are matrix products with the validity mask. Times are
+            # relative to now and usage relative to the latest sample, so the
+            # sums stay small and the subtractions below keep their precision
+            t = np.where(in_window, times - now, 0.0)
+            y = used - np.nan_to_num(latest_used)
+            np.copyto(y, 0.0, where=~valid)
+            sum_t = t @ weights
+            sum_y = y.sum(axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                sxx = (t * t) @ weights - sum_t * sum_t / counts
+                sxy = t @ y - sum_t * sum_y / counts
+                syy = np.einsum("ij,ij->j", y, y) - sum_y * sum_y / counts
+                slope = sxy / sxx
+                r_squared = np.where(syy > 0, sxy * sxy / (sxx * syy), 1.0)
+                seconds_to_full = np.where(
+                    slope > 0, (total - latest_used) / slope, np.inf
+                )
+
+            names = list(self._columns)
+            forecasts = []
+            for column in np.flatnonzero(
+                (counts >= MIN_SAMPLES) & ~np.isnan(latest_used) & (sxx > 0)
+            ):
+                growth_per_day = slope[column] * SECONDS_PER_DAY
+                days_to_full = seconds_to_full[column] / SECONDS_PER_DAY
+                forecasts.append(
+                    {
+                        "mountpoint": names[column],
+                        "used_percent": round(
+                            float(latest_used[column] / total[column] * 100), 1
+                        ),
+                        "growth_gb_per_day": round(float(growth_per_day / GB), 3),
+                        "days_to_full": (
+                            round(float(days_to_full), 1)
+                            if np.isfinite(days_to_full)
+                            else None
+                        ),
+                        "r_squared": round(float(r_squared[column]), 2),
+                        "samples": int(counts[column]),
+                    }
+                )
+            return forecasts
+
+    def save(self, path: str) -> None:
+        """Write the history to a .npz file."""
+        with self._lock, open(path, "wb") as file:
+            np.savez(
+                file,
+                mountpoints=np.array(list(self._columns), dtype=str),
+                times=self._times,
+                used=self._used[:, : len(self._columns)],
+                total=self._total[: len(self._columns)],
+                cursor=np.array([self._next_row, self._rows]),
+            )
+
+    def load(self, path: str) -> None:
+        """Restore a history written by ``save`` (same capacity only)."""
+        with np.load(path) as data:
+            if len(data["times"]) != self.capacity:
+                raise ValueError(
+                    f"History in {path} has {len(data['times'])} rows, "
+                    f"expected {self.capacity}"
+                )
+            with self._lock:
+                self._columns = {}
+                for mountpoint in data["mountpoints"]:
+                    self._column(str(mountpoint))
+                columns = len(self._columns)
+                self._times = data["times"]
+                self._used[:, :columns] = data["used"]
+                self._total[:columns] = data["total"]
+                self._next_row, self._rows = (int(value) for value in data["cursor"])
+
+
+def history_from_env() -> DiskUsageHistory:
+    """
+    Create the shared history, restoring it from SYSTEM_MONITOR_DISK_HISTORY
+    if that file exists (so one-shot runs accumulate history too).
+    """
+    history = DiskUsageHistory()
+    path = os.getenv("SYSTEM_MONITOR_DISK_HISTORY")
+    if path and os.path.exists(path):
+        try:
+            history.load(path)
+        except (OSError, ValueError, KeyError):
+            # Unreadable or incompatible history; start over
+            pass
+    return history
+
+
+def persist_history(history: DiskUsageHistory) -> None:
+    """Save the history to SYSTEM_MONITOR_DISK_HISTORY, if set."""
+    path = os.getenv("SYSTEM_MONITOR_DISK_HISTORY")
+    if path:
+        try:
+            history.save(path)
+        except OSError:
+            # Persisting is best effort; the in-memory history still works
+            pass
+
+
+# Shared by the disk collector (which records) and the forecast tool
+DISK_HISTORY = history_from_env()
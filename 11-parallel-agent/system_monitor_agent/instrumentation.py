@@ -0,0 +1,358 @@
+"""
+Parallel Branch Instrumentation
+
+This module records when each agent, model call and tool call starts and
+ends, and how long the asyncio event loop was blocked, so it is possible to
+see whether the branches of a ParallelAgent really overlap. The timeline is
+written in the Chrome trace format (open it in chrome://tracing or
+https://ui.perfetto.dev), with one row per agent and one for the event loop.
+
+Enable it for root_agent by setting SYSTEM_MONITOR_TRACE to the output file.
+Each run of the root agent starts a new timeline, so memory stays bounded in a
+long-lived process and the file always holds the last run:
+
+    SYSTEM_MONITOR_TRACE=gatherer_trace.json adk run system_monitor_agent
+"""
+
+import asyncio
+import functools
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from google.adk.agents import BaseAgent, LlmAgent, ParallelAgent
+
+from .collector_agent import CollectorAgent
+
+# --- Constants ---
+# How often the event loop probe wakes up, and how late it must wake up to
+# count as blocked
+LOOP_PROBE_INTERVAL_SEC = 0.005
+LOOP_BLOCKED_THRESHOLD_SEC = 0.02
+EVENT_LOOP_ROW = "event loop"
+
+
+class ParallelTrace:
+    """
+    Collects agent, model, tool and event-loop-blocking spans.
+
+    Args:
+        output_path: Where ``finish`` writes the Chrome trace (optional)
+    """
+
+    def __init__(self, output_path: Optional[str] = None):
+        self.output_path = output_path
+        self.spans: List[Dict[str, Any]] = []
+        self.parallel_agents: Dict[str, List[str]] = {}
+        self._origin = time.perf_counter()
+        self._open: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._probe: Optional[asyncio.Task] = None
+
+    def reset(self) -> None:
+        """Drop the recorded spans and restart the clock (before each run)."""
+        with self._lock:
+            self.spans = []
+            self._open = {}
+            self._origin = time.perf_counter()
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def _begin(self, category: str, key: str) -> None:
+        with self._lock:
+            self._open[(category, key)] = self._now()
+
+    def _end(self, category: str, key: str, row: str, name: str) -> None:
+        end = self._now()
+        with self._lock:
+            start = self._open.pop((category, key), None)
+            if start is not None:
+                self.spans.append(
+                    {
+                        "category": category,
+                        "row": row,
+                        "name": name,
+                        "start": start,
+                        "end": end,
+                    }
+                )
+
+    # --- Callbacks (all return None so they never change behavior) ---
+
+    def before_agent(self, callback_context) -> None:
+        if self._probe is None:
+            self._start_loop_probe()
+        self._begin("agent", callback_context.agent_name)
+
+    def after_agent(self, callback_context) -> None:
+        name = callback_context.agent_name
+        self._end("agent", name, name, name)
+
+    def before_model(self, callback_context, llm_request) -> None:
+        self._begin("model", callback_context.agent_name)
+
+    def after_model(self, callback_context, llm_response) -> None:
+        name = callback_context.agent_name
+        self._end("model", name, name, "model call")
+
+    def before_tool(self, tool, args, tool_context) -> None:
+        self._begin("tool", tool_context.function_call_id)
+
+    def after_tool(self, tool, args, tool_context, tool_response) -> None:
+        self._end(
+            "tool", tool_context.function_call_id, tool_context.agent_name, tool.name
+        )
+
+    def timed_collector(self, row: str, collector: Callable) -> Callable:
+        """Wrap a CollectorAgent's collector so each call is a tool span."""
+
+        @functools.wraps(collector)
+        def timed():
+            start = self._now()
+            try:
+                return collector()
+            finally:
+                end = self._now()
+                with self._lock:
+                    self.spans.append(
+                        {
+                            "category": "tool",
+                            "row": row,
+                            "name": collector.__name__,
+                            "start": start,
+                            "end": end,
+                        }
+                    )
+
+        return timed
+
+    # --- Event loop blocking ---
+
+    def _start_loop_probe(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._probe = loop.create_task(self._watch_loop())
+
+    async def _watch_loop(self) -> None:
+        """Sleep in short steps; waking up late means the loop was blocked."""
+        while True:
+            expected = self._now() + LOOP_PROBE_INTERVAL_SEC
+            await asyncio.sleep(LOOP_PROBE_INTERVAL_SEC)
+            woke = self._now()
+            if woke - expected >= LOOP_BLOCKED_THRESHOLD_SEC:
+                with self._lock:
+                    self.spans.append(
+                        {
+                            "category": "loop_blocked",
+                            "row": EVENT_LOOP_ROW,
+                            "name": "event loop blocked",
+                            "start": expected,
+                            "end": woke,
+                        }
+                    )
+
+    def finish(self) -> None:
+        """Stop the loop probe and write the trace file, if configured."""
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        if self.output_path:
+            with open(self.output_path, "w") as file:
+                json.dump(self.chrome_trace(), file)
+
+    # --- Reports ---
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """The spans as a Chrome trace (complete events, microseconds)."""
+        rows = {EVENT_LOOP_ROW: 0}
+        for span in self.spans:
+            rows.setdefault(span["row"], len(rows))
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": row},
+            }
+            for row, tid in rows.items()
+        ]
+        events.extend(
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "pid": 1,
+                "tid": rows[span["row"]],
+                "ts": round(span["start"] * 1e6),
+                "dur": round((span["end"] - span["start"]) * 1e6),
+            }
+            for span in sorted(self.spans, key=lambda span: span["start"])
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Per-branch timings and the parallelism factor of each ParallelAgent.
+
+        The parallelism factor is the time the branches spent working (in
+        model and tool calls) divided by the wall time of the ParallelAgent:
+        close to the number of branches when their work overlaps, close to 1
+        when it runs one call after another. Branch durations alone would
+        overlap either way, since a branch stays open while it waits for the
+        event loop.
+        """
+        agent_spans = {
+            span["row"]: span for span in self.spans if span["category"] == "agent"
+        }
+        busy: Dict[str, Dict[str, float]] = {}
+        for span in self.spans:
+            if span["category"] in ("model", "tool"):
+                totals = busy.setdefault(span["row"], {"model": 0.0, "tool": 0.0})
+                totals[span["category"]] += span["end"] - span["start"]
+
+        parallel = {}
+        for name, branches in self.parallel_agents.items():
+            if name not in agent_spans:
+                continue
+            wall = agent_spans[name]["end"] - agent_spans[name]["start"]
+            rows = []
+            for branch in branches:
+                span = agent_spans.get(branch)
+                if span is None:
+                    continue
+                rows.append(
+                    {
+                        "branch": branch,
+                        "start_ms": round(span["start"] * 1000, 1),
+                        "end_ms": round(span["end"] * 1000, 1),
+                        "duration_ms": round((span["end"] - span["start"]) * 1000, 1),
+                        "model_ms": round(
+                            busy.get(branch, {}).get("model", 0.0) * 1000, 1
+                        ),
+                        "tool_ms": round(
+                            busy.get(branch, {}).get("tool", 0.0) * 1000, 1
+                        ),
+                    }
+                )
+            parallel[name] = {
+                "wall_ms": round(wall * 1000, 1),
+                "branches": rows,
+                "parallelism_factor": (
+                    round(
+                        sum(row["model_ms"] + row["tool_ms"] for row in rows)
+                        / (wall * 1000),
+                        2,
+                    )
+                    if wall > 0
+                    else None
+                ),
+            }
+
+        loop_blocked = sum(
+            span["end"] - span["start"]
+            for span in self.spans
+            if span["category"] == "loop_blocked"
+        )
+        return {
+            "parallel_agents": parallel,
+            "event_loop_blocked_ms": round(loop_blocked * 1000, 1),
+        }
+
+    def format_summary(self) -> str:
+        """The summary as a plain-text timeline table."""
+        summary = self.summary()
+        lines = []
+        for name, parallel in summary["parallel_agents"].items():
+            lines.append(
+                f"{name}: wall {parallel['wall_ms']} ms, "
+                f"parallelism factor {parallel['parallelism_factor']} "
+                f"({len(parallel['branches'])} branches)"
+            )
+            lines.append(
+                f"  {'branch':<26} {'start_ms':>9} {'end_ms':>9} {'dur_ms':>9}"
+                f" {'model_ms':>9} {'tool_ms':>9}"
+            )
+            for row in parallel["branches"]:
+                lines.append(
+                    f"  {row['branch']:<26} {row['start_ms']:>9} {row['end_ms']:>9}"
+                    f" {row['duration_ms']:>9} {row['model_ms']:>9}"
+                    f" {row['tool_ms']:>9}"
+                )
+        lines.append(f"event loop blocked: {summary['event_loop_blocked_ms']} ms")
+        return "\n".join(lines)
+
+
+def _around(existing, opening=None, closing=None):
+    """
+    Put the trace's hooks around a callback the agent already has.
+
+    The span opens before the agent's own callback runs and closes after it,
+    so the callback's time counts towards the span. The agent's callback
+    alone decides the return value.
+    """
+    if existing is None:
+        return opening or closing
+
+    def callback(*args, **kwargs):
+        if opening is not None:
+            opening(*args, **kwargs)
+        result = existing(*args, **kwargs)
+        if closing is not None:
+            closing(*args, **kwargs)
+        return result
+
+    return callback
+
+
+def instrument(agent: BaseAgent, trace: ParallelTrace, _root: bool = True) -> None:
+    """
+    Attach the trace's callbacks to an agent and all of its sub-agents.
+
+    The trace is reset when the outermost agent starts and finished (and
+    written) when it ends.
+    """
+    if isinstance(agent, ParallelAgent):
+        trace.parallel_agents[agent.name] = [sub.name for sub in agent.sub_agents]
+
+    before_agent = trace.before_agent
+    after_agent = trace.after_agent
+    if _root:
+
+        def before_agent(callback_context):
+            trace.reset()
+            trace.before_agent(callback_context)
+
+        def after_agent(callback_context):
+            trace.after_agent(callback_context)
+            trace.finish()
+
+    agent.before_agent_callback = _around(
+        agent.before_agent_callback, opening=before_agent
+    )
+    agent.after_agent_callback = _around(
+        agent.after_agent_callback, closing=after_agent
+    )
+
+    if isinstance(agent, LlmAgent):
+        agent.before_model_callback = _around(
+            agent.before_model_callback, opening=trace.before_model
+        )
+        agent.after_model_callback = _around(
+            agent.after_model_callback, closing=trace.after_model
+        )
+        agent.before_tool_callback = _around(
+            agent.before_tool_callback, opening=trace.before_tool
+        )
+        agent.after_tool_callback = _around(
+            agent.after_tool_callback, closing=trace.after_tool
+        )
+    if isinstance(agent, CollectorAgent):
+        agent.collector = trace.timed_collector(agent.name, agent.collector)
+
+    for sub_agent in agent.sub_agents:
+        instrument(sub_agent, trace, _root=False)
@@ -0,0 +1,363 @@
+"""
+Health Report Template
+
+This module renders the system health report (executive summary, one section
+per component and standard recommendations) directly from the collector tool
+results and the firing alerts. Rendering is deterministic and takes well
+under a millisecond, so a healthy system needs no model call; only the
+anomalies it lists are handed to a model for explanation.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# --- Constants ---
+# State keys the gatherers (and the disk forecaster) store their results in
+RESULT_KEYS = (
+    "cpu_info",
+    "memory_info",
+    "disk_info",
+    "net_info",
+    "io_info",
+    "disk_forecast",
+)
+SECTION_TITLES = {
+    "cpu_info": "CPU",
+    "memory_info": "Memory",
+    "disk_info": "Disk Space",
+    "net_info": "Network",
+    "io_info": "Disk I/O",
+    "disk_forecast": "Disk Forecast",
+}
+# Standard recommendation per alerting metric
+RECOMMENDATIONS = {
+    "cpu_percent": (
+        "Identify the processes using the most CPU (`top`, `ps -eo pcpu,comm`) "
+        "and consider more cores or a higher CPU quota if the load is expected."
+    ),
+    "memory_percent": (
+        "Find the largest memory consumers and check for leaks; add memory or "
+        "raise the memory limit if usage keeps growing."
+    ),
+    "swap_percent": (
+        "Heavy swapping slows the whole system; reduce memory pressure before "
+        "adding swap."
+    ),
+    "disk_percent": (
+        "Free space on {series}: rotate or compress logs, clear caches and old "
+        "artifacts, or grow the volume."
+    ),
+    "disk_busy_percent": (
+        "{series} is close to saturation; look for I/O-heavy processes "
+        "(`iotop`) or move hot data to faster storage."
+    ),
+    "net_errors_per_sec": (
+        "Check cabling, driver and duplex settings on {series}; persistent "
+        "errors or drops point at faulty hardware or an overloaded link."
+    ),
+}
+DEFAULT_RECOMMENDATION = "Investigate {metric} on {series}."
+SEVERITY_ORDER = {"critical": 0, "warning": 1}
+BUSIEST_CORES_SHOWN = 3
+
+
+def _bytes_per_sec(value: float) -> str:
+    for unit in ("B/s", "KB/s", "MB/s", "GB/s"):
+        if value < 1024 or unit == "GB/s":
+            return f"{value:.1f} {unit}"
+        value /= 1024
+
+
+def _table(header: List[str], rows: List[List[Any]]) -> List[str]:
+    lines = [
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join("---" for _ in header) + "|",
+    ]
+    lines.extend("| " + " | ".join(str(cell) for cell in row) + " |" for row in rows)
+    return lines
+
+
+def _cpu_section(result: Dict[str, Any]) -> List[str]:
+    if "per_core_percent" not in result:
+        # Container CPU (cgroup collector)
+        limit = result["cpu_limit_cores"]
+        return _table(
+            ["Metric", "Value"],
+            [
+                ["CPU quota", f"{limit:g} cores" if limit else "none"],
+                ["Cores available", f"{result['available_cores']:g}"],
+                ["Cores in use", f"{result['used_cores']:g}"],
+                ["Usage", f"{result['avg_usage_percent']}%"],
+                ["Throttled periods", f"{result['throttled_periods_percent']}%"],
+            ],
+        )
+    busiest = sorted(
+        enumerate(result["per_core_percent"]), key=lambda core: core[1], reverse=True
+    )[:BUSIEST_CORES_SHOWN]
+    return _table(
+        ["Metric", "Value"],
+        [
+            [
+                "Cores",
+                f"{result['physical_cores']} physical / "
+                f"{result['logical_cores']} logical",
+            ],
+            ["Average usage", f"{result['avg_usage_percent']}%"],
+            [
+                "Busiest cores",
+                ", ".join(f"core {core} ({usage}%)" for core, usage in busiest),
+            ],
+        ],
+    )
+
+
+def _memory_section(result: Dict[str, Any]) -> List[str]:
+    rows = [
+        ["Memory used", f"{result['used_gb']} GB of {result['total_gb']} GB"],
+        ["Memory usage", f"{result['memory_percent']}%"],
+        ["Available", f"{result['available_gb']} GB"],
+        ["Swap used", f"{result['swap_used_gb']} GB of {result['swap_total_gb']} GB"],
+        ["Swap usage", f"{result['swap_percent']}%"],
+    ]
+    if "memory_limit_set" in result:
+        rows.insert(
+            0, ["Memory limit set", "yes" if result["memory_limit_set"] else "no"]
+        )
+        rows.append(["Page cache", f"{result['page_cache_gb']} GB"])
+    return _table(["Metric", "Value"], rows)
+
+
+def _disk_section(result: Dict[str, Any]) -> List[str]:
+    return _table(
+        ["Mountpoint", "Device", "Filesystem", "Size", "Used", "Free", "Usage"],
+        [
+            [
+                partition["mountpoint"],
+                partition["device"],
+                partition["filesystem_type"],
+                f"{partition['total_gb']} GB",
+                f"{partition['used_gb']} GB",
+                f"{partition['free_gb']} GB",
+                f"{partition['percent']}%",
+            ]
+            for partition in result["partitions"]
+        ],
+    )
+
+
+def _network_section(result: Dict[str, Any]) -> List[str]:
+    if not result["interfaces"]:
+        return ["No network traffic in the last sample."]
+    return _table(
+        ["Interface", "Receive", "Transmit", "Errors/s", "Drops/s"],
+        [
+            [
+                name,
+                _bytes_per_sec(nic["rx_bytes_per_sec"]),
+                _bytes_per_sec(nic["tx_bytes_per_sec"]),
+                nic["errors_per_sec"],
+                nic["drops_per_sec"],
+            ]
+            for name, nic in result["interfaces"].items()
+        ],
+    )
+
+
+def _forecast_section(result: Dict[str, Any]) -> List[str]:
+    if not result["partitions"]:
+        return ["Not enough usage history yet (needs at least three samples)."]
+    return _table(
+        ["Mountpoint", "Usage", "Growth/day", "Days to full", "Fit (R²)", "Samples"],
+        [
+            [
+                forecast["mountpoint"],
+                f"{forecast['used_percent']}%",
+                f"{forecast['growth_gb_per_day']} GB",
+                (
+                    forecast["days_to_full"]
+                    if forecast["days_to_full"] is not None
+                    else "not growing"
+                ),
+                forecast["r_squared"],
+                forecast["samples"],
+            ]
+            for forecast in result["partitions"]
+        ],
+    )
+
+
+def _io_section(result: Dict[str, Any]) -> List[str]:
+    if not result["disks"]:
+        return ["No disk I/O in the last sample."]
+    return _table(
+        ["Disk", "Read", "Write", "Read IOPS", "Write IOPS", "Busy"],
+        [
+            [
+                name,
+                _bytes_per_sec(disk["read_bytes_per_sec"]),
+                _bytes_per_sec(disk["write_bytes_per_sec"]),
+                disk["read_iops"],
+                disk["write_iops"],
+                f"{disk['busy_percent']}%" if "busy_percent" in disk else "n/a",
+            ]
+            for name, disk in result["disks"].items()
+        ],
+    )
+
+
+SECTION_RENDERERS = {
+    "cpu_info": _cpu_section,
+    "memory_info": _memory_section,
+    "disk_info": _disk_section,
+    "net_info": _network_section,
+    "io_info": _io_section,
+    "disk_forecast": _forecast_section,
+}
+
+
+def find_anomalies(
+    results: Dict[str, Dict[str, Any]], alerts: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    List what needs a human (or model) explanation: firing alerts, failed
+    collectors, CPU quota throttling and partitions forecast to fill up.
+
+    Args:
+        results: Collector tool results keyed by result key (see
+            ``RESULT_KEYS``)
+        alerts: Firing alerts from the alert engine
+
+    Returns:
+        List[Dict[str, Any]]: One record per anomaly; empty when healthy
+    """
+    anomalies = [{"kind": "alert", **alert} for alert in alerts]
+    for key in SECTION_TITLES:
+        result = results.get(key, {}).get("result", {})
+        if "error" in result:
+            anomalies.append(
+                {"kind": "collector_error", "section": key, "error": result["error"]}
+            )
+    throttling = (
+        results.get("cpu_info", {}).get("additional_info", {}).get("throttling_concern")
+    )
+    if throttling:
+        anomalies.append({"kind": "cpu_throttling", "detail": throttling})
+    forecast = results.get("disk_forecast", {}).get("result", {})
+    days_to_full = {
+        partition["mountpoint"]: partition["days_to_full"]
+        for partition in forecast.get("partitions", [])
+    }
+    for mountpoint in forecast.get("filling_soon", []):
+        anomalies.append(
+            {
+                "kind": "disk_filling",
+                "mountpoint": mountpoint,
+                "days_to_full": days_to_full.get(mountpoint),
+            }
+        )
+    return anomalies
+
+
+def render_report(
+    results: Dict[str, Dict[str, Any]],
+    alerts: List[Dict[str, Any]],
+    generated_at: Optional[datetime] = None,
+) -> str:
+    """
+    Render the markdown health report.
+
+    Args:
+        results: Collector tool results keyed by result key (see
+            ``RESULT_KEYS``); missing sections are left out
+        alerts: Firing alerts from the alert engine
+        generated_at: Report time (defaults to now)
+
+    Returns:
+        str: The report in markdown
+    """
+    generated_at = generated_at or datetime.now()
+    anomalies = find_anomalies(results, alerts)
+    alerts = sorted(alerts, key=lambda alert: SEVERITY_ORDER.get(alert["severity"], 2))
+
+    if any(alert["severity"] == "critical" for alert in alerts):
+        status = "Critical"
+    elif anomalies:
+        status = "Warning"
+    else:
+        status = "Healthy"
+
+    lines = [
+        "# System Health Report",
+        f"_Generated {generated_at:%Y-%m-%d %H:%M:%S}_",
+        "",
+        "## Executive Summary",
+        f"**Overall status: {status}**",
+        "",
+    ]
+    reported = [key for key in SECTION_TITLES if key in results]
+    if not anomalies:
+        lines.append(
+            f"All {len(reported)} collectors reported and no alert rules are firing."
+        )
+    for alert in alerts:
+        series = f" on {alert['series']}" if alert["series"] else ""
+        lines.append(
+            f"- **{alert['severity'].upper()}** {alert['rule']}{series}: "
+            f"{alert['metric']} is {alert['value']} "
+            f"({alert['comparator']} {alert['threshold']})"
+        )
+    for anomaly in anomalies:
+        if anomaly["kind"] == "collector_error":
+            lines.append(
+                f"- **ERROR** {SECTION_TITLES[anomaly['section']]} collection "
+                f"failed: {anomaly['error']}"
+            )
+        elif anomaly["kind"] == "cpu_throttling":
+            lines.append(f"- **WARNING** {anomaly['detail']}")
+        elif anomaly["kind"] == "disk_filling":
+            when = (
+                f"in about {anomaly['days_to_full']} days"
+                if anomaly["days_to_full"] is not None
+                else "soon"
+            )
+            lines.append(
+                f"- **WARNING** {anomaly['mountpoint']} is forecast to be full {when}"
+            )
+
+    for key in reported:
+        lines.extend(["", f"## {SECTION_TITLES[key]}"])
+        result = results[key]["result"]
+        if "error" in result:
+            lines.append(f"Not available: {result['error']}")
+        else:
+            lines.extend(SECTION_RENDERERS[key](result))
+
+    lines.extend(["", "## Recommendations"])
+    if not anomalies:
+        lines.append("- No action needed. Keep monitoring for changes in trend.")
+    for alert in alerts:
+        template = RECOMMENDATIONS.get(alert["metric"], DEFAULT_RECOMMENDATION)
+        lines.append(
+            "- "
+            + template.format(
+                metric=alert["metric"], series=alert["series"] or "this host"
+            )
+        )
+    if any(anomaly["kind"] == "collector_error" for anomaly in anomalies):
+        lines.append(
+            "- Fix the failed collectors (permissions, missing devices) so the "
+            "next report is complete."
+        )
+    if any(anomaly["kind"] == "cpu_throttling" for anomaly in anomalies):
+        lines.append(
+            "- Raise the container's CPU quota or spread the load; throttling "
+            "adds latency even when average usage looks low."
+        )
+    for anomaly in anomalies:
+        if anomaly["kind"] == "disk_filling":
+            lines.append(
+                f"- {anomaly['mountpoint']} keeps growing: find what is writing "
+                "to it (`du -xh --max-depth=2`) and free or add space before "
+                "it fills up."
+            )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,58 @@
+"""
+Collector Result Schemas
+
+Typed shapes of the ``result`` section returned by the collector tools. All
+values are plain numbers (sizes in GB, usage in percent) so they can be
+compared and aggregated directly; units are added only when a report is
+written.
+"""
+
+from typing import List, Optional, TypedDict
+
+
+class CpuInfo(TypedDict):
+    physical_cores: int
+    logical_cores: int
+    avg_usage_percent: float
+    # One integer percentage per logical core, in core order
+    per_core_percent: List[int]
+
+
+class MemoryInfo(TypedDict):
+    total_gb: float
+    available_gb: float
+    used_gb: float
+    memory_percent: float
+    swap_total_gb: float
+    swap_used_gb: float
+    swap_percent: float
+
+
+class PartitionInfo(TypedDict):
+    device: str
+    mountpoint: str
+    filesystem_type: str
+    total_gb: float
+    used_gb: float
+    free_gb: float
+    percent: float
+
+
+class DiskInfo(TypedDict):
+    partitions: List[PartitionInfo]
+
+
+class ContainerCpuInfo(TypedDict):
+    # None when the cgroup has no CPU quota
+    cpu_limit_cores: Optional[float]
+    # Cores the cgroup may use: the quota, or the CPUs it is allowed to run on
+    available_cores: float
+    used_cores: float
+    avg_usage_percent: float
+    throttled_periods_percent: float
+
+
+class ContainerMemoryInfo(MemoryInfo):
+    # used_gb is the working set (usage minus reclaimable inactive page cache)
+    memory_limit_set: bool
+    page_cache_gb: float
@@ -1,3 +1,15 @@
 """Subagents for the system monitor pipeline."""
 
-from . import cpu_info_agent, disk_info_agent, memory_info_agent, synthesizer_agent
+from . import (
+    alert_evaluator_agent,
+    container_info_agent,
+    cpu_info_agent,
+    disk_forecast_agent,
+    disk_info_agent,
+    disk_io_agent,
+    fleet_info_agent,
+    health_report_agent,
+    memory_info_agent,
+    network_info_agent,
+    synthesizer_agent,
+)
@@ -0,0 +1,3 @@
+"""Alert evaluator agent for system monitoring."""
+
+from .agent import alert_evaluator_agent
@@ -0,0 +1,38 @@
+"""
+Alert Evaluator Agent
+
+This agent exposes the alerts fired by the collector tools to the
+synthesizer as state. It runs no model and evaluates nothing again: each
+collector evaluated the rules of the metrics it recorded, and the fired state
+of every (rule, series) pair is read back with ``ALERT_ENGINE.active()``.
+"""
+
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from ...alerts import ALERT_ENGINE
+
+
+class AlertEvaluatorAgent(BaseAgent):
+    """Writes the currently firing alerts to the ``alerts`` state key."""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        alerts = ALERT_ENGINE.active()
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={"alerts": alerts}),
+        )
+
+
+# Alert Evaluator Agent
+alert_evaluator_agent = AlertEvaluatorAgent(
+    name="AlertEvaluator",
+    description="Evaluates alert rules against the collected metrics",
+)
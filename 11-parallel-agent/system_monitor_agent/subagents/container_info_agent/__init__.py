@@ -0,0 +1,7 @@
+"""cgroup-aware container info agents for system monitoring."""
+
+from .agent import (
+    container_cpu_info_agent,
+    container_io_agent,
+    container_memory_info_agent,
+)
@@ -0,0 +1,39 @@
+"""
+Container Information Agents
+
+These agents gather the CPU, memory and disk I/O usage of the container the
+monitor runs in, without a model call. They replace the host-wide CPU, memory
+and disk I/O agents in the gatherer when the monitor runs inside a cgroup
+with resource limits.
+"""
+
+from ...collector_agent import CollectorAgent
+from .tools import (
+    get_container_cpu_info,
+    get_container_io_info,
+    get_container_memory_info,
+)
+
+# Container CPU Information Agent
+container_cpu_info_agent = CollectorAgent(
+    name="ContainerCpuInfoAgent",
+    description="Gathers container CPU usage from its cgroup",
+    collector=get_container_cpu_info,
+    output_key="cpu_info",
+)
+
+# Container Memory Information Agent
+container_memory_info_agent = CollectorAgent(
+    name="ContainerMemoryInfoAgent",
+    description="Gathers container memory usage from its cgroup",
+    collector=get_container_memory_info,
+    output_key="memory_info",
+)
+
+# Container Disk I/O Information Agent
+container_io_agent = CollectorAgent(
+    name="ContainerIoAgent",
+    description="Gathers container disk I/O throughput from its cgroup",
+    collector=get_container_io_info,
+    output_key="io_info",
+)
@@ -0,0 +1,245 @@
+"""
+Container Information Tools
+
+This module provides tools for gathering CPU, memory and disk I/O usage of
+the container the monitor runs in, read from its cgroup. Outside a cgroup
+they fall back to the host-wide psutil tools.
+"""
+
+import os
+import time
+from typing import Any, Dict
+
+import psutil
+
+from ...alerts import ALERT_ENGINE
+from ...cgroups import CpuCounters, IoCounters, current_cgroup
+from ...counters import CounterRateTracker
+from ...schemas import ContainerCpuInfo, ContainerMemoryInfo
+from ..cpu_info_agent.tools import get_cpu_info
+from ..disk_io_agent.tools import get_disk_io_info
+from ..memory_info_agent.tools import get_memory_info
+
+# --- Constants ---
+GB = 1024**3
+USEC_PER_SEC = 1_000_000
+
+# The same reader the root agent chose the collectors with
+_cgroup = current_cgroup()
+_cpu_tracker = CounterRateTracker(
+    sampler=lambda: {"cgroup": _cgroup.cpu_counters()},
+    fields=CpuCounters._fields,
+)
+_io_tracker = CounterRateTracker(
+    sampler=lambda: _cgroup.io_counters(),
+    fields=IoCounters._fields,
+)
+
+
+def _source() -> str:
+    return f"cgroup v{_cgroup.version}"
+
+
+def _allowed_cpus() -> int:
+    """CPUs this process may run on (respects cpusets), or all logical CPUs."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return psutil.cpu_count(logical=True)
+
+
+def get_container_cpu_info() -> Dict[str, Any]:
+    """
+    Gather CPU usage of this container relative to its CPU quota.
+
+    Returns:
+        Dict[str, Any]: Dictionary with container CPU information structured for ADK
+    """
+    if _cgroup is None:
+        return get_cpu_info()
+    try:
+        rates, interval = _cpu_tracker.rates()
+        rate = rates["cgroup"]
+
+        limit_cores = _cgroup.cpu_limit_cores()
+        available_cores = limit_cores or _allowed_cpus()
+        used_cores = rate["usage_usec"] / USEC_PER_SEC
+        throttled_percent = (
+            rate["nr_throttled"] / rate["nr_periods"] * 100
+            if rate["nr_periods"]
+            else 0.0
+        )
+
+        cpu_info: ContainerCpuInfo = {
+            "cpu_limit_cores": limit_cores,
+            "available_cores": available_cores,
+            "used_cores": round(used_cores, 2),
+            "avg_usage_percent": round(used_cores / available_cores * 100, 1),
+            "throttled_periods_percent": round(throttled_percent, 1),
+        }
+
+        avg_usage = cpu_info["avg_usage_percent"]
+        ALERT_ENGINE.record("cpu_percent", avg_usage)
+        high_usage = bool(ALERT_ENGINE.evaluate(metrics=["cpu_percent"]))
+
+        # Format for ADK tool return structure
+        return {
+            "result": cpu_info,
+            "stats": {
+                "cpu_limit_cores": limit_cores,
+                "avg_usage_percentage": avg_usage,
+                "high_usage_alert": high_usage,
+            },
+            "additional_info": {
+                "data_format": "dictionary",
+                "collection_timestamp": time.time(),
+                "source": _source(),
+                "sample_interval_sec": round(interval, 3),
+                "performance_concern": (
+                    "High CPU usage detected" if high_usage else None
+                ),
+                "throttling_concern": (
+                    f"CPU quota throttled in {throttled_percent:.1f}% of periods"
+                    if throttled_percent
+                    else None
+                ),
+            },
+        }
+    except Exception as e:
+        return {
+            "result": {
+                "error": f"Failed to gather container CPU information: {str(e)}"
+            },
+            "stats": {"success": False},
+            "additional_info": {"error_type": str(type(e).__name__)},
+        }
+
+
+def get_container_memory_info() -> Dict[str, Any]:
+    """
+    Gather memory usage of this container relative to its memory limit.
+
+    Returns:
+        Dict[str, Any]: Dictionary with container memory information structured for ADK
+    """
+    if _cgroup is None:
+        return get_memory_info()
+    try:
+        memory = _cgroup.memory_bytes()
+        # Without a limit the container can use all of the host's memory
+        total = memory["limit"] or psutil.virtual_memory().total
+        swap_total = memory["swap_limit"]
+        if swap_total is None:
+            swap_total = psutil.swap_memory().total
+        working_set = memory["working_set"]
+
+        memory_info: ContainerMemoryInfo = {
+            "total_gb": round(total / GB, 2),
+            "available_gb": round(max(total - working_set, 0) / GB, 2),
+            "used_gb": round(working_set / GB, 2),
+            "memory_percent": round(working_set / total * 100, 1),
+            "swap_total_gb": round(swap_total / GB, 2),
+            "swap_used_gb": round(memory["swap_usage"] / GB, 2),
+            "swap_percent": (
+                round(memory["swap_usage"] / swap_total * 100, 1) if swap_total else 0.0
+            ),
+            "memory_limit_set": memory["limit"] is not None,
+            "page_cache_gb": round((memory["usage"] - working_set) / GB, 2),
+        }
+
+        memory_usage = memory_info["memory_percent"]
+        swap_usage = memory_info["swap_percent"]
+        ALERT_ENGINE.record("memory_percent", memory_usage)
+        ALERT_ENGINE.record("swap_percent", swap_usage)
+        alerting_metrics = {
+            alert["metric"]
+            for alert in ALERT_ENGINE.evaluate(
+                metrics=["memory_percent", "swap_percent"]
+            )
+        }
+
+        # Format for ADK tool return structure
+        return {
+            "result": memory_info,
+            "stats": {
+                "memory_usage_percentage": memory_usage,
+                "swap_usage_percentage": swap_usage,
+            },
+            "additional_info": {
+                "data_format": "dictionary",
+                "collection_timestamp": time.time(),
+                "source": _source(),
+                "performance_concern": (
+                    "High memory usage detected"
+                    if "memory_percent" in alerting_metrics
+                    else None
+                ),
+                "swap_concern": (
+                    "High swap usage detected"
+                    if "swap_percent" in alerting_metrics
+                    else None
+                ),
+            },
+        }
+    except Exception as e:
+        return {
+            "result": {
+                "error": f"Failed to gather container memory information: {str(e)}"
+            },
+            "stats": {"success": False},
+            "additional_info": {"error_type": str(type(e).__name__)},
+        }
+
+
+def get_container_io_info() -> Dict[str, Any]:
+    """
+    Gather per-disk read/write rates of this container.
+
+    Returns:
+        Dict[str, Any]: Dictionary with container disk I/O information structured for ADK
+    """
+    if _cgroup is None:
+        return get_disk_io_info()
+    try:
+        rates, interval = _io_tracker.rates()
+
+        disks = {}
+        idle_disks = []
+        for name, rate in sorted(rates.items()):
+            if not any(rate.values()):
+                idle_disks.append(name)
+                continue
+            disks[name] = {
+                "read_bytes_per_sec": round(rate["read_bytes"], 1),
+                "write_bytes_per_sec": round(rate["write_bytes"], 1),
+                "read_iops": round(rate["read_count"], 1),
+                "write_iops": round(rate["write_count"], 1),
+            }
+
+        # Format for ADK tool return structure
+        return {
+            "result": {"disks": disks},
+            "stats": {
+                "active_disk_count": len(disks),
+                "total_read_bytes_per_sec": round(
+                    sum(disk["read_bytes_per_sec"] for disk in disks.values()), 1
+                ),
+                "total_write_bytes_per_sec": round(
+                    sum(disk["write_bytes_per_sec"] for disk in disks.values()), 1
+                ),
+            },
+            "additional_info": {
+                "data_format": "dictionary",
+                "collection_timestamp": time.time(),
+                "source": _source(),
+                "sample_interval_sec": round(interval, 3),
+                "idle_disks": idle_disks or None,
+            },
+        }
+    except Exception as e:
+        return {
+            "result": {
+                "error": f"Failed to gather container disk I/O information: {str(e)}"
+            },
+            "stats": {"success": False},
+            "additional_info": {"error_type": str(type(e).__name__)},
+        }
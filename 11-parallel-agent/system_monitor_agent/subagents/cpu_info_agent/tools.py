@@ -4,11 +4,47 @@ CPU Information Tool
 This module provides a tool for gathering CPU information.
 """
 
+import threading
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import psutil
 
+from ...alerts import ALERT_ENGINE
+from ...schemas import CpuInfo
+
+# --- Constants ---
+# Same rules as the network and disk I/O rate trackers (counters.py)
+CPU_SAMPLE_MIN_INTERVAL_SEC = 1.0
+CPU_SAMPLE_MAX_AGE_SEC = 300.0
+
+_cpu_sample_lock = threading.Lock()
+_last_cpu_sample = None
+
+
+def _per_core_usage() -> List[float]:
+    """
+    Per-core usage since the previous call.
+
+    ``psutil.cpu_percent(interval=None)`` measures since its previous call.
+    The first call (or one after the previous sample went stale) primes it
+    and waits CPU_SAMPLE_MIN_INTERVAL_SEC; later calls only wait if the
+    previous sample is more recent than that, so periodic runs return at
+    once instead of sampling for a second every time.
+    """
+    global _last_cpu_sample
+    with _cpu_sample_lock:
+        now = time.monotonic()
+        if _last_cpu_sample is None or now - _last_cpu_sample > CPU_SAMPLE_MAX_AGE_SEC:
+            psutil.cpu_percent(interval=None, percpu=True)
+            _last_cpu_sample = now
+        elapsed = now - _last_cpu_sample
+        if elapsed < CPU_SAMPLE_MIN_INTERVAL_SEC:
+            time.sleep(CPU_SAMPLE_MIN_INTERVAL_SEC - elapsed)
+        usage = psutil.cpu_percent(interval=None, percpu=True)
+        _last_cpu_sample = time.monotonic()
+        return usage
+
 
 def get_cpu_info() -> Dict[str, Any]:
     """
@@ -19,22 +55,26 @@ def get_cpu_info() -> Dict[str, Any]:
     """
     try:
         # Get CPU information - optimize by calling cpu_percent only once
-        cpu_percent_per_core = psutil.cpu_percent(interval=1, percpu=True)
-        avg_cpu_usage = psutil.cpu_percent(interval=0)  # Use cached value from previous call
-        
-        cpu_info = {
+        cpu_percent_per_core = _per_core_usage()
+        # Average of the same one-second sample, so it agrees with the cores
+        # (psutil tracks per-core and aggregate calls separately)
+        avg_cpu_usage = sum(cpu_percent_per_core) / len(cpu_percent_per_core)
+
+        # Per-core values are whole percentages in core order, which keeps
+        # the array short on hosts with many cores
+        cpu_info: CpuInfo = {
             "physical_cores": psutil.cpu_count(logical=False),
             "logical_cores": psutil.cpu_count(logical=True),
-            "cpu_usage_per_core": [
-                f"Core {i}: {percentage:.1f}%"
-                for i, percentage in enumerate(cpu_percent_per_core)
+            "avg_usage_percent": round(avg_cpu_usage, 1),
+            "per_core_percent": [
+                round(percentage) for percentage in cpu_percent_per_core
             ],
-            "avg_cpu_usage": f"{avg_cpu_usage:.1f}%",
         }
 
         # Calculate some stats for the result summary
-        avg_usage = float(cpu_info["avg_cpu_usage"].strip("%"))
-        high_usage = avg_usage > 80
+        avg_usage = cpu_info["avg_usage_percent"]
+        ALERT_ENGINE.record("cpu_percent", avg_usage)
+        high_usage = bool(ALERT_ENGINE.evaluate(metrics=["cpu_percent"]))
 
         # Format for ADK tool return structure
         return {
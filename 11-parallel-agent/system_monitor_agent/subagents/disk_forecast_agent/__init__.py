@@ -0,0 +1,3 @@
+"""Disk-full forecast agent for system monitoring."""
+
+from .agent import disk_forecast_agent
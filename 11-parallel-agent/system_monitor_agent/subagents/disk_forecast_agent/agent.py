@@ -0,0 +1,36 @@
+"""
+Disk Forecast Agent
+
+This agent fits the disk usage history recorded by the disk collector and
+exposes the time-to-full forecast as the ``disk_forecast`` state key. It runs
+no model; the fit covers every partition in one batch.
+"""
+
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from .tools import get_disk_forecast
+
+
+class DiskForecastAgent(BaseAgent):
+    """Writes the disk-full forecast to the ``disk_forecast`` state key."""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={"disk_forecast": get_disk_forecast()}),
+        )
+
+
+# Disk Forecast Agent
+disk_forecast_agent = DiskForecastAgent(
+    name="DiskForecaster",
+    description="Forecasts when each partition will be full",
+)
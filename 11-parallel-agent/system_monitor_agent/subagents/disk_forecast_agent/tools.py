@@ -0,0 +1,78 @@
+"""
+Disk Forecast Tool
+
+This module provides a tool that forecasts when each partition will be full,
+from the usage history the disk collector keeps.
+"""
+
+import time
+from typing import Any, Dict
+
+from ...forecast import DEFAULT_WINDOW_SEC, DISK_HISTORY, SECONDS_PER_DAY
+
+# --- Constants ---
+# Partitions forecast to be full within this many days are flagged
+FORECAST_HORIZON_DAYS = 7
+# Keep the output small on hosts with hundreds of partitions
+MAX_PARTITIONS_LISTED = 10
+
+
+def get_disk_forecast() -> Dict[str, Any]:
+    """
+    Forecast growth rate and time-to-full for every partition.
+
+    Returns:
+        Dict[str, Any]: Dictionary with disk forecast information structured for ADK
+    """
+    try:
+        forecasts = DISK_HISTORY.forecast()
+
+        # Soonest to fill first, then fastest growing
+        forecasts.sort(
+            key=lambda forecast: (
+                forecast["days_to_full"] is None,
+                forecast["days_to_full"] or 0,
+                -forecast["growth_gb_per_day"],
+            )
+        )
+        filling_soon = [
+            forecast["mountpoint"]
+            for forecast in forecasts
+            if forecast["days_to_full"] is not None
+            and forecast["days_to_full"] <= FORECAST_HORIZON_DAYS
+        ]
+
+        # Format for ADK tool return structure
+        return {
+            "result": {
+                "partitions": forecasts[:MAX_PARTITIONS_LISTED],
+                "filling_soon": filling_soon,
+            },
+            "stats": {
+                "partitions_forecast": len(forecasts),
+                "growing_partitions": sum(
+                    1 for forecast in forecasts if forecast["growth_gb_per_day"] > 0
+                ),
+                "partitions_full_within_horizon": len(filling_soon),
+            },
+            "additional_info": {
+                "data_format": "dictionary",
+                "collection_timestamp": time.time(),
+                "horizon_days": FORECAST_HORIZON_DAYS,
+                "window_days": DEFAULT_WINDOW_SEC / SECONDS_PER_DAY,
+                "history_hours": round(DISK_HISTORY.span_sec / 3600, 1),
+                "partitions_omitted": max(len(forecasts) - MAX_PARTITIONS_LISTED, 0),
+                "forecast_concern": (
+                    f"Forecast to be full within {FORECAST_HORIZON_DAYS} days: "
+                    f"{', '.join(filling_soon)}"
+                    if filling_soon
+                    else None
+                ),
+            },
+        }
+    except Exception as e:
+        return {
+            "result": {"error": f"Failed to forecast disk usage: {str(e)}"},
+            "stats": {"success": False},
+            "additional_info": {"error_type": str(type(e).__name__)},
+        }
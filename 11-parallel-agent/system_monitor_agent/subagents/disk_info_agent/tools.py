@@ -9,6 +9,13 @@ from typing import Any, Dict
 
 import psutil
 
+from ...alerts import ALERT_ENGINE
+from ...forecast import DISK_HISTORY, persist_history
+from ...schemas import DiskInfo
+
+# --- Constants ---
+GB = 1024**3
+
 
 def get_disk_info() -> Dict[str, Any]:
     """
@@ -19,40 +26,53 @@ def get_disk_info() -> Dict[str, Any]:
     """
     try:
         # Get disk information
-        disk_info = {"partitions": []}
-        partitions_over_threshold = []
+        disk_info: DiskInfo = {"partitions": []}
         total_space = 0
         used_space = 0
+        used_bytes = {}
+        total_bytes = {}
 
         for partition in psutil.disk_partitions():
             try:
                 partition_usage = psutil.disk_usage(partition.mountpoint)
 
-                # Track high usage partitions
-                if partition_usage.percent > 85:
-                    partitions_over_threshold.append(
-                        f"{partition.mountpoint} ({partition_usage.percent:.1f}%)"
-                    )
-
                 # Add to totals
                 total_space += partition_usage.total
                 used_space += partition_usage.used
+                used_bytes[partition.mountpoint] = partition_usage.used
+                total_bytes[partition.mountpoint] = partition_usage.total
 
                 disk_info["partitions"].append(
                     {
                         "device": partition.device,
                         "mountpoint": partition.mountpoint,
                         "filesystem_type": partition.fstype,
-                        "total_size": f"{partition_usage.total / (1024 ** 3):.2f} GB",
-                        "used": f"{partition_usage.used / (1024 ** 3):.2f} GB",
-                        "free": f"{partition_usage.free / (1024 ** 3):.2f} GB",
-                        "percentage": f"{partition_usage.percent:.1f}%",
+                        "total_gb": round(partition_usage.total / GB, 2),
+                        "used_gb": round(partition_usage.used / GB, 2),
+                        "free_gb": round(partition_usage.free / GB, 2),
+                        "percent": round(partition_usage.percent, 1),
                     }
                 )
             except (PermissionError, FileNotFoundError):
                 # Some partitions may not be accessible
                 pass
 
+        # Keep the usage history the disk forecast is fitted to
+        if DISK_HISTORY.record(used_bytes, total_bytes):
+            persist_history(DISK_HISTORY)
+
+        # Track high usage partitions
+        ALERT_ENGINE.record_many(
+            "disk_percent",
+            {
+                partition["mountpoint"]: partition["percent"]
+                for partition in disk_info["partitions"]
+            },
+        )
+        partitions_over_threshold = [
+            alert["series"] for alert in ALERT_ENGINE.evaluate(metrics=["disk_percent"])
+        ]
+
         # Calculate overall disk stats
         overall_usage_percent = (
             (used_space / total_space * 100) if total_space > 0 else 0
@@ -63,9 +83,9 @@ def get_disk_info() -> Dict[str, Any]:
             "result": disk_info,
             "stats": {
                 "partition_count": len(disk_info["partitions"]),
-                "total_space_gb": total_space / (1024**3),
-                "used_space_gb": used_space / (1024**3),
-                "overall_usage_percent": overall_usage_percent,
+                "total_space_gb": round(total_space / GB, 2),
+                "used_space_gb": round(used_space / GB, 2),
+                "overall_usage_percent": round(overall_usage_percent, 1),
                 "partitions_with_high_usage": len(partitions_over_threshold),
             },
             "additional_info": {
@@ -0,0 +1,3 @@
+"""Disk I/O agent for system monitoring."""
+
+from .agent import disk_io_agent
@@ -0,0 +1,18 @@
+"""
+Disk I/O Information Agent
+
+This agent is responsible for gathering disk I/O throughput. It calls the collector tool
+directly, without a model call, and stores its result in the ``io_info`` state
+key for the health report.
+"""
+
+from ...collector_agent import CollectorAgent
+from .tools import get_disk_io_info
+
+# Disk I/O Information Agent
+disk_io_agent = CollectorAgent(
+    name="DiskIoAgent",
+    description="Gathers disk I/O throughput information",
+    collector=get_disk_io_info,
+    output_key="io_info",
+)
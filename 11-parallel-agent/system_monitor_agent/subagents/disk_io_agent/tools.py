@@ -0,0 +1,95 @@
+"""
+Disk I/O Information Tool
+
+This module provides a tool for gathering per-disk I/O throughput information.
+"""
+
+import sys
+import time
+from typing import Any, Dict
+
+import psutil
+
+from ...alerts import ALERT_ENGINE
+from ...counters import CounterRateTracker
+
+# --- Constants ---
+DISK_COUNTER_FIELDS = ("read_bytes", "write_bytes", "read_count", "write_count")
+# busy_time (milliseconds spent doing I/O) is only reported on Linux
+if sys.platform.startswith("linux"):
+    DISK_COUNTER_FIELDS += ("busy_time",)
+
+# Counters are diffed by the tracker itself, so psutil's wrap handling is off
+_disk_io_tracker = CounterRateTracker(
+    sampler=lambda: psutil.disk_io_counters(perdisk=True, nowrap=False) or {},
+    fields=DISK_COUNTER_FIELDS,
+)
+
+
+def get_disk_io_info() -> Dict[str, Any]:
+    """
+    Gather per-disk read/write throughput and utilization rates.
+
+    Returns:
+        Dict[str, Any]: Dictionary with disk I/O information structured for ADK
+    """
+    try:
+        rates, interval = _disk_io_tracker.rates()
+
+        disks = {}
+        idle_disks = []
+        busy_percent = {}
+        for name, rate in sorted(rates.items()):
+            if "busy_time" in rate:
+                # busy_time advances in milliseconds per elapsed second
+                busy_percent[name] = round(min(rate["busy_time"] / 10, 100.0), 1)
+            if not any(rate.values()):
+                idle_disks.append(name)
+                continue
+            disk = {
+                "read_bytes_per_sec": round(rate["read_bytes"], 1),
+                "write_bytes_per_sec": round(rate["write_bytes"], 1),
+                "read_iops": round(rate["read_count"], 1),
+                "write_iops": round(rate["write_count"], 1),
+            }
+            if name in busy_percent:
+                disk["busy_percent"] = busy_percent[name]
+            disks[name] = disk
+
+        ALERT_ENGINE.record_many("disk_busy_percent", busy_percent)
+        saturated_disks = [
+            alert["series"]
+            for alert in ALERT_ENGINE.evaluate(metrics=["disk_busy_percent"])
+        ]
+
+        # Format for ADK tool return structure
+        return {
+            "result": {"disks": disks},
+            "stats": {
+                "active_disk_count": len(disks),
+                "total_read_bytes_per_sec": round(
+                    sum(disk["read_bytes_per_sec"] for disk in disks.values()), 1
+                ),
+                "total_write_bytes_per_sec": round(
+                    sum(disk["write_bytes_per_sec"] for disk in disks.values()), 1
+                ),
+                "saturated_disk_count": len(saturated_disks),
+            },
+            "additional_info": {
+                "data_format": "dictionary",
+                "collection_timestamp": time.time(),
+                "sample_interval_sec": round(interval, 3),
+                "idle_disks": idle_disks or None,
+                "io_concern": (
+                    f"Disks near saturation: {', '.join(saturated_disks)}"
+                    if saturated_disks
+                    else None
+                ),
+            },
+        }
+    except Exception as e:
+        return {
+            "result": {"error": f"Failed to gather disk I/O information: {str(e)}"},
+            "stats": {"success": False},
+            "additional_info": {"error_type": str(type(e).__name__)},
+        }
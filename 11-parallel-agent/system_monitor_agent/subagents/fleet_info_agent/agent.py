@@ -0,0 +1,42 @@
+"""
+Fleet Information Agent
+
+This agent is responsible for gathering and analyzing a summary of many hosts.
+"""
+
+from google.adk.agents import LlmAgent
+
+from .tools import get_fleet_info
+
+# --- Constants ---
+GEMINI_MODEL = "gemini-2.0-flash"
+
+# Fleet Information Agent
+fleet_info_agent = LlmAgent(
+    name="FleetInfoAgent",
+    model=GEMINI_MODEL,
+    instruction="""You are a Fleet Information Agent.
+    
+    When asked for system information, you should:
+    1. Use the 'get_fleet_info' tool to gather the fleet summary
+    2. Analyze the returned dictionary data
+    3. Format this information into a concise, clear section of a fleet report
+    
+    The tool will return a dictionary with:
+    - result: Per-resource distributions (cpu, memory, disk), the worst hosts
+      per resource and the hosts that could not be reached
+    - stats: Host counts and polling latency
+    - additional_info: Context about the data collection
+    
+    Format your response as a well-structured report section with:
+    - How many hosts were polled and how many answered
+    - CPU, memory and disk usage across the fleet (average, p95, max)
+    - The worst hosts for each resource
+    - Unreachable hosts and their errors
+    
+    IMPORTANT: You MUST call the get_fleet_info tool. Do not make up information.
+    """,
+    description="Gathers and analyzes a summary of many hosts",
+    tools=[get_fleet_info],
+    output_key="fleet_info",
+)
@@ -0,0 +1,62 @@
+"""
+Fleet Information Tool
+
+This module provides a tool for gathering a summary of many hosts at once.
+"""
+
+import asyncio
+import os
+import weakref
+from typing import Any, Dict, List
+
+from ...fleet import ConnectionPool, collect_fleet
+from ...fleet.collector import DEFAULT_MAX_PER_ORIGIN, DEFAULT_TIMEOUT
+
+# Connections are bound to the event loop that opened them, so keep one pool
+# per loop and reuse it (and its keep-alive connections) across calls. Keyed
+# weakly on the loop itself: a pool goes away with its loop, and a new loop
+# that happens to get a freed loop's id() never sees that loop's pool
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ConnectionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_for(loop: asyncio.AbstractEventLoop) -> ConnectionPool:
+    """The loop's pool, created on first use."""
+    # A closed loop's connections can no longer be used (or closed), so drop
+    # them now instead of waiting for the loop to be garbage collected
+    for other in [other for other in _pools if other.is_closed()]:
+        del _pools[other]
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = ConnectionPool(DEFAULT_MAX_PER_ORIGIN)
+    return pool
+
+
+def fleet_endpoints() -> List[str]:
+    """Read the comma-separated host endpoints from SYSTEM_MONITOR_FLEET_HOSTS."""
+    hosts = os.getenv("SYSTEM_MONITOR_FLEET_HOSTS", "")
+    return [host.strip() for host in hosts.split(",") if host.strip()]
+
+
+async def get_fleet_info() -> Dict[str, Any]:
+    """
+    Gather a summary of CPU, memory and disk usage across all fleet hosts.
+
+    Returns:
+        Dict[str, Any]: Dictionary with fleet information structured for ADK
+    """
+    try:
+        endpoints = fleet_endpoints()
+        if not endpoints:
+            raise ValueError("SYSTEM_MONITOR_FLEET_HOSTS is not set")
+        timeout = float(os.getenv("SYSTEM_MONITOR_FLEET_TIMEOUT", DEFAULT_TIMEOUT))
+
+        pool = _pool_for(asyncio.get_running_loop())
+        return await collect_fleet(endpoints, timeout=timeout, pool=pool)
+    except Exception as e:
+        return {
+            "result": {"error": f"Failed to gather fleet information: {str(e)}"},
+            "stats": {"success": False},
+            "additional_info": {"error_type": str(type(e).__name__)},
+        }
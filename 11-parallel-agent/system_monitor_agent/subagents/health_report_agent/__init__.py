@@ -0,0 +1,3 @@
+"""Template-rendered health report agent for system monitoring."""
+
+from .agent import health_report_agent
@@ -0,0 +1,79 @@
+"""
+Health Report Agent
+
+This agent renders the system health report from the collector results the
+gatherers stored in session state, with a template, without a model call.
+Only when the report lists anomalies (firing alerts, failed collectors, CPU
+throttling, disks filling up) does it run the AnomalyExplainer and append its
+explanation to the report.
+"""
+
+from typing import Any, AsyncGenerator, Dict
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from ...report import RESULT_KEYS, find_anomalies, render_report
+from ..synthesizer_agent import anomaly_explainer
+
+
+def collected_results(ctx: InvocationContext) -> Dict[str, Dict[str, Any]]:
+    """The collector results of this run, keyed by result key."""
+    return {
+        key: ctx.session.state[key]
+        for key in RESULT_KEYS
+        if isinstance(ctx.session.state.get(key), dict)
+    }
+
+
+class HealthReportAgent(BaseAgent):
+    """Renders the report; calls the explainer sub-agent only for anomalies."""
+
+    explainer: LlmAgent
+
+    def __init__(self, name: str, explainer: LlmAgent, description: str = ""):
+        super().__init__(
+            name=name,
+            explainer=explainer,
+            sub_agents=[explainer],
+            description=description,
+        )
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        results = collected_results(ctx)
+        alerts = ctx.session.state.get("alerts", [])
+        report = render_report(results, alerts)
+        anomalies = find_anomalies(results, alerts)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(
+                state_delta={"health_report": report, "anomalies": anomalies}
+            ),
+        )
+
+        if anomalies:
+            async for event in self.explainer.run_async(ctx):
+                yield event
+            explanation = ctx.session.state.get("anomaly_explanation", "")
+            report = f"{report}\n{explanation}\n"
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=report)]),
+        )
+
+
+# Health Report Agent
+health_report_agent = HealthReportAgent(
+    name="HealthReport",
+    explainer=anomaly_explainer,
+    description="Renders the system health report and explains any anomalies",
+)
@@ -9,6 +9,12 @@ from typing import Any, Dict
 
 import psutil
 
+from ...alerts import ALERT_ENGINE
+from ...schemas import MemoryInfo
+
+# --- Constants ---
+GB = 1024**3
+
 
 def get_memory_info() -> Dict[str, Any]:
     """
@@ -22,21 +28,29 @@ def get_memory_info() -> Dict[str, Any]:
         memory = psutil.virtual_memory()
         swap = psutil.swap_memory()
 
-        memory_info = {
-            "total_memory": f"{memory.total / (1024 ** 3):.2f} GB",
-            "available_memory": f"{memory.available / (1024 ** 3):.2f} GB",
-            "used_memory": f"{memory.used / (1024 ** 3):.2f} GB",
-            "memory_percentage": f"{memory.percent:.1f}%",
-            "swap_total": f"{swap.total / (1024 ** 3):.2f} GB",
-            "swap_used": f"{swap.used / (1024 ** 3):.2f} GB",
-            "swap_percentage": f"{swap.percent:.1f}%",
+        memory_info: MemoryInfo = {
+            "total_gb": round(memory.total / GB, 2),
+            "available_gb": round(memory.available / GB, 2),
+            "used_gb": round(memory.used / GB, 2),
+            "memory_percent": memory.percent,
+            "swap_total_gb": round(swap.total / GB, 2),
+            "swap_used_gb": round(swap.used / GB, 2),
+            "swap_percent": swap.percent,
         }
 
         # Calculate stats
         memory_usage = memory.percent
         swap_usage = swap.percent
-        high_memory_usage = memory_usage > 80
-        high_swap_usage = swap_usage > 80
+        ALERT_ENGINE.record("memory_percent", memory_usage)
+        ALERT_ENGINE.record("swap_percent", swap_usage)
+        alerting_metrics = {
+            alert["metric"]
+            for alert in ALERT_ENGINE.evaluate(
+                metrics=["memory_percent", "swap_percent"]
+            )
+        }
+        high_memory_usage = "memory_percent" in alerting_metrics
+        high_swap_usage = "swap_percent" in alerting_metrics
 
         # Format for ADK tool return structure
         return {
@@ -44,8 +58,6 @@ def get_memory_info() -> Dict[str, Any]:
             "stats": {
                 "memory_usage_percentage": memory_usage,
                 "swap_usage_percentage": swap_usage,
-                "total_memory_gb": memory.total / (1024**3),
-                "available_memory_gb": memory.available / (1024**3),
             },
             "additional_info": {
                 "data_format": "dictionary",
@@ -0,0 +1,18 @@
+"""
+Network Information Agent
+
+This agent is responsible for gathering network throughput. It calls the collector tool
+directly, without a model call, and stores its result in the ``net_info`` state
+key for the health report.
+"""
+
+from ...collector_agent import CollectorAgent
+from .tools import get_network_info
+
+# Network Information Agent
+network_info_agent = CollectorAgent(
+    name="NetworkInfoAgent",
+    description="Gathers network throughput information",
+    collector=get_network_info,
+    output_key="net_info",
+)
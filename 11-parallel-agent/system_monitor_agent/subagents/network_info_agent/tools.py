@@ -0,0 +1,104 @@
+"""
+Network Information Tool
+
+This module provides a tool for gathering network throughput information.
+"""
+
+import time
+from typing import Any, Dict
+
+import psutil
+
+from ...alerts import ALERT_ENGINE
+from ...counters import CounterRateTracker
+
+# --- Constants ---
+NET_COUNTER_FIELDS = (
+    "bytes_recv",
+    "bytes_sent",
+    "packets_recv",
+    "packets_sent",
+    "errin",
+    "errout",
+    "dropin",
+    "dropout",
+)
+
+# Counters are diffed by the tracker itself, so psutil's wrap handling is off
+_net_tracker = CounterRateTracker(
+    sampler=lambda: psutil.net_io_counters(pernic=True, nowrap=False),
+    fields=NET_COUNTER_FIELDS,
+)
+
+
+def get_network_info() -> Dict[str, Any]:
+    """
+    Gather per-interface network throughput rates.
+
+    Returns:
+        Dict[str, Any]: Dictionary with network information structured for ADK
+    """
+    try:
+        rates, interval = _net_tracker.rates()
+
+        interfaces = {}
+        idle_interfaces = []
+        errors_and_drops = {}
+        for name, rate in sorted(rates.items()):
+            errors = rate["errin"] + rate["errout"]
+            drops = rate["dropin"] + rate["dropout"]
+            errors_and_drops[name] = errors + drops
+            if not any(rate.values()):
+                idle_interfaces.append(name)
+                continue
+            interfaces[name] = {
+                "rx_bytes_per_sec": round(rate["bytes_recv"], 1),
+                "tx_bytes_per_sec": round(rate["bytes_sent"], 1),
+                "rx_packets_per_sec": round(rate["packets_recv"], 1),
+                "tx_packets_per_sec": round(rate["packets_sent"], 1),
+                "errors_per_sec": round(errors, 2),
+                "drops_per_sec": round(drops, 2),
+            }
+
+        ALERT_ENGINE.record_many("net_errors_per_sec", errors_and_drops)
+        interfaces_with_errors = [
+            alert["series"]
+            for alert in ALERT_ENGINE.evaluate(metrics=["net_errors_per_sec"])
+        ]
+
+        total_rx = sum(nic["rx_bytes_per_sec"] for nic in interfaces.values())
+        total_tx = sum(nic["tx_bytes_per_sec"] for nic in interfaces.values())
+        busiest = max(
+            interfaces,
+            key=lambda nic: interfaces[nic]["rx_bytes_per_sec"]
+            + interfaces[nic]["tx_bytes_per_sec"],
+            default=None,
+        )
+
+        # Format for ADK tool return structure
+        return {
+            "result": {"interfaces": interfaces},
+            "stats": {
+                "active_interface_count": len(interfaces),
+                "total_rx_bytes_per_sec": round(total_rx, 1),
+                "total_tx_bytes_per_sec": round(total_tx, 1),
+                "busiest_interface": busiest,
+            },
+            "additional_info": {
+                "data_format": "dictionary",
+                "collection_timestamp": time.time(),
+                "sample_interval_sec": round(interval, 3),
+                "idle_interfaces": idle_interfaces or None,
+                "network_concern": (
+                    f"Packet errors or drops on: {', '.join(interfaces_with_errors)}"
+                    if interfaces_with_errors
+                    else None
+                ),
+            },
+        }
+    except Exception as e:
+        return {
+            "result": {"error": f"Failed to gather network information: {str(e)}"},
+            "stats": {"success": False},
+            "additional_info": {"error_type": str(type(e).__name__)},
+        }
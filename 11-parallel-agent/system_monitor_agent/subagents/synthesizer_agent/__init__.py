@@ -1,3 +1,3 @@
-"""System report synthesizer agent for system monitoring."""
+"""Report synthesizer agents for system monitoring."""
 
-from .agent import system_report_synthesizer
+from .agent import anomaly_explainer, fleet_report_synthesizer
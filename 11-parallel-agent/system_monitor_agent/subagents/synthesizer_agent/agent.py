@@ -1,8 +1,9 @@
 """
-System Report Synthesizer Agent
+Report Synthesizer Agents
 
-This agent is responsible for synthesizing information from other agents
-to create a comprehensive system health report.
+These agents are responsible for the model-written parts of the health
+reports: explaining the anomalies in a local report (the rest of which is
+rendered from a template) and synthesizing the fleet report.
 """
 
 from google.adk.agents import LlmAgent
@@ -10,24 +11,50 @@ from google.adk.agents import LlmAgent
 # --- Constants ---
 GEMINI_MODEL = "gemini-2.0-flash"
 
-# System Report Synthesizer Agent
-system_report_synthesizer = LlmAgent(
-    name="SystemReportSynthesizer",
+# Anomaly Explainer Agent
+anomaly_explainer = LlmAgent(
+    name="AnomalyExplainer",
     model=GEMINI_MODEL,
-    instruction="""You are a System Report Synthesizer.
+    instruction="""You are a System Anomaly Explainer.
     
-    Your task is to create a comprehensive system health report by combining information from:
-    - CPU information: {cpu_info}
-    - Memory information: {memory_info}
-    - Disk information: {disk_info}
+    A system health report has already been written from the collected
+    metrics, including standard recommendations:
+    {health_report}
+    
+    These anomalies were flagged in it (firing alerts, failed collectors,
+    CPU throttling, partitions forecast to fill up):
+    {anomalies}
+    
+    Write only an "## Anomaly Analysis" section in markdown that:
+    1. Explains the likely causes of each anomaly, using the related
+       metrics in the report (for example memory pressure next to swap usage)
+    2. Says how urgent each one is
+    3. Gives concrete next steps beyond the standard recommendations
+    
+    Do not repeat the report's tables or executive summary.
+    """,
+    description="Explains the anomalies flagged in a rendered health report",
+    output_key="anomaly_explanation",
+)
+
+# Fleet Report Synthesizer Agent
+fleet_report_synthesizer = LlmAgent(
+    name="FleetReportSynthesizer",
+    model=GEMINI_MODEL,
+    instruction="""You are a Fleet Report Synthesizer.
+    
+    Your task is to create a fleet health report from this fleet summary:
+    {fleet_info}
     
     Create a well-formatted report with:
-    1. An executive summary at the top with overall system health status
-    2. Sections for each component with their respective information
-    3. Recommendations based on any concerning metrics
+    1. An executive summary at the top with overall fleet health status
+    2. Sections for CPU, memory and disk with the fleet-wide distribution
+       and the hosts that need attention
+    3. A section listing unreachable hosts, if any
+    4. Recommendations based on any concerning metrics
     
     Use markdown formatting to make the report readable and professional.
     Highlight any concerning values and provide practical recommendations.
     """,
-    description="Synthesizes all system information into a comprehensive report",
+    description="Synthesizes a fleet summary into a fleet health report",
 )
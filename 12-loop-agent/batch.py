@@ -0,0 +1,323 @@
+"""
+Batch LinkedIn Post Generation
+
+Runs the generation and refinement pipeline for every record of a JSONL
+file, each in its own session, with at most --concurrency records in flight.
+Each post is appended to the output JSONL as soon as its record finishes;
+a record that fails is appended to a separate errors JSONL instead.
+Rerunning the same command after a crash or Ctrl-C skips the records that
+already succeeded, so the batch resumes where it stopped and the output holds
+one line per record. A summary with
+throughput, refinement iterations and the latency distribution is printed at
+the end.
+
+Each input line is a record such as:
+    {"id": "adk-sessions", "topic": "What I learned about sessions and state",
+     "requirements": "Address it to backend engineers", "account": "brandon"}
+
+Only "topic" is required; "id" defaults to the line number.
+
+Usage:
+    python batch.py topics.jsonl posts.jsonl --concurrency 8
+    python batch.py topics.jsonl posts.jsonl --errors failed.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from linkedin_post_agent.agent import root_agent
+
+load_dotenv("linkedin_post_agent/.env")
+
+# ===== PART 1: Constants =====
+APP_NAME = "LinkedIn Post Batch"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT_SEC = 300.0
+
+
+# ===== PART 2: Records and resumable output =====
+def load_records(path: str) -> List[Dict[str, Any]]:
+    """Read the input records; ids default to the line number."""
+    records = []
+    with open(path) as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record.setdefault("id", str(number))
+            record["id"] = str(record["id"])
+            records.append(record)
+    return records
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the results written so far, the latest per record id.
+
+    A line cut off by a crash is ignored (its record simply runs again), and
+    so is any line that is not a result with an id.
+    """
+    results = {}
+    if not os.path.exists(path):
+        return results
+    with open(path) as file:
+        for line in file:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(result, dict) and "id" in result:
+                results[str(result["id"])] = result
+    return results
+
+
+def ends_with_newline(path: str) -> bool:
+    """True if the file is empty or its last line is complete."""
+    with open(path, "rb") as file:
+        if file.seek(0, os.SEEK_END) == 0:
+            return True
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) == b"\n"
+
+
+def default_errors_path(output_path: str) -> str:
+    """The default errors file: posts.jsonl -> posts.errors.jsonl."""
+    root, extension = os.path.splitext(output_path)
+    return f"{root}.errors{extension or '.jsonl'}"
+
+
+class ResultWriter:
+    """
+    Appends finished records to the output and failed ones to the errors file.
+
+    Every line is flushed right away, so a crash loses at most the records
+    still in flight. Failed records run again on restart, so each attempt
+    adds a line to the errors file, never to the output. The errors file is
+    only created once a record fails.
+    """
+
+    def __init__(self, output_path: str, errors_path: str):
+        self.output = self._open(output_path)
+        self.errors_path = errors_path
+        self.errors = None
+        self.errors_written = 0
+
+    @staticmethod
+    def _open(path: str):
+        file = open(path, "a")
+        # Finish a line cut off by a crash so the next result starts cleanly
+        if not ends_with_newline(path):
+            file.write("\n")
+        return file
+
+    def write(self, result: Dict[str, Any]) -> None:
+        if result["status"] == "ok":
+            file = self.output
+        else:
+            if self.errors is None:
+                self.errors = self._open(self.errors_path)
+            file = self.errors
+            self.errors_written += 1
+        file.write(json.dumps(result) + "\n")
+        file.flush()
+
+    def close(self) -> None:
+        self.output.close()
+        if self.errors is not None:
+            self.errors.close()
+
+
+def build_prompt(record: Dict[str, Any]) -> str:
+    """The user message for one record."""
+    prompt = f"Generate a LinkedIn post about: {record['topic']}"
+    if record.get("requirements"):
+        prompt += f"\nAdditional requirements: {record['requirements']}"
+    return prompt
+
+
+# ===== PART 3: Running one record =====
+async def run_record(
+    runner: Runner, record: Dict[str, Any], timeout: float
+) -> Dict[str, Any]:
+    """Run the pipeline for one record in a fresh session."""
+    user_id = record.get("account", "batch")
+    session = runner.session_service.create_session(
+        app_name=APP_NAME, user_id=user_id, state={"record_id": record["id"]}
+    )
+    start = time.perf_counter()
+    result = {"id": record["id"], "topic": record["topic"]}
+
+    async def run():
+        async for _ in runner.run_async(
+            user_id=user_id,
+            session_id=session.id,
+            new_message=types.Content(
+                role="user", parts=[types.Part(text=build_prompt(record))]
+            ),
+        ):
+            pass
+
+    try:
+        await asyncio.wait_for(run(), timeout)
+        state = runner.session_service.get_session(
+            app_name=APP_NAME, user_id=user_id, session_id=session.id
+        ).state
+        loop_exit = state.get("loop_exit") or {}
+        result.update(
+            {
+                "status": "ok",
+                "post": state.get("current_post", ""),
+                "passed_rules": state.get("review_status") == "pass",
+                "iterations": state.get("loop_iteration"),
+                "exit_reason": loop_exit.get("reason"),
+            }
+        )
+    except asyncio.TimeoutError:
+        result.update({"status": "error", "error": f"Timed out after {timeout}s"})
+    except Exception as e:
+        result.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        # Sessions are only needed while the record runs
+        runner.session_service.delete_session(
+            app_name=APP_NAME, user_id=user_id, session_id=session.id
+        )
+    result["latency_sec"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+# ===== PART 4: The batch =====
+async def run_batch(
+    input_path: str,
+    output_path: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT_SEC,
+    runner: Optional[Runner] = None,
+    errors_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run every record that has not succeeded yet and append the results.
+
+    Args:
+        input_path: JSONL file of records
+        output_path: JSONL file finished records are appended to
+        concurrency: Maximum number of records in flight
+        timeout: Seconds before a record is given up on
+        runner: Runner to use (defaults to one for root_agent)
+        errors_path: JSONL file failed records are appended to (default: the
+            output path with ".errors" before the extension)
+
+    Returns:
+        Dict[str, Any]: Summary of this run (see ``summarize``)
+    """
+    runner = runner or Runner(
+        agent=root_agent, app_name=APP_NAME, session_service=InMemorySessionService()
+    )
+    records = load_records(input_path)
+    # Outputs written before failures had their own file may hold errors too
+    done = {
+        record_id
+        for record_id, result in load_results(output_path).items()
+        if result.get("status") == "ok"
+    }
+    pending = [record for record in records if record["id"] not in done]
+    print(
+        f"{len(records)} records, {len(done)} already done, "
+        f"{len(pending)} to run with concurrency {concurrency}"
+    )
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for record in pending:
+        queue.put_nowait(record)
+    results = []
+    start = time.perf_counter()
+
+    writer = ResultWriter(output_path, errors_path or default_errors_path(output_path))
+
+    async def worker():
+        while True:
+            try:
+                record = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = await run_record(runner, record, timeout)
+            writer.write(result)
+            results.append(result)
+            print(
+                f"[{len(results)}/{len(pending)}] {result['id']}: "
+                f"{result['status']} in {result['latency_sec']:.1f}s"
+            )
+
+    try:
+        await asyncio.gather(
+            *(worker() for _ in range(min(concurrency, len(pending)) or 1))
+        )
+    finally:
+        writer.close()
+    if writer.errors_written:
+        print(f"{writer.errors_written} failed records written to {writer.errors_path}")
+
+    return summarize(results, time.perf_counter() - start)
+
+
+def summarize(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """Throughput, status counts, iterations and latency percentiles."""
+    latencies = sorted(result["latency_sec"] for result in results)
+    ok = [result for result in results if result["status"] == "ok"]
+
+    def percentile(fraction: float) -> Optional[float]:
+        if not latencies:
+            return None
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)]
+
+    return {
+        "records": len(results),
+        "elapsed_sec": round(elapsed, 2),
+        "records_per_min": round(len(results) / elapsed * 60, 1) if elapsed else 0,
+        "statuses": dict(Counter(result["status"] for result in results)),
+        "passed_rules": sum(result["passed_rules"] for result in ok),
+        "iterations": dict(
+            sorted(Counter(result["iterations"] for result in ok).items())
+        ),
+        "mean_iterations": (
+            round(statistics.mean(result["iterations"] or 0 for result in ok), 2)
+            if ok
+            else None
+        ),
+        "exit_reasons": dict(Counter(result["exit_reason"] for result in ok)),
+        "latency_sec": {
+            "p50": percentile(0.5),
+            "p90": percentile(0.9),
+            "p99": percentile(0.99),
+            "max": latencies[-1] if latencies else None,
+        },
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch LinkedIn post generation")
+    parser.add_argument("input", help="JSONL file of topic records")
+    parser.add_argument("output", help="JSONL file to append posts to")
+    parser.add_argument("--errors", help="JSONL file to append failed records to")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SEC)
+    args = parser.parse_args()
+    summary = asyncio.run(
+        run_batch(
+            args.input,
+            args.output,
+            args.concurrency,
+            args.timeout,
+            errors_path=args.errors,
+        )
+    )
+    print(json.dumps(summary, indent=2))
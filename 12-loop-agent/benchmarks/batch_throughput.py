@@ -0,0 +1,114 @@
+"""
+Batch Throughput Benchmark
+
+Runs batch.py's run_batch over --records generated topics at several
+concurrency limits. A scripted model stands in for Gemini: every call takes
+--model-latency seconds, a draft passes the rules 30% of the time and each
+refinement fixes the post half of the time, so records need different
+numbers of iterations like they do with a real model. The second part
+interrupts a batch partway through and reruns it, to show that only the
+unfinished records run again.
+
+Usage (from 12-loop-agent/):
+    python -m benchmarks.batch_throughput --records 32 --concurrency 1 4 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+
+from batch import APP_NAME, load_results, run_batch
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from linkedin_post_agent.agent import root_agent
+
+from benchmarks.best_of_n import generate, refine
+from benchmarks.fake_model import ScriptedModel, review_script, use_fake_model
+
+
+def write_records(path: str, count: int) -> None:
+    with open(path, "w") as file:
+        for index in range(count):
+            file.write(json.dumps({"id": f"topic-{index}", "topic": f"topic {index}"}))
+            file.write("\n")
+
+
+def new_runner() -> Runner:
+    return Runner(
+        agent=root_agent, app_name=APP_NAME, session_service=InMemorySessionService()
+    )
+
+
+async def main(args):
+    model = ScriptedModel(
+        model="scripted",
+        latency_sec=args.model_latency,
+        scripts={
+            "LinkedIn Post Generator": generate,
+            "LinkedIn Post Quality Reviewer": review_script,
+            "LinkedIn Post Refiner": refine,
+        },
+    )
+    use_fake_model(root_agent, model)
+    workdir = tempfile.mkdtemp()
+    input_path = os.path.join(workdir, "topics.jsonl")
+    write_records(input_path, args.records)
+
+    summaries = {}
+    for concurrency in args.concurrency:
+        output_path = os.path.join(workdir, f"posts_{concurrency}.jsonl")
+        # The scripted turns are counted per prompt, so reset them per run
+        model.turns.clear()
+        summaries[concurrency] = await run_batch(
+            input_path, output_path, concurrency, runner=new_runner()
+        )
+
+    print(
+        f"\n{'concurrency':>11} {'records/min':>11} {'elapsed_s':>9} "
+        f"{'p50_s':>6} {'p90_s':>6} {'p99_s':>6} {'iterations':>10}"
+    )
+    for concurrency, summary in summaries.items():
+        latency = summary["latency_sec"]
+        print(
+            f"{concurrency:>11} {summary['records_per_min']:>11.1f} "
+            f"{summary['elapsed_sec']:>9.2f} {latency['p50']:>6.2f} "
+            f"{latency['p90']:>6.2f} {latency['p99']:>6.2f} "
+            f"{summary['mean_iterations']:>10.2f}"
+        )
+    print(f"iterations per record: {summaries[args.concurrency[-1]]['iterations']}")
+
+    # Interrupt a batch halfway, then rerun it
+    output_path = os.path.join(workdir, "posts_resumed.jsonl")
+    model.turns.clear()
+    batch = asyncio.ensure_future(
+        run_batch(input_path, output_path, args.concurrency[0], runner=new_runner())
+    )
+    while len(load_results(output_path)) < args.records // 2:
+        await asyncio.sleep(0.05)
+    batch.cancel()
+    await asyncio.gather(batch, return_exceptions=True)
+    finished = len(load_results(output_path))
+    model.turns.clear()
+    resumed = await run_batch(
+        input_path, output_path, args.concurrency[-1], runner=new_runner()
+    )
+    print(
+        f"\ninterrupted after {finished} records, the rerun ran "
+        f"{resumed['records']}; {len(load_results(output_path))} of "
+        f"{args.records} records in the output"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch post generation")
+    parser.add_argument("--records", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument(
+        "--model-latency",
+        type=float,
+        default=0.2,
+        help="Seconds each model call takes",
+    )
+    asyncio.run(main(parser.parse_args()))
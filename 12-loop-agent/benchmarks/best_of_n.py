@@ -0,0 +1,164 @@
+"""
+Best-of-N Drafts Benchmark
+
+Compares generating K = 1, 3 and 5 candidate drafts in parallel before the
+refinement loop. A scripted model stands in for Gemini: every call takes
+--model-latency seconds, a draft passes the rules 30% of the time, and each
+refinement fixes the post half of the time. More drafts cost more (parallel)
+model calls up front, but fewer posts need serial refinement iterations.
+
+Each K runs in its own process, because the pipeline is assembled at import
+from LINKEDIN_POST_DRAFTS.
+
+Usage (from 12-loop-agent/):
+    python -m benchmarks.best_of_n --drafts 1 3 5 --posts 40 --model-latency 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from benchmarks.fake_model import (
+    ScriptedModel,
+    review_script,
+    run_key,
+    text,
+    use_fake_model,
+)
+from benchmarks.sample_posts import BAD_POST, GOOD_POST, LONG_POST, SHORT_POST
+
+APP_NAME = "best_of_n_benchmark"
+USER_ID = "benchmark"
+# Draft quality: (post, probability)
+DRAFT_POOL = [(GOOD_POST, 0.3), (SHORT_POST, 0.3), (LONG_POST, 0.2), (BAD_POST, 0.2)]
+REFINER_FIX_RATE = 0.5
+
+
+def generate(llm_request, turn: int) -> types.Part:
+    rng = random.Random(f"{run_key(llm_request)}|draft|{turn}")
+    posts, weights = zip(*DRAFT_POOL)
+    return text(rng.choices(posts, weights)[0])
+
+
+def refine(llm_request, turn: int) -> types.Part:
+    rng = random.Random(f"{run_key(llm_request)}|refine|{turn}")
+    if rng.random() < REFINER_FIX_RATE:
+        return text(GOOD_POST)
+    # Still too short, but closer each time (so it is not cut off as stalled)
+    return text(GOOD_POST[: 600 + 80 * turn] + " #ADK")
+
+
+async def run_post(runner, sessions, prompt: str) -> dict:
+    session = sessions.create_session(app_name=APP_NAME, user_id=USER_ID)
+    start = time.perf_counter()
+    iterations = 0
+    async for event in runner.run_async(
+        user_id=USER_ID,
+        session_id=session.id,
+        new_message=types.Content(role="user", parts=[text(prompt)]),
+    ):
+        iterations += event.author == "ConvergenceCheck"
+    latency = time.perf_counter() - start
+    state = sessions.get_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+    ).state
+    return {
+        "latency_sec": latency,
+        "iterations": iterations,
+        "passed": state.get("review_status") == "pass",
+    }
+
+
+async def child(args):
+    """Run the posts for one K (set through LINKEDIN_POST_DRAFTS)."""
+    from linkedin_post_agent.agent import DRAFT_COUNT, root_agent
+
+    model = ScriptedModel(
+        model="scripted",
+        latency_sec=args.model_latency,
+        scripts={
+            "LinkedIn Post Generator": generate,
+            "LinkedIn Post Quality Reviewer": review_script,
+            "LinkedIn Post Refiner": refine,
+        },
+    )
+    use_fake_model(root_agent, model)
+    sessions = InMemorySessionService()
+    runner = Runner(agent=root_agent, app_name=APP_NAME, session_service=sessions)
+    # Posts run concurrently; each is timed on its own
+    runs = await asyncio.gather(
+        *(run_post(runner, sessions, f"post {index}") for index in range(args.posts))
+    )
+    latencies = sorted(run["latency_sec"] for run in runs)
+    print(
+        json.dumps(
+            {
+                "drafts": DRAFT_COUNT,
+                "model_calls": sum(model.calls.values()) / len(runs),
+                "iterations": statistics.mean(run["iterations"] for run in runs),
+                "p50_sec": latencies[len(latencies) // 2],
+                "p95_sec": latencies[int(len(latencies) * 0.95)],
+                "mean_sec": statistics.mean(latencies),
+                "passed": sum(run["passed"] for run in runs) / len(runs),
+            }
+        )
+    )
+
+
+def main(args):
+    print(
+        f"{'K':>2} {'calls/post':>10} {'iterations':>10} {'mean_s':>7} "
+        f"{'p50_s':>6} {'p95_s':>6} {'passed':>7}"
+    )
+    for drafts in args.drafts:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.best_of_n",
+                "--child",
+                "--posts",
+                str(args.posts),
+                "--model-latency",
+                str(args.model_latency),
+            ],
+            env={**os.environ, "LINKEDIN_POST_DRAFTS": str(drafts)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{result['drafts']:>2} {result['model_calls']:>10.1f} "
+            f"{result['iterations']:>10.2f} {result['mean_sec']:>7.2f} "
+            f"{result['p50_sec']:>6.2f} {result['p95_sec']:>6.2f} "
+            f"{result['passed']:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark best-of-N draft generation")
+    parser.add_argument("--drafts", type=int, nargs="+", default=[1, 3, 5])
+    parser.add_argument("--posts", type=int, default=40)
+    parser.add_argument(
+        "--model-latency",
+        type=float,
+        default=0.5,
+        help="Seconds each model call takes",
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(child(args))
+    else:
+        main(args)
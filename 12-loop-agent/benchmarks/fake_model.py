@@ -0,0 +1,106 @@
+"""
+Scripted Model for Benchmarks
+
+A stand-in for Gemini that needs no network access or API key, so
+benchmarks measure the pipeline itself. Each agent is recognized by a marker
+in its instruction and answered by a script: a function of the request and
+how many times that agent has been called for the same run (the run is
+identified by the first user message).
+"""
+
+import asyncio
+import json
+from collections import Counter
+from typing import Callable, Dict
+
+from google.adk.agents import BaseAgent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+from pydantic import Field
+
+CHARS_PER_TOKEN = 4
+
+# Script: (request, call number for this agent and run, starting at 1) -> reply
+Script = Callable[[LlmRequest, int], types.Part]
+
+
+def run_key(llm_request: LlmRequest) -> str:
+    """The first user message, which identifies the run."""
+    for content in llm_request.contents:
+        if content.role == "user" and content.parts and content.parts[0].text:
+            return content.parts[0].text
+    return ""
+
+
+def instruction(llm_request: LlmRequest) -> str:
+    return llm_request.config.system_instruction or ""
+
+
+def answered_tool_call(llm_request: LlmRequest) -> bool:
+    """True if the last content is a tool response the model has to answer."""
+    last = llm_request.contents[-1] if llm_request.contents else None
+    return last is not None and any(part.function_response for part in last.parts or [])
+
+
+def estimate_tokens(part: types.Part) -> int:
+    """Rough output token count (about 4 characters per token)."""
+    if part.function_call:
+        size = len(part.function_call.name) + len(json.dumps(part.function_call.args))
+    else:
+        size = len(part.text or "")
+    return max(round(size / CHARS_PER_TOKEN), 1)
+
+
+class ScriptedModel(BaseLlm):
+    """Answers each agent (by instruction marker) with its script."""
+
+    scripts: Dict[str, Script]
+    # Each call takes latency_sec plus the time to generate its output
+    latency_sec: float = 0.0
+    sec_per_output_token: float = 0.0
+    # Model calls and output tokens per marker, and turns per (marker, run)
+    calls: Counter = Field(default_factory=Counter)
+    output_tokens: Counter = Field(default_factory=Counter)
+    turns: Counter = Field(default_factory=Counter)
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        system = instruction(llm_request)
+        marker = next((marker for marker in self.scripts if marker in system), None)
+        if marker is None:
+            raise ValueError("No script for this agent")
+        self.calls[marker] += 1
+        # Answering a tool response continues the same turn
+        turn_key = (marker, run_key(llm_request))
+        if not answered_tool_call(llm_request):
+            self.turns[turn_key] += 1
+        part = self.scripts[marker](llm_request, self.turns[turn_key])
+        tokens = estimate_tokens(part)
+        self.output_tokens[marker] += tokens
+        latency = self.latency_sec + tokens * self.sec_per_output_token
+        if latency:
+            await asyncio.sleep(latency)
+        yield LlmResponse(content=types.Content(role="model", parts=[part]))
+
+
+def text(value: str) -> types.Part:
+    return types.Part(text=value)
+
+
+def review_script(llm_request: LlmRequest, turn: int) -> types.Part:
+    """PostReviewer: check the length with count_characters, then give feedback."""
+    if not answered_tool_call(llm_request):
+        post = instruction(llm_request).split("## POST TO REVIEW")[-1]
+        return types.Part(
+            function_call=types.FunctionCall(
+                name="count_characters", args={"text": post.strip()}
+            )
+        )
+    return text("Fix the failed rule checks listed above.")
+
+
+def use_fake_model(agent: BaseAgent, model: BaseLlm) -> None:
+    """Point an agent and all of its sub-agents at the fake model."""
+    if hasattr(agent, "model"):
+        agent.model = model
+    for sub_agent in agent.sub_agents:
+        use_fake_model(sub_agent, model)
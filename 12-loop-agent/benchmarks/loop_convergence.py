@@ -0,0 +1,188 @@
+"""
+Loop Convergence Benchmark
+
+Runs the LinkedIn post pipeline with a scripted model whose refiner behaves
+in the ways that waste iterations (returning the same post, oscillating
+between two posts, tinkering with single words, letting the post grow) and
+one where it simply fixes the post. Each scenario runs with and without the
+ConvergenceCheck step, and the benchmark reports model calls per post,
+iterations and why the loop ended. In "flat_gap" the refiner rewrites part
+of a too-long post without changing its length; that is not divergence, so
+the benchmark fails if the check stops it for length_diverging.
+
+Usage (from 12-loop-agent/):
+    python -m benchmarks.loop_convergence --posts 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from linkedin_post_agent.agent import refinement_loop, root_agent
+from linkedin_post_agent.subagents.convergence_check import convergence_check
+
+from benchmarks.fake_model import (
+    ScriptedModel,
+    review_script,
+    run_key,
+    text,
+    use_fake_model,
+)
+from benchmarks.sample_posts import BAD_POST, GOOD_POST, LONG_POST, SHORT_POST
+
+APP_NAME = "loop_convergence_benchmark"
+USER_ID = "benchmark"
+SYNONYMS = ["favorite", "highlight", "standout", "best part"]
+# Words the flat_gap refiner rotates the last paragraph by per refinement
+FLAT_GAP_ROTATION = 7
+GROWTH = [
+    " One more thing I want to mention about this course before I forget.",
+    " The explanations of each agent type were clear and easy to follow too.",
+    " I also liked that the examples run locally with very little setup.",
+    " Each lesson builds on the last one, which keeps the pace comfortable.",
+]
+
+
+def flat_gap_post(n: int) -> str:
+    """LONG_POST with the words of its last paragraph rotated n steps."""
+    head, tail = LONG_POST.rsplit("\n\n", 1)
+    words = tail.split()
+    shift = n * FLAT_GAP_ROTATION % len(words)
+    return f"{head}\n\n{' '.join(words[shift:] + words[:shift])}"
+
+
+# Scenario -> (initial draft, refiner output for refinement number n)
+SCENARIOS = {
+    "fixes": (BAD_POST, lambda n: SHORT_POST if n == 1 else GOOD_POST),
+    "noop": (SHORT_POST, lambda n: SHORT_POST),
+    "oscillate": (
+        SHORT_POST,
+        lambda n: SHORT_POST.replace(" #ADK", "") if n % 2 else SHORT_POST,
+    ),
+    "tinkering": (
+        LONG_POST,
+        lambda n: LONG_POST.replace("favorite", SYNONYMS[n % len(SYNONYMS)]),
+    ),
+    "growing": (
+        LONG_POST,
+        lambda n: LONG_POST + "".join(GROWTH[i % len(GROWTH)] for i in range(n)),
+    ),
+    # Rotating the words of the last paragraph keeps the length (and so the
+    # distance from the allowed range) the same while changing many words
+    "flat_gap": (flat_gap_post(0), flat_gap_post),
+}
+# Scenario -> exit reason the check must not give
+WRONG_REASONS = {"flat_gap": "length_diverging"}
+
+
+def scenario_of(llm_request) -> str:
+    return run_key(llm_request).rsplit("scenario: ", 1)[1].rstrip(")")
+
+
+model = ScriptedModel(
+    model="scripted",
+    scripts={
+        "LinkedIn Post Generator": lambda request, turn: text(
+            SCENARIOS[scenario_of(request)][0]
+        ),
+        "LinkedIn Post Quality Reviewer": review_script,
+        "LinkedIn Post Refiner": lambda request, turn: text(
+            SCENARIOS[scenario_of(request)][1](turn)
+        ),
+    },
+)
+
+
+async def run_post(runner: Runner, sessions, prompt: str):
+    session = sessions.create_session(app_name=APP_NAME, user_id=USER_ID)
+    calls_before = sum(model.calls.values())
+    # The first agent in the loop produces one event per iteration
+    first_step = refinement_loop.sub_agents[0].name
+    iterations = 0
+    async for event in runner.run_async(
+        user_id=USER_ID,
+        session_id=session.id,
+        new_message=types.Content(role="user", parts=[text(prompt)]),
+    ):
+        iterations += event.author == first_step
+    state = sessions.get_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+    ).state
+    exit_info = state.get("loop_exit", {})
+    return {
+        "model_calls": sum(model.calls.values()) - calls_before,
+        "iterations": iterations,
+        "reason": exit_info.get("reason", "max_iterations"),
+    }
+
+
+async def run_mode(label: str, posts: int) -> dict:
+    sessions = InMemorySessionService()
+    runner = Runner(agent=root_agent, app_name=APP_NAME, session_service=sessions)
+    results = {}
+    for scenario in SCENARIOS:
+        # Posts run one at a time, so the scripted turn counts stay per run
+        results[scenario] = [
+            await run_post(
+                runner, sessions, f"{label} post {index} (scenario: {scenario})"
+            )
+            for index in range(posts)
+        ]
+    return results
+
+
+async def main(args):
+    use_fake_model(root_agent, model)
+    loop_agents = list(refinement_loop.sub_agents)
+
+    modes = {}
+    for label, enabled in (("without check", False), ("with check", True)):
+        refinement_loop.sub_agents = [
+            agent for agent in loop_agents if enabled or agent is not convergence_check
+        ]
+        start = time.perf_counter()
+        modes[label] = await run_mode(label, args.posts)
+        print(f"{label}: {time.perf_counter() - start:.1f} s")
+    refinement_loop.sub_agents = loop_agents
+
+    print(
+        f"\n{'scenario':<11} {'mode':<14} {'calls/post':>10} {'iterations':>10}"
+        "  exit reasons"
+    )
+    for scenario in SCENARIOS:
+        for label, results in modes.items():
+            runs = results[scenario]
+            reasons = Counter(run["reason"] for run in runs)
+            print(
+                f"{scenario:<11} {label:<14} "
+                f"{statistics.mean(run['model_calls'] for run in runs):>10.1f} "
+                f"{statistics.mean(run['iterations'] for run in runs):>10.1f}  "
+                + ", ".join(f"{reason} x{count}" for reason, count in reasons.items())
+            )
+    for label, results in modes.items():
+        calls = [run["model_calls"] for runs in results.values() for run in runs]
+        print(f"average model calls per post, {label}: {statistics.mean(calls):.1f}")
+
+    wrong = [
+        f"{scenario} stopped for {reason}"
+        for scenario, reason in WRONG_REASONS.items()
+        for run in modes["with check"][scenario]
+        if run["reason"] == reason
+    ]
+    if wrong:
+        print("\nUnexpected exit reasons:\n  " + "\n  ".join(wrong))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark early stopping of the refinement loop"
+    )
+    parser.add_argument("--posts", type=int, default=5, help="Posts per scenario")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,212 @@
+"""
+Patch Refinement Benchmark
+
+Compares refining posts by full rewrite (LINKEDIN_REFINER_MODE=rewrite) with
+edit-operation patches (LINKEDIN_REFINER_MODE=patch). A scripted model
+stands in for Gemini; each call takes --model-latency seconds plus
+--sec-per-token for every output token, so long outputs are slow like they
+are with a real model. Each draft needs one small fix (hashtags, the
+mention, an emoji). In "stale_anchor" the first patch quotes text that is
+not in the post and has to be retried, and in "unfixable" every patch fails
+and the post is rewritten instead.
+
+Each mode runs in its own process, because the pipeline is assembled at
+import from LINKEDIN_REFINER_MODE.
+
+Usage (from 12-loop-agent/):
+    python -m benchmarks.patch_refinement --posts 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from benchmarks.fake_model import (
+    ScriptedModel,
+    review_script,
+    run_key,
+    text,
+    use_fake_model,
+)
+from benchmarks.sample_posts import GOOD_POST
+
+APP_NAME = "patch_refinement_benchmark"
+USER_ID = "benchmark"
+HASHTAGS = " #ADK #AgentDevelopment"
+MENTION = "crash course by @aiwithbrandon"
+
+# Scenario -> (draft, edits that fix it)
+SCENARIOS = {
+    "hashtags": (GOOD_POST + HASHTAGS, [{"op": "delete", "find": HASHTAGS}]),
+    "mention": (
+        GOOD_POST.replace(MENTION, "crash course by Brandon"),
+        [
+            {
+                "op": "replace",
+                "find": "crash course by Brandon",
+                "text": MENTION,
+            }
+        ],
+    ),
+    "emoji": (
+        GOOD_POST.replace("genuinely excited", "genuinely excited 🚀"),
+        [{"op": "delete", "find": " 🚀"}],
+    ),
+    "stale_anchor": (GOOD_POST + HASHTAGS, [{"op": "delete", "find": HASHTAGS}]),
+    "unfixable": (GOOD_POST + HASHTAGS, []),
+}
+STALE_EDITS = [{"op": "delete", "find": "#ADK #AI"}]
+
+
+def scenario_of(llm_request) -> str:
+    return run_key(llm_request).rsplit("scenario: ", 1)[1].rstrip(")")
+
+
+def write_patch(llm_request, turn: int) -> types.Part:
+    scenario = scenario_of(llm_request)
+    edits = SCENARIOS[scenario][1]
+    if scenario == "unfixable" or (scenario == "stale_anchor" and turn == 1):
+        edits = STALE_EDITS
+    return text(json.dumps({"edits": edits}))
+
+
+async def run_post(runner, sessions, prompt: str) -> dict:
+    session = sessions.create_session(app_name=APP_NAME, user_id=USER_ID)
+    async for _ in runner.run_async(
+        user_id=USER_ID,
+        session_id=session.id,
+        new_message=types.Content(role="user", parts=[text(prompt)]),
+    ):
+        pass
+    state = sessions.get_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+    ).state
+    return {
+        "passed": state.get("review_status") == "pass",
+        "iterations": state.get("loop_iteration"),
+    }
+
+
+async def child(args):
+    """Run every scenario in the mode set through LINKEDIN_REFINER_MODE."""
+    from linkedin_post_agent.agent import REFINER_MODE, refinement_loop, root_agent
+
+    model = ScriptedModel(
+        model="scripted",
+        latency_sec=args.model_latency,
+        sec_per_output_token=args.sec_per_token,
+        scripts={
+            "LinkedIn Post Generator": lambda request, turn: text(
+                SCENARIOS[scenario_of(request)][0]
+            ),
+            "LinkedIn Post Quality Reviewer": review_script,
+            "LinkedIn Post Refiner": lambda request, turn: text(GOOD_POST),
+            "LinkedIn Post Patch Writer": write_patch,
+        },
+    )
+    use_fake_model(root_agent, model)
+
+    # Time the refinement step of every iteration
+    refiner = refinement_loop.sub_agents[-1]
+    started = {}
+    durations = []
+
+    def before_refiner(callback_context):
+        started[callback_context.invocation_id] = time.perf_counter()
+
+    def after_refiner(callback_context):
+        durations.append(
+            time.perf_counter() - started.pop(callback_context.invocation_id)
+        )
+
+    refiner.before_agent_callback = before_refiner
+    refiner.after_agent_callback = after_refiner
+
+    sessions = InMemorySessionService()
+    runner = Runner(agent=root_agent, app_name=APP_NAME, session_service=sessions)
+    runs = await asyncio.gather(
+        *(
+            run_post(runner, sessions, f"post {index} (scenario: {scenario})")
+            for scenario in SCENARIOS
+            for index in range(args.posts)
+        )
+    )
+    refiner_markers = ["LinkedIn Post Refiner", "LinkedIn Post Patch Writer"]
+    print(
+        json.dumps(
+            {
+                "mode": REFINER_MODE,
+                "refinements": len(durations),
+                "refiner_calls": sum(model.calls[marker] for marker in refiner_markers),
+                "refiner_output_tokens": sum(
+                    model.output_tokens[marker] for marker in refiner_markers
+                ),
+                "mean_refine_sec": statistics.mean(durations),
+                "max_refine_sec": max(durations),
+                "passed": sum(run["passed"] for run in runs) / len(runs),
+            }
+        )
+    )
+
+
+def main(args):
+    print(
+        f"{'mode':<8} {'refinements':>11} {'model calls':>11} "
+        f"{'tokens/refine':>13} {'mean_s':>7} {'max_s':>6} {'passed':>7}"
+    )
+    for mode in ("rewrite", "patch"):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.patch_refinement",
+                "--child",
+                "--posts",
+                str(args.posts),
+                "--model-latency",
+                str(args.model_latency),
+                "--sec-per-token",
+                str(args.sec_per_token),
+            ],
+            env={**os.environ, "LINKEDIN_REFINER_MODE": mode},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{result['mode']:<8} {result['refinements']:>11} "
+            f"{result['refiner_calls']:>11} "
+            f"{result['refiner_output_tokens'] / result['refinements']:>13.0f} "
+            f"{result['mean_refine_sec']:>7.2f} {result['max_refine_sec']:>6.2f} "
+            f"{result['passed']:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark patch-based against full-rewrite refinement"
+    )
+    parser.add_argument("--posts", type=int, default=4, help="Posts per scenario")
+    parser.add_argument("--model-latency", type=float, default=0.3)
+    parser.add_argument(
+        "--sec-per-token",
+        type=float,
+        default=0.005,
+        help="Generation time per output token (0.005 = 200 tokens/s)",
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(child(args))
+    else:
+        main(args)
@@ -0,0 +1,68 @@
+"""
+Post Rules Benchmark
+
+Checks the sample posts with post_rules.check_post, prints which rules each
+one fails and the capabilities found, and times the check. Each sample has a
+known verdict (GENERIC_POST uses everyday words such as "tool", "session"
+and "loop" without naming an ADK capability and must fail on capabilities
+only); the script exits with an error if a verdict changes.
+
+Usage (from 12-loop-agent/):
+    python -m benchmarks.post_rules --repeat 2000
+"""
+
+import argparse
+import sys
+import time
+
+from linkedin_post_agent.post_rules import check_post
+
+from benchmarks.sample_posts import (
+    BAD_POST,
+    GENERIC_POST,
+    GOOD_POST,
+    LONG_POST,
+    SHORT_POST,
+)
+
+# Sample -> (post, rules it must fail)
+SAMPLES = {
+    "good": (GOOD_POST, []),
+    "bad": (
+        BAD_POST,
+        ["length", "no_emojis", "no_hashtags", "mention", "capabilities"],
+    ),
+    "short": (SHORT_POST, ["length", "no_hashtags"]),
+    "long": (LONG_POST, ["length"]),
+    "generic": (GENERIC_POST, ["capabilities"]),
+}
+
+
+def main(args):
+    print(f"{'sample':<8} {'chars':>6} {'check_us':>9} {'caps':>5}  failed rules")
+    mismatches = []
+    for name, (post, expected) in SAMPLES.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            result = check_post(post)
+        check_us = (time.perf_counter() - start) / args.repeat * 1e6
+        failed = [failure["rule"] for failure in result["failures"]]
+        print(
+            f"{name:<8} {result['char_count']:>6} {check_us:>9.1f}"
+            f" {len(result['capabilities']):>5}  {', '.join(failed) or '-'}"
+        )
+        if failed != expected:
+            mismatches.append(f"{name}: expected {expected}, got {failed}")
+
+    if mismatches:
+        print("\nUnexpected verdicts:\n  " + "\n  ".join(mismatches))
+        sys.exit(1)
+    print("\nAll verdicts as expected")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check and time the post rules")
+    parser.add_argument(
+        "--repeat", type=int, default=2000, help="Checks timed per sample"
+    )
+    main(parser.parse_args())
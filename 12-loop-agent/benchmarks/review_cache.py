@@ -0,0 +1,132 @@
+"""
+Review Cache Benchmark
+
+Runs batches through batch.py's run_batch where several records share a
+topic, so they reach the same drafts and refinements (as duplicate topics
+and retried records do). A scripted model stands in for Gemini: every call
+takes --model-latency seconds and the posts it writes depend only on the
+topic. The batch runs with the review cache off, with a cold cache and once
+more with the cache left warm from the previous batch.
+
+Usage (from 12-loop-agent/):
+    python -m benchmarks.review_cache --records 40 --topics 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+
+from batch import APP_NAME, run_batch
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from linkedin_post_agent.agent import root_agent
+from linkedin_post_agent.subagents.post_reviewer import review_cache
+
+from benchmarks.best_of_n import DRAFT_POOL, REFINER_FIX_RATE
+from benchmarks.fake_model import (
+    ScriptedModel,
+    review_script,
+    run_key,
+    text,
+    use_fake_model,
+)
+from benchmarks.sample_posts import GOOD_POST
+
+REVIEWER = "LinkedIn Post Quality Reviewer"
+
+
+def topic_of(llm_request) -> str:
+    return run_key(llm_request).split("\n")[0]
+
+
+def generate(llm_request, turn: int) -> types.Part:
+    rng = random.Random(f"{topic_of(llm_request)}|draft")
+    posts, weights = zip(*DRAFT_POOL)
+    return text(rng.choices(posts, weights)[0])
+
+
+def refine(llm_request, turn: int) -> types.Part:
+    rng = random.Random(f"{topic_of(llm_request)}|refine|{turn}")
+    if rng.random() < REFINER_FIX_RATE:
+        return text(GOOD_POST)
+    return text(GOOD_POST[: 600 + 80 * turn] + " #ADK")
+
+
+async def run(model, input_path: str, workdir: str, label: str) -> dict:
+    calls_before = model.calls[REVIEWER]
+    hits_before = review_cache.hits
+    model.turns.clear()
+    summary = await run_batch(
+        input_path,
+        os.path.join(workdir, f"{label}.jsonl"),
+        concurrency=4,
+        runner=Runner(
+            agent=root_agent,
+            app_name=APP_NAME,
+            session_service=InMemorySessionService(),
+        ),
+    )
+    return {
+        "label": label,
+        "reviewer_calls": model.calls[REVIEWER] - calls_before,
+        "cache_hits": review_cache.hits - hits_before,
+        "elapsed_sec": summary["elapsed_sec"],
+        "mean_iterations": summary["mean_iterations"],
+        "passed_rules": summary["passed_rules"],
+    }
+
+
+async def main(args):
+    model = ScriptedModel(
+        model="scripted",
+        latency_sec=args.model_latency,
+        scripts={
+            "LinkedIn Post Generator": generate,
+            REVIEWER: review_script,
+            "LinkedIn Post Refiner": refine,
+        },
+    )
+    use_fake_model(root_agent, model)
+    workdir = tempfile.mkdtemp()
+    input_path = os.path.join(workdir, "topics.jsonl")
+    with open(input_path, "w") as file:
+        for index in range(args.records):
+            record = {"id": str(index), "topic": f"topic {index % args.topics}"}
+            file.write(json.dumps(record) + "\n")
+
+    max_entries = review_cache.max_entries
+    review_cache.max_entries = 0
+    results = [await run(model, input_path, workdir, "cache off")]
+    review_cache.max_entries = max_entries
+    review_cache.clear()
+    results.append(await run(model, input_path, workdir, "cold cache"))
+    results.append(await run(model, input_path, workdir, "warm cache"))
+
+    print(
+        f"\n{'run':<11} {'reviewer calls':>14} {'cache hits':>10} "
+        f"{'elapsed_s':>9} {'iterations':>10} {'passed':>6}"
+    )
+    for result in results:
+        print(
+            f"{result['label']:<11} {result['reviewer_calls']:>14} "
+            f"{result['cache_hits']:>10} {result['elapsed_sec']:>9.2f} "
+            f"{result['mean_iterations']:>10.2f} {result['passed_rules']:>6}"
+        )
+    print(f"cache: {review_cache.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the review verdict cache")
+    parser.add_argument("--records", type=int, default=40)
+    parser.add_argument("--topics", type=int, default=10, help="Distinct topics")
+    parser.add_argument(
+        "--model-latency",
+        type=float,
+        default=0.2,
+        help="Seconds each model call takes",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,65 @@
+"""
+Sample Posts for Benchmarks
+
+Hand-written posts that pass or fail the mechanical rules in known ways, for
+the scripted model to return.
+"""
+
+GOOD_POST = (
+    "I just finished the Agent Development Kit crash course by @aiwithbrandon "
+    "and I am genuinely excited about how much ground it covered. It starts "
+    "with a basic agent implementation and quickly moves on to tool "
+    "integration, so agents can call real Python functions instead of "
+    "guessing. From there it walks through sessions and memory, persistent "
+    "storage backed by a database, and structured outputs that downstream "
+    "code can trust.\n\n"
+    "The later lessons were my favorite. Multi-agent orchestration showed how "
+    "to split a problem across specialists, callbacks made it easy to add "
+    "guardrails and logging, and the workflow agents tied everything "
+    "together: sequential agents for pipelines, parallel agents for "
+    "concurrent work and loop agents for iterative refinement, which is "
+    "exactly how this post was written.\n\n"
+    "What I appreciated most is how practical it is. Every example is small "
+    "enough to read in one sitting, yet the patterns map directly onto the "
+    "support bots, research assistants and reporting tools my team builds "
+    "every week. If you are building AI applications, this is one of the "
+    "fastest ways to get productive.\n\n"
+    "If you are experimenting with agents too, let's connect and compare "
+    "notes on what you are building."
+)
+
+# Fails on length, emojis, hashtags, the mention and capabilities
+BAD_POST = (
+    "Just wrapped up an agent course and wow 🚀 Learned a lot about tools. "
+    "Highly recommend it to everyone! #AI #Agents"
+)
+
+# Fails only on the hashtag and length (too short)
+SHORT_POST = GOOD_POST[:700] + " #ADK"
+
+# Fails only on length (too long)
+LONG_POST = GOOD_POST + "\n\n" + GOOD_POST[:400]
+
+# Uses everyday words ("tool", "session", "memory", "storage", "loop",
+# "parallel", "sequential") without naming an ADK capability; fails only on
+# capabilities
+GENERIC_POST = (
+    "I just spent a week with a new course from @aiwithbrandon and wanted to "
+    "share a few thoughts. Every session was packed, and the instructor has "
+    "a great memory for the small details that trip people up. The best tool "
+    "in any developer's kit is still a clear head, and the course keeps "
+    "coming back to that idea.\n\n"
+    "We talked about storage costs, about keeping a persistent habit of "
+    "writing things down, and about why a tight feedback loop beats a long "
+    "planning document. I liked the advice to run small experiments in "
+    "parallel instead of betting everything on one plan, and to break big "
+    "goals into sequential steps you can finish in a day. None of it is "
+    "flashy, but it works.\n\n"
+    "What stayed with me most is how much of good engineering is simply "
+    "patience. Read the error message, check your assumptions, write the "
+    "test, then move on. The course models that attitude in every lesson, "
+    "and I left with a longer reading list and a shorter list of excuses.\n\n"
+    "If you are looking for a thoughtful way to sharpen your craft this "
+    "quarter, I recommend giving it a try. Let's connect and compare notes "
+    "on what you are learning."
+)
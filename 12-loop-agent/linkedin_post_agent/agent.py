@@ -3,31 +3,73 @@ LinkedIn Post Generator Root Agent
 
 This module defines the root agent for the LinkedIn post generation application.
 It uses a sequential agent with an initial post generator followed by a refinement loop.
+Each loop iteration starts with local convergence and rules checks that can end the
+loop on their own. With LINKEDIN_POST_DRAFTS set above 1, several drafts are
+generated in parallel and the best one is refined. With
+LINKEDIN_REFINER_MODE=patch, the refiner returns edits instead of a new post.
+Setting LINKEDIN_LOOP_TELEMETRY records every loop iteration to a JSONL file.
 """
 
-from google.adk.agents import LoopAgent, SequentialAgent
+import os
 
-from .subagents.post_generator import initial_post_generator
+from google.adk.agents import LoopAgent, ParallelAgent, SequentialAgent
+
+from .convergence import MAX_ITERATIONS
+from .subagents.convergence_check import convergence_check
+from .subagents.draft_selector import DraftSelectorAgent
+from .subagents.patch_refiner import patch_refiner
+from .subagents.post_generator import initial_post_generator, make_draft_generator
 from .subagents.post_refiner import post_refiner
 from .subagents.post_reviewer import post_reviewer
+from .subagents.post_validator import post_validator
+from .telemetry import LoopTelemetry, instrument
+
+# LINKEDIN_REFINER_MODE=patch refines with small edit operations applied
+# locally instead of regenerating the whole post every iteration
+REFINER_MODE = os.getenv("LINKEDIN_REFINER_MODE", "rewrite")
 
 # Create the Refinement Loop Agent
 refinement_loop = LoopAgent(
     name="PostRefinementLoop",
-    max_iterations=10,
+    max_iterations=MAX_ITERATIONS,
     sub_agents=[
+        convergence_check,  # Exits the loop if refining stopped making progress
+        post_validator,  # Exits the loop without a model call if all rules pass
         post_reviewer,
-        post_refiner,
+        patch_refiner if REFINER_MODE == "patch" else post_refiner,
     ],
     description="Iteratively reviews and refines a LinkedIn post until quality requirements are met",
 )
 
+# Best-of-N: with LINKEDIN_POST_DRAFTS=K (K > 1), generate K drafts
+# concurrently and only send the best-scoring one into the refinement loop
+DRAFT_COUNT = max(int(os.getenv("LINKEDIN_POST_DRAFTS", "1")), 1)
+
+if DRAFT_COUNT > 1:
+    draft_generators = [
+        make_draft_generator(index) for index in range(1, DRAFT_COUNT + 1)
+    ]
+    generation_steps = [
+        ParallelAgent(name="DraftGenerators", sub_agents=draft_generators),
+        DraftSelectorAgent(
+            name="DraftSelector",
+            draft_keys=[generator.output_key for generator in draft_generators],
+            description="Scores the candidate drafts and keeps the best one",
+        ),
+    ]
+else:
+    generation_steps = [initial_post_generator]
+
 # Create the Sequential Pipeline
 root_agent = SequentialAgent(
     name="LinkedInPostGenerationPipeline",
     sub_agents=[
-        initial_post_generator,  # Step 1: Generate initial post
+        *generation_steps,  # Step 1: Generate the initial post (or best draft)
         refinement_loop,  # Step 2: Review and refine in a loop
     ],
     description="Generates and refines a LinkedIn post through an iterative review process",
 )
+
+# Optional per-iteration telemetry of the loop (see telemetry.py)
+if os.getenv("LINKEDIN_LOOP_TELEMETRY"):
+    instrument(refinement_loop, LoopTelemetry(os.getenv("LINKEDIN_LOOP_TELEMETRY")))
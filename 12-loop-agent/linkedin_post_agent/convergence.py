@@ -0,0 +1,128 @@
+"""
+Refinement Convergence
+
+This module decides when refining a post has stopped making progress: the
+refiner returned a post it already produced (no-op or oscillation), its
+edits have become too small to matter, or the post length keeps moving away
+from the allowed range. Each iteration is summarized in a small record (hash,
+length, edit distance from the previous post) so the history stays cheap to
+keep in session state.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from .post_rules import length_gap
+
+# --- Constants ---
+# Upper bound on refinement iterations (PostRefinementLoop.max_iterations)
+MAX_ITERATIONS = 10
+# An edit touching at most this share of the words counts as no real change
+MIN_CHANGE_RATIO = 0.02
+# Stop after this many consecutive iterations without progress
+STALL_ITERATIONS = 2
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_post(text: str) -> str:
+    """Collapse whitespace, so reflowed posts compare equal."""
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def post_hash(text: str) -> str:
+    """Content hash of the normalized post."""
+    return hashlib.sha1(normalize_post(text).encode("utf-8")).hexdigest()
+
+
+def edit_distance(a: List[str], b: List[str]) -> int:
+    """
+    Levenshtein distance between two word lists.
+
+    Args:
+        a: Words of the first text
+        b: Words of the second text
+
+    Returns:
+        int: Minimum number of word insertions, deletions and substitutions
+    """
+    # Strip the common prefix and suffix first; refinements usually touch a
+    # few sentences, which leaves a small table to fill
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        return len(a) + len(b)
+
+    previous = list(range(len(b) + 1))
+    for i, word_a in enumerate(a, 1):
+        current = [i]
+        for j, word_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (word_a != word_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def assess(
+    history: List[Dict[str, Any]], post: str, previous_post: Optional[str]
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Summarize the latest post and decide whether refinement has converged.
+
+    Args:
+        history: Records of the earlier iterations (oldest first)
+        post: The post to be reviewed in this iteration
+        previous_post: The post of the previous iteration, if any
+
+    Returns:
+        Tuple[Dict[str, Any], Optional[str]]: The record for this iteration
+        and the reason to stop (``repeated_post``, ``stalled`` or
+        ``length_diverging``), or None to keep refining
+    """
+    digest = post_hash(post)
+    char_count = len(post)
+    record = {
+        "iteration": len(history) + 1,
+        "hash": digest,
+        "char_count": char_count,
+        "length_gap": length_gap(char_count),
+        "edit_distance": None,
+        "change_ratio": None,
+    }
+    if previous_post is not None:
+        words = normalize_post(post).split()
+        previous_words = normalize_post(previous_post).split()
+        distance = edit_distance(previous_words, words)
+        record["edit_distance"] = distance
+        record["change_ratio"] = round(
+            distance / max(len(words), len(previous_words), 1), 4
+        )
+
+    if any(earlier["hash"] == digest for earlier in history):
+        return record, "repeated_post"
+
+    if len(history) < STALL_ITERATIONS:
+        return record, None
+    recent = history[-STALL_ITERATIONS:] + [record]
+    if all(
+        entry["change_ratio"] is not None and entry["change_ratio"] <= MIN_CHANGE_RATIO
+        for entry in recent[1:]
+    ):
+        return record, "stalled"
+    gaps = [entry["length_gap"] for entry in recent]
+    if record["length_gap"] and all(
+        later > earlier for earlier, later in zip(gaps, gaps[1:])
+    ):
+        return record, "length_diverging"
+    return record, None
@@ -0,0 +1,101 @@
+"""
+Post Patches
+
+This module defines the edit operations the patch refiner returns instead of
+a rewritten post, and applies them to ``current_post`` locally. Edits are
+anchored on text rather than character offsets (which models get wrong): an
+edit names the exact text it changes, and that text must occur exactly once.
+A patch is applied all or nothing; if any edit does not apply cleanly the
+post is left unchanged and the reason is reported back for a retry.
+"""
+
+import re
+from typing import List, Literal, Tuple
+
+from pydantic import BaseModel, Field
+
+
+class EditOperation(BaseModel):
+    op: Literal["replace", "insert_before", "insert_after", "delete"] = Field(
+        description="replace: swap `find` for `text`. insert_before/insert_after: "
+        "add `text` next to `find`. delete: remove `find`."
+    )
+    find: str = Field(
+        description="Exact text copied from the current post; must occur exactly once"
+    )
+    text: str = Field(
+        default="",
+        description="New text for replace and insert operations (empty for delete)",
+    )
+
+
+class PostPatch(BaseModel):
+    edits: List[EditOperation] = Field(
+        description="Edit operations, applied in order to the current post"
+    )
+
+
+class PatchError(ValueError):
+    """A patch that does not apply cleanly to the post."""
+
+
+def _locate(post: str, find: str) -> Tuple[int, int]:
+    """
+    Find the single occurrence of ``find`` in the post.
+
+    Exact matches are tried first. Models often change line breaks or
+    spacing when quoting, so a match that differs only in whitespace is
+    accepted as well.
+    """
+    if not find.strip():
+        raise PatchError("`find` is empty")
+    count = post.count(find)
+    if count == 1:
+        start = post.index(find)
+        return start, start + len(find)
+    if count == 0:
+        pattern = r"\s+".join(re.escape(word) for word in find.split())
+        matches = list(re.finditer(pattern, post))
+        if len(matches) == 1:
+            return matches[0].span()
+        count = len(matches)
+    if count == 0:
+        raise PatchError(f"`find` text not found in the post: {find[:80]!r}")
+    raise PatchError(
+        f"`find` text occurs {count} times; quote more of the sentence so it "
+        f"is unique: {find[:80]!r}"
+    )
+
+
+def apply_patch(post: str, edits: List[EditOperation]) -> str:
+    """
+    Apply edit operations in order.
+
+    Args:
+        post: The current post
+        edits: The edit operations
+
+    Returns:
+        str: The edited post
+
+    Raises:
+        PatchError: If the patch is empty or any edit does not apply cleanly
+    """
+    if not edits:
+        raise PatchError("The patch has no edits")
+    for number, edit in enumerate(edits, 1):
+        try:
+            start, end = _locate(post, edit.find)
+        except PatchError as e:
+            raise PatchError(f"Edit {number} ({edit.op}): {e}") from None
+        if edit.op != "delete" and not edit.text:
+            raise PatchError(f"Edit {number} ({edit.op}): `text` is empty")
+        if edit.op == "replace":
+            post = post[:start] + edit.text + post[end:]
+        elif edit.op == "insert_before":
+            post = post[:start] + edit.text + post[start:]
+        elif edit.op == "insert_after":
+            post = post[:end] + edit.text + post[end:]
+        else:
+            post = post[:start] + post[end:]
+    return post
@@ -0,0 +1,267 @@
+"""
+LinkedIn Post Rules
+
+This module checks a post against the mechanical requirements of the
+pipeline: length, no emojis, no hashtags, the @aiwithbrandon mention and the
+number of ADK capabilities mentioned. The patterns are compiled once at
+import, so a check takes about a tenth of a millisecond instead of a
+model call.
+"""
+
+import re
+from typing import Any, Dict, List
+
+# --- Constants ---
+MIN_LENGTH = 1000
+MAX_LENGTH = 1500
+MIN_CAPABILITIES = 4
+REQUIRED_MENTION = "@aiwithbrandon"
+# Draft scoring weights (see score_post)
+FAILURE_PENALTY = 100.0
+LENGTH_GAP_PENALTY = 0.1
+CAPABILITY_BONUS = 1.0
+
+# Emoji and pictograph blocks, plus the variation selector and zero-width
+# joiner used to build emoji sequences
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001f000-\U0001faff"  # Mahjong .. Symbols and Pictographs Extended-A
+    "\u2600-\u27bf"  # Miscellaneous Symbols, Dingbats
+    "\u2300-\u23ff"  # Miscellaneous Technical (watch, hourglass, ...)
+    "\u2b00-\u2bff"  # Arrows and stars
+    "\ufe0f\u200d"
+    "]"
+)
+HASHTAG_PATTERN = re.compile(r"(?<![\w&])#[^\W\d_]\w*")
+MENTION_PATTERN = re.compile(re.escape(REQUIRED_MENTION) + r"\b", re.IGNORECASE)
+
+# ADK capability -> phrases (up to three words) that count as mentioning it.
+# Single everyday words ("tool", "memory", "loop", "parallel") also appear
+# in generic prose, so each capability needs a specific phrase or ADK class
+# name. Hyphens count as spaces, so "multi agent" also matches "multi-agent".
+# The first phrase is the one suggested when a post mentions too few
+CAPABILITY_PHRASES = {
+    "basic_agents": (
+        "basic agent",
+        "basic agents",
+        "agent implementation",
+        "llm agent",
+        "llm agents",
+        "llmagent",
+    ),
+    "tools": (
+        "tool integration",
+        "tool calling",
+        "tool calls",
+        "function tool",
+        "function tools",
+        "custom tools",
+    ),
+    "litellm": ("litellm", "lite llm"),
+    "sessions_and_memory": (
+        "sessions and memory",
+        "session state",
+        "session service",
+        "session management",
+        "memory service",
+    ),
+    "persistent_storage": (
+        "persistent storage",
+        "persistent sessions",
+        "database session",
+        "database sessions",
+    ),
+    "structured_outputs": (
+        "structured outputs",
+        "structured output",
+        "output schema",
+    ),
+    "multi_agent": (
+        "multi agent",
+        "multi agents",
+        "multiagent",
+        "sub agents",
+        "subagents",
+    ),
+    "stateful_agents": (
+        "stateful agents",
+        "stateful agent",
+        "stateful multi agent",
+        "state management",
+    ),
+    "callbacks": ("callbacks", "callback"),
+    "sequential_agents": (
+        "sequential agents",
+        "sequential agent",
+        "sequentialagent",
+        "sequential workflow",
+        "sequential workflows",
+    ),
+    "parallel_agents": (
+        "parallel agents",
+        "parallel agent",
+        "parallelagent",
+        "parallel workflow",
+        "parallel workflows",
+    ),
+    "loop_agents": (
+        "loop agents",
+        "loop agent",
+        "loopagent",
+        "iterative refinement",
+        "refinement loop",
+    ),
+}
+# Word tuple -> capability; a post is matched by intersecting its runs of
+# one, two and three adjacent words with these keys
+PHRASE_CAPABILITIES = {
+    tuple(phrase.split()): name
+    for name, phrases in CAPABILITY_PHRASES.items()
+    for phrase in phrases
+}
+PHRASE_SET = frozenset(PHRASE_CAPABILITIES)
+MAX_PHRASE_WORDS = max(len(phrase) for phrase in PHRASE_SET)
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def find_capabilities(text: str) -> List[str]:
+    """
+    List the ADK capabilities a post mentions.
+
+    Args:
+        text: The post
+
+    Returns:
+        List[str]: Capability names, in ``CAPABILITY_PHRASES`` order
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    # Set intersections run in C; no per-word Python loop
+    found = {
+        PHRASE_CAPABILITIES[key]
+        for length in range(1, MAX_PHRASE_WORDS + 1)
+        for key in PHRASE_SET & set(zip(*(words[i:] for i in range(length))))
+    }
+    return [name for name in CAPABILITY_PHRASES if name in found]
+
+
+def check_post(text: str) -> Dict[str, Any]:
+    """
+    Check a post against every mechanical rule.
+
+    Args:
+        text: The post
+
+    Returns:
+        Dict[str, Any]: Dictionary containing:
+            - passed: True if every rule passes
+            - char_count: number of characters in the post
+            - capabilities: ADK capabilities mentioned
+            - failures: one record per failed rule, with the rule name, a
+              message the refiner can act on and rule-specific details
+    """
+    char_count = len(text)
+    failures = []
+
+    if char_count < MIN_LENGTH:
+        failures.append(
+            {
+                "rule": "length",
+                "message": f"Post is too short. Add {MIN_LENGTH - char_count} more "
+                f"characters to reach the minimum length of {MIN_LENGTH}.",
+                "char_count": char_count,
+            }
+        )
+    elif char_count > MAX_LENGTH:
+        failures.append(
+            {
+                "rule": "length",
+                "message": f"Post is too long. Remove {char_count - MAX_LENGTH} "
+                f"characters to meet the maximum length of {MAX_LENGTH}.",
+                "char_count": char_count,
+            }
+        )
+
+    emojis = EMOJI_PATTERN.findall(text)
+    if emojis:
+        failures.append(
+            {
+                "rule": "no_emojis",
+                "message": f"Remove all emojis ({len(emojis)} found).",
+                "found": sorted(set(emojis)),
+            }
+        )
+
+    hashtags = HASHTAG_PATTERN.findall(text)
+    if hashtags:
+        failures.append(
+            {
+                "rule": "no_hashtags",
+                "message": f"Remove all hashtags: {', '.join(hashtags)}.",
+                "found": hashtags,
+            }
+        )
+
+    if not MENTION_PATTERN.search(text):
+        failures.append(
+            {
+                "rule": "mention",
+                "message": f"Mention/tag {REQUIRED_MENTION}.",
+            }
+        )
+
+    capabilities = find_capabilities(text)
+    if len(capabilities) < MIN_CAPABILITIES:
+        missing = [name for name in CAPABILITY_PHRASES if name not in capabilities]
+        failures.append(
+            {
+                "rule": "capabilities",
+                "message": f"Mention at least {MIN_CAPABILITIES} specific ADK "
+                f"capabilities (found {len(capabilities)}). For example: "
+                + ", ".join(CAPABILITY_PHRASES[name][0] for name in missing[:4])
+                + ".",
+                "found": capabilities,
+            }
+        )
+
+    return {
+        "passed": not failures,
+        "char_count": char_count,
+        "capabilities": capabilities,
+        "failures": failures,
+    }
+
+
+def length_gap(char_count: int) -> int:
+    """Characters outside the allowed length range (0 when inside it)."""
+    return max(MIN_LENGTH - char_count, char_count - MAX_LENGTH, 0)
+
+
+def score_post(text: str) -> float:
+    """
+    Score a post for how close it is to passing the rules (higher is better).
+
+    Every failed rule costs ``FAILURE_PENALTY``, each character outside the
+    length range costs a little more, and each capability mentioned beyond
+    the minimum breaks ties between posts that pass.
+
+    Args:
+        text: The post
+
+    Returns:
+        float: The score; a post that passes every rule scores at least 0
+    """
+    result = check_post(text)
+    return (
+        -FAILURE_PENALTY * len(result["failures"])
+        - LENGTH_GAP_PENALTY * length_gap(result["char_count"])
+        + CAPABILITY_BONUS * max(len(result["capabilities"]) - MIN_CAPABILITIES, 0)
+    )
+
+
+def format_failures(failures: List[Dict[str, Any]]) -> str:
+    """Render rule failures as a bullet list for the reviewer and refiner."""
+    if not failures:
+        return "All mechanical checks passed."
+    return "\n".join(
+        f"- [{failure['rule']}] {failure['message']}" for failure in failures
+    )
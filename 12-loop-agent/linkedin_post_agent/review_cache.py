@@ -0,0 +1,143 @@
+"""
+Review Verdict Cache
+
+This module remembers what PostReviewer said about a post, so a post that
+was already reviewed is not reviewed again at full cost. Entries are keyed by
+the hash of the whitespace-normalized post plus a version of the reviewer
+(its instruction and model), so editing the prompt or switching models
+invalidates them. The cache is a size-bounded LRU that lives for the whole
+process, so every session shares it: records of a batch, retries of failed
+records and separate conversations in ``adk web``.
+
+Within one run, a repeated post already ends the loop in ConvergenceCheck;
+the cache pays off across runs that arrive at the same draft or refinement.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from google.genai import types
+
+from .convergence import post_hash
+
+# --- Constants ---
+DEFAULT_MAX_ENTRIES = 1024
+# What the reviewer says when it calls exit_loop
+APPROVED_MESSAGE = "Post meets all requirements. Exiting the refinement loop."
+
+
+def reviewer_version(instruction: str, model: str) -> str:
+    """Short hash identifying the reviewer's instruction and model."""
+    return hashlib.sha1(f"{model}\n{instruction}".encode("utf-8")).hexdigest()[:12]
+
+
+class ReviewCache:
+    """
+    LRU cache of reviewer verdicts, with the callbacks that use it.
+
+    Args:
+        version: Reviewer version (see ``reviewer_version``)
+        max_entries: Maximum number of verdicts kept (0 disables the cache)
+    """
+
+    def __init__(self, version: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.version = version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, post: str) -> str:
+        return f"{self.version}:{post_hash(post)}"
+
+    def get(self, post: str) -> Optional[Dict[str, Any]]:
+        """The cached verdict for a post, if any (counts a hit or a miss)."""
+        key = self.key(post)
+        with self._lock:
+            verdict = self._entries.get(key)
+            if verdict is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return verdict
+
+    def put(self, post: str, verdict: Dict[str, Any]) -> None:
+        """Store a verdict, evicting the least recently used beyond the limit."""
+        if self.max_entries <= 0:
+            return
+        key = self.key(post)
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+    # --- Reviewer callbacks ---
+
+    def before_review(self, callback_context) -> Optional[types.Content]:
+        """
+        Answer from the cache instead of running the reviewer.
+
+        Returning content makes ADK skip the reviewer; the state changes a
+        real review would have made are applied with it.
+        """
+        state = callback_context.state
+        verdict = self.get(state.get("current_post", ""))
+        if verdict is None:
+            return None
+        state["review_feedback"] = verdict["feedback"]
+        state["review_status"] = verdict["review_status"]
+        if verdict["approved"]:
+            # Same effect as the reviewer calling exit_loop
+            state["loop_exit"] = {
+                "reason": "reviewer_approved",
+                "iteration": state.get("loop_iteration"),
+            }
+            # CallbackContext has no public event actions in this ADK version
+            callback_context._event_actions.escalate = True
+        return types.Content(role="model", parts=[types.Part(text=verdict["feedback"])])
+
+    def after_review_tool(self, tool, args, tool_context, tool_response) -> None:
+        """Cache approvals; the loop stops before the reviewer finishes them."""
+        if tool.name == "exit_loop":
+            self.put(
+                tool_context.state.get("current_post", ""),
+                {
+                    "approved": True,
+                    "feedback": APPROVED_MESSAGE,
+                    "review_status": tool_context.state.get("review_status"),
+                },
+            )
+
+    def after_review(self, callback_context) -> None:
+        """Cache the feedback of a review that did not approve the post."""
+        state = callback_context.state
+        feedback = state.get("review_feedback")
+        if feedback:
+            self.put(
+                state.get("current_post", ""),
+                {
+                    "approved": False,
+                    "feedback": feedback,
+                    "review_status": state.get("review_status"),
+                },
+            )
@@ -4,6 +4,10 @@ LinkedIn Post Agent Subagents Package
 This package provides all subagents used in the LinkedIn post generation system.
 """
 
-from .post_generator import initial_post_generator
+from .convergence_check import convergence_check
+from .draft_selector import DraftSelectorAgent
+from .patch_refiner import patch_refiner
+from .post_generator import initial_post_generator, make_draft_generator
 from .post_refiner import post_refiner
 from .post_reviewer import post_reviewer
+from .post_validator import post_validator
@@ -0,0 +1,8 @@
+"""
+LinkedIn Post Convergence Check Agent Package
+
+This package provides an agent that ends the refinement loop when refining
+stops making progress.
+"""
+
+from .agent import convergence_check
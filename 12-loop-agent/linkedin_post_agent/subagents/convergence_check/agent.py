@@ -0,0 +1,94 @@
+"""
+LinkedIn Post Convergence Check Agent
+
+This agent runs at the start of every refinement iteration. It records the
+post's hash, length and edit distance from the previous iteration, and ends
+the loop (without a model call) when the refiner repeats an earlier post,
+only makes negligible edits, or keeps moving the length away from the
+allowed range. Why the loop ended is written to the ``loop_exit`` state key.
+"""
+
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from ...convergence import MAX_ITERATIONS, assess
+from ...post_rules import check_post
+
+# --- Constants ---
+EXIT_MESSAGES = {
+    "repeated_post": "The refiner returned a post it already produced",
+    "stalled": "The refiner's last edits changed almost nothing",
+    "length_diverging": "The post length keeps moving away from 1000-1500 characters",
+}
+
+
+class ConvergenceCheckAgent(BaseAgent):
+    """Tracks the post across iterations and escalates when it stops improving."""
+
+    max_iterations: int
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        post = state.get("current_post", "")
+        # The history belongs to one run of the pipeline
+        if state.get("loop_invocation") == ctx.invocation_id:
+            history = list(state.get("post_history", []))
+            previous_post = state.get("previous_post")
+        else:
+            history, previous_post = [], None
+
+        record, reason = assess(history, post, previous_post)
+        # A post that passes the rules is never cut short; the validator
+        # ends the loop for it
+        if reason and check_post(post)["passed"]:
+            reason = None
+        iteration = record["iteration"]
+
+        state_delta = {
+            "loop_invocation": ctx.invocation_id,
+            "loop_iteration": iteration,
+            "post_history": history + [record],
+            "previous_post": post,
+        }
+        if reason:
+            state_delta["loop_exit"] = {"reason": reason, "iteration": iteration}
+        elif iteration == self.max_iterations:
+            # Unless something else ends this last iteration, the loop runs out
+            state_delta["loop_exit"] = {
+                "reason": "max_iterations",
+                "iteration": iteration,
+            }
+
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=(
+                types.Content(
+                    role="model",
+                    parts=[
+                        types.Part(
+                            text=f"{EXIT_MESSAGES[reason]}. "
+                            "Exiting the refinement loop."
+                        )
+                    ],
+                )
+                if reason
+                else None
+            ),
+            actions=EventActions(state_delta=state_delta, escalate=bool(reason)),
+        )
+
+
+# Convergence Check Agent
+convergence_check = ConvergenceCheckAgent(
+    name="ConvergenceCheck",
+    max_iterations=MAX_ITERATIONS,
+    description="Ends the refinement loop when refining stops making progress",
+)
@@ -0,0 +1,8 @@
+"""
+LinkedIn Post Draft Selector Agent Package
+
+This package provides an agent for picking the best of several candidate
+drafts without a model call.
+"""
+
+from .agent import DraftSelectorAgent
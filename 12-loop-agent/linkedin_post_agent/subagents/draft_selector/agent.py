@@ -0,0 +1,59 @@
+"""
+LinkedIn Post Draft Selector Agent
+
+This agent scores the candidate drafts written by the parallel draft
+generators with the local rules scorer and copies the best one to
+``current_post``, where the refinement loop picks it up. It calls no model.
+"""
+
+from typing import AsyncGenerator, List
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from ...post_rules import score_post
+
+
+class DraftSelectorAgent(BaseAgent):
+    """Copies the highest-scoring draft to ``current_post``."""
+
+    draft_keys: List[str]
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        drafts = {
+            key: ctx.session.state[key]
+            for key in self.draft_keys
+            if ctx.session.state.get(key)
+        }
+        scores = {key: round(score_post(draft), 1) for key, draft in drafts.items()}
+        # Ties go to the first draft, so the choice is deterministic
+        best = max(scores, key=scores.get) if scores else None
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(
+                role="model",
+                parts=[
+                    types.Part(
+                        text=(
+                            f"Selected {best} of {len(self.draft_keys)} drafts "
+                            f"(scores: {scores})."
+                            if best
+                            else "No drafts were generated."
+                        )
+                    )
+                ],
+            ),
+            actions=EventActions(
+                state_delta={
+                    "current_post": drafts[best] if best else "",
+                    "draft_scores": scores,
+                    "selected_draft": best,
+                }
+            ),
+        )
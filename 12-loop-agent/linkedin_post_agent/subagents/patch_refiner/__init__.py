@@ -0,0 +1,8 @@
+"""
+LinkedIn Post Patch Refiner Agent Package
+
+This package provides an agent for refining LinkedIn posts with small edit
+operations instead of full rewrites.
+"""
+
+from .agent import patch_refiner
@@ -0,0 +1,139 @@
+"""
+LinkedIn Post Patch Refiner Agent
+
+This agent refines LinkedIn posts by asking the model for a list of edit
+operations (see ``patches.py``) instead of the whole rewritten post, and
+applies them to ``current_post`` locally. Most feedback asks for a few small
+fixes, so the model writes tens of tokens instead of the full 1000-1500
+character post. A patch that does not apply cleanly is retried with the
+reason; if it still fails, the post is rewritten in full as before.
+"""
+
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from pydantic import ValidationError
+
+from ...patches import PatchError, PostPatch, apply_patch
+from ..post_refiner.agent import GEMINI_MODEL, REFINER_INSTRUCTION
+
+# --- Constants ---
+MAX_PATCH_ATTEMPTS = 2
+
+
+class PatchRefinerAgent(BaseAgent):
+    """Applies the patch writer's edits, retrying or rewriting on failure."""
+
+    patch_writer: LlmAgent
+    rewriter: LlmAgent
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        for attempt in range(1, MAX_PATCH_ATTEMPTS + 1):
+            try:
+                async for event in self.patch_writer.run_async(ctx):
+                    yield event
+                patch = PostPatch.model_validate(ctx.session.state["post_patch"])
+                post = apply_patch(ctx.session.state["current_post"], patch.edits)
+            except ValidationError as e:
+                error = f"The reply was not a valid patch: {e.errors()[0]['msg']}"
+            except PatchError as e:
+                error = str(e)
+            else:
+                yield self._state_event(
+                    ctx,
+                    {
+                        "current_post": post,
+                        "patch_error": "",
+                        "patch_attempts": attempt,
+                    },
+                )
+                return
+            # The error is shown to the patch writer on the next attempt
+            yield self._state_event(
+                ctx, {"patch_error": error, "patch_attempts": attempt}
+            )
+
+        async for event in self.rewriter.run_async(ctx):
+            yield event
+        yield self._state_event(ctx, {"patch_error": ""})
+
+    def _state_event(self, ctx: InvocationContext, state_delta: dict) -> Event:
+        return Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta=state_delta),
+        )
+
+
+# Post Patch Writer Agent
+post_patch_writer = LlmAgent(
+    name="PostPatchWriter",
+    model=GEMINI_MODEL,
+    instruction="""You are a LinkedIn Post Patch Writer.
+
+    Your task is to fix a LinkedIn post based on review feedback by returning
+    the smallest set of edits, NOT a rewritten post.
+    
+    ## INPUTS
+    **Current Post:**
+    {current_post}
+    
+    **Review Feedback:**
+    {review_feedback}
+    
+    **Failed Rule Checks:**
+    {validation_feedback}
+    
+    **Previous Patch Rejected Because:**
+    {patch_error?}
+    
+    ## EDIT OPERATIONS
+    - replace: replace the text in `find` with `text`
+    - insert_before / insert_after: add `text` before or after the text in `find`
+    - delete: remove the text in `find`
+    
+    `find` must be copied exactly from the current post and must occur only
+    once in it; quote a whole phrase or sentence rather than a single word.
+    Edits are applied in order. Keep the post between 1000-1500 characters,
+    with NO emojis and NO hashtags.
+    
+    ## OUTPUT INSTRUCTIONS
+    Your response MUST be valid JSON matching this structure:
+    {
+        "edits": [
+            {"op": "replace", "find": "exact text", "text": "new text"}
+        ]
+    }
+    
+    DO NOT include any explanations or additional text outside the JSON response.
+    """,
+    description="Writes edit operations that fix the post based on feedback",
+    output_schema=PostPatch,
+    output_key="post_patch",
+    # Structured output and agent transfer cannot be combined
+    disallow_transfer_to_parent=True,
+    disallow_transfer_to_peers=True,
+)
+
+# Full rewrite fallback for patches that keep failing
+post_rewriter = LlmAgent(
+    name="PostRewriter",
+    model=GEMINI_MODEL,
+    instruction=REFINER_INSTRUCTION,
+    description="Rewrites the whole post when a patch cannot be applied",
+    output_key="current_post",
+)
+
+# Patch Refiner Agent
+patch_refiner = PatchRefinerAgent(
+    name="PatchRefiner",
+    patch_writer=post_patch_writer,
+    rewriter=post_rewriter,
+    sub_agents=[post_patch_writer, post_rewriter],
+    description="Refines the post with small edits based on feedback",
+)
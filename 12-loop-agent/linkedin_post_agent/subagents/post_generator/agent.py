@@ -1,19 +1,20 @@
 """
 LinkedIn Post Generator Agent
 
-This agent generates the initial LinkedIn post before refinement.
+This agent generates the initial LinkedIn post before refinement. For
+best-of-N generation, ``make_draft_generator`` creates generators that write
+candidate drafts to their own output keys.
 """
 
 from google.adk.agents.llm_agent import LlmAgent
+from google.genai import types
 
 # Constants
 GEMINI_MODEL = "gemini-2.0-flash"
+# Best-of-N drafts are sampled hotter, so the candidates differ
+DRAFT_TEMPERATURE = 1.0
 
-# Define the Initial Post Generator Agent
-initial_post_generator = LlmAgent(
-    name="InitialPostGenerator",
-    model=GEMINI_MODEL,
-    instruction="""You are a LinkedIn Post Generator.
+GENERATOR_INSTRUCTION = """You are a LinkedIn Post Generator.
 
     Your task is to create a LinkedIn post about an Agent Development Kit (ADK) tutorial by @aiwithbrandon.
     
@@ -47,7 +48,35 @@ initial_post_generator = LlmAgent(
     ## OUTPUT INSTRUCTIONS
     - Return ONLY the post content
     - Do not add formatting markers or explanations
-    """,
+    """
+
+# Define the Initial Post Generator Agent
+initial_post_generator = LlmAgent(
+    name="InitialPostGenerator",
+    model=GEMINI_MODEL,
+    instruction=GENERATOR_INSTRUCTION,
     description="Generates the initial LinkedIn post to start the refinement process",
     output_key="current_post",
 )
+
+
+def make_draft_generator(index: int) -> LlmAgent:
+    """
+    Create a generator for one candidate draft of a best-of-N run.
+
+    Args:
+        index: Draft number, starting at 1
+
+    Returns:
+        LlmAgent: Generator writing to the ``draft_<index>`` state key
+    """
+    return LlmAgent(
+        name=f"DraftGenerator{index}",
+        model=GEMINI_MODEL,
+        instruction=GENERATOR_INSTRUCTION,
+        description=f"Generates candidate draft {index} of the LinkedIn post",
+        generate_content_config=types.GenerateContentConfig(
+            temperature=DRAFT_TEMPERATURE
+        ),
+        output_key=f"draft_{index}",
+    )
@@ -9,11 +9,7 @@ from google.adk.agents.llm_agent import LlmAgent
 # Constants
 GEMINI_MODEL = "gemini-2.0-flash"
 
-# Define the Post Refiner Agent
-post_refiner = LlmAgent(
-    name="PostRefinerAgent",
-    model=GEMINI_MODEL,
-    instruction="""You are a LinkedIn Post Refiner.
+REFINER_INSTRUCTION = """You are a LinkedIn Post Refiner.
 
     Your task is to refine a LinkedIn post based on review feedback.
     
@@ -24,8 +20,12 @@ post_refiner = LlmAgent(
     **Review Feedback:**
     {review_feedback}
     
+    **Failed Rule Checks:**
+    {validation_feedback}
+    
     ## TASK
-    Carefully apply the feedback to improve the post.
+    Carefully apply the feedback to improve the post. Fix every failed rule
+    check first; each one names the rule and what to change.
     - Maintain the original tone and theme of the post
     - Ensure all content requirements are met:
       1. Excitement about learning from the tutorial
@@ -44,7 +44,13 @@ post_refiner = LlmAgent(
     ## OUTPUT INSTRUCTIONS
     - Output ONLY the refined post content
     - Do not add explanations or justifications
-    """,
+    """
+
+# Define the Post Refiner Agent
+post_refiner = LlmAgent(
+    name="PostRefinerAgent",
+    model=GEMINI_MODEL,
+    instruction=REFINER_INSTRUCTION,
     description="Refines LinkedIn posts based on feedback to improve quality",
     output_key="current_post",
 )
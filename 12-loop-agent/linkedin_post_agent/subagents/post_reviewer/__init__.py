@@ -4,4 +4,4 @@ LinkedIn Post Reviewer Agent Package
 This package provides an agent for reviewing and validating LinkedIn posts.
 """
 
-from .agent import post_reviewer
+from .agent import post_reviewer, review_cache
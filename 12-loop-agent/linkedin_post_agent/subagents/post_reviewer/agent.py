@@ -2,23 +2,32 @@
 LinkedIn Post Reviewer Agent
 
 This agent reviews LinkedIn posts for quality and provides feedback.
+Verdicts are cached by post content, so a post that was already reviewed is
+answered from the cache without a model call.
 """
 
+import os
+
 from google.adk.agents.llm_agent import LlmAgent
 
+from ...review_cache import DEFAULT_MAX_ENTRIES, ReviewCache, reviewer_version
 from .tools import count_characters, exit_loop
 
 # Constants
 GEMINI_MODEL = "gemini-2.0-flash"
+# LINKEDIN_REVIEW_CACHE_SIZE=0 turns the verdict cache off
+REVIEW_CACHE_SIZE = int(os.getenv("LINKEDIN_REVIEW_CACHE_SIZE", DEFAULT_MAX_ENTRIES))
 
-# Define the Post Reviewer Agent
-post_reviewer = LlmAgent(
-    name="PostReviewer",
-    model=GEMINI_MODEL,
-    instruction="""You are a LinkedIn Post Quality Reviewer.
+REVIEWER_INSTRUCTION = """You are a LinkedIn Post Quality Reviewer.
 
     Your task is to evaluate the quality of a LinkedIn post about Agent Development Kit (ADK).
     
+    ## MECHANICAL CHECKS
+    An automatic validator has already checked length, emojis, hashtags, the
+    @aiwithbrandon mention and the number of ADK capabilities. It found:
+    {validation_feedback}
+    Every failure listed there must be part of your feedback.
+    
     ## EVALUATION PROCESS
     1. Use the count_characters tool to check the post's length.
        Pass the post text directly to the tool.
@@ -53,8 +62,23 @@ post_reviewer = LlmAgent(
     
     ## POST TO REVIEW
     {current_post}
-    """,
+    """
+
+# Shared by every session in the process
+review_cache = ReviewCache(
+    version=reviewer_version(REVIEWER_INSTRUCTION, GEMINI_MODEL),
+    max_entries=REVIEW_CACHE_SIZE,
+)
+
+# Define the Post Reviewer Agent
+post_reviewer = LlmAgent(
+    name="PostReviewer",
+    model=GEMINI_MODEL,
+    instruction=REVIEWER_INSTRUCTION,
     description="Reviews post quality and provides feedback on what to improve or exits the loop if requirements are met",
     tools=[count_characters, exit_loop],
     output_key="review_feedback",
+    before_agent_callback=review_cache.before_review,
+    after_agent_callback=review_cache.after_review,
+    after_tool_callback=review_cache.after_review_tool,
 )
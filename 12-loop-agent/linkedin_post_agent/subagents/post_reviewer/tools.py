@@ -75,5 +75,9 @@ def exit_loop(tool_context: ToolContext) -> Dict[str, Any]:
     print("Loop will exit now")
     print("------------------------------------------\n")
 
+    tool_context.state["loop_exit"] = {
+        "reason": "reviewer_approved",
+        "iteration": tool_context.state.get("loop_iteration"),
+    }
     tool_context.actions.escalate = True
     return {}
@@ -0,0 +1,8 @@
+"""
+LinkedIn Post Validator Agent Package
+
+This package provides an agent for checking LinkedIn posts against the
+mechanical rules without a model call.
+"""
+
+from .agent import post_validator
@@ -0,0 +1,64 @@
+"""
+LinkedIn Post Validator Agent
+
+This agent checks the current post against the mechanical rules (length,
+emojis, hashtags, the @aiwithbrandon mention and ADK capabilities) before
+the reviewer runs. It calls no model. When every rule passes it ends the
+refinement loop itself; otherwise it hands the failed rules to the reviewer
+and refiner as structured feedback.
+"""
+
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from ...post_rules import check_post, format_failures
+
+
+class PostValidatorAgent(BaseAgent):
+    """Checks ``current_post`` and escalates out of the loop when it passes."""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        validation = check_post(ctx.session.state.get("current_post", ""))
+        passed = validation["passed"]
+        state_delta = {
+            "validation": validation,
+            "validation_feedback": format_failures(validation["failures"]),
+            "review_status": "pass" if passed else "fail",
+        }
+        if passed:
+            state_delta["loop_exit"] = {
+                "reason": "passed_rules",
+                "iteration": ctx.session.state.get("loop_iteration"),
+            }
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=(
+                types.Content(
+                    role="model",
+                    parts=[
+                        types.Part(
+                            text="Post passes all mechanical checks. "
+                            "Exiting the refinement loop."
+                        )
+                    ],
+                )
+                if passed
+                else None
+            ),
+            actions=EventActions(state_delta=state_delta, escalate=passed),
+        )
+
+
+# Post Validator Agent
+post_validator = PostValidatorAgent(
+    name="PostValidator",
+    description="Checks the post against the mechanical rules and exits the loop if they all pass",
+)
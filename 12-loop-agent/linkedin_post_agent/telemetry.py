@@ -0,0 +1,323 @@
+"""
+Refinement Loop Telemetry
+
+This module records what happens in every iteration of PostRefinementLoop:
+how long each step took, the model calls made, the count_characters results,
+the review status, the post length, how many words changed since the previous
+iteration and whether exit_loop fired. Everything is collected through agent,
+model and tool callbacks and kept in memory here, never in session state, so
+the pipeline behaves the same with or without it. When a run's loop ends its
+iterations are appended to a JSONL file.
+
+Enable it by setting LINKEDIN_LOOP_TELEMETRY to the output file, then print
+the summary table for everything collected so far:
+
+    LINKEDIN_LOOP_TELEMETRY=loop_telemetry.jsonl python batch.py topics.jsonl posts.jsonl
+    python -m linkedin_post_agent.telemetry loop_telemetry.jsonl
+"""
+
+import json
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.adk.agents import BaseAgent, LlmAgent
+
+from .convergence import edit_distance
+
+
+class LoopTelemetry:
+    """
+    Collects one record per refinement loop iteration.
+
+    Args:
+        output_path: JSONL file each finished run's records are appended to
+            (optional; ``records`` holds them either way)
+    """
+
+    def __init__(self, output_path: Optional[str] = None):
+        self.output_path = output_path
+        self.records: List[Dict[str, Any]] = []
+        self.loop_name: Optional[str] = None
+        self.steps: List[str] = []
+        # Per invocation: the iterations so far and the post at the start of
+        # the last one; per (invocation, agent): when the agent started
+        self._runs: Dict[str, List[Dict[str, Any]]] = {}
+        self._last_post: Dict[str, str] = {}
+        self._started: Dict[Tuple[str, str], float] = {}
+
+    def _current(self, invocation_id: str) -> Optional[Dict[str, Any]]:
+        iterations = self._runs.get(invocation_id)
+        return iterations[-1] if iterations else None
+
+    # --- Callbacks (all return None so they never change behavior) ---
+
+    def before_agent(self, callback_context) -> None:
+        invocation_id = callback_context.invocation_id
+        name = callback_context.agent_name
+        self._started[(invocation_id, name)] = time.perf_counter()
+        if name == self.loop_name:
+            self._runs[invocation_id] = []
+            self._last_post.pop(invocation_id, None)
+        elif name == self.steps[0]:
+            self._start_iteration(callback_context)
+
+    def _start_iteration(self, callback_context) -> None:
+        invocation_id = callback_context.invocation_id
+        state = callback_context.state
+        post = state.get("current_post", "")
+        previous = self._last_post.get(invocation_id)
+        self._close_iteration(invocation_id, state)
+        iterations = self._runs.setdefault(invocation_id, [])
+        iterations.append(
+            {
+                "invocation_id": invocation_id,
+                "record_id": state.get("record_id"),
+                "iteration": len(iterations) + 1,
+                "post_chars": len(post),
+                # Words changed by the previous iteration's refinement
+                "diff_words": (
+                    edit_distance(previous.split(), post.split())
+                    if previous is not None
+                    else None
+                ),
+                "step_ms": {},
+                "model_calls": 0,
+                "char_checks": [],
+                "review_status": None,
+                "exit_loop_called": False,
+                "loop_exit": None,
+            }
+        )
+        self._last_post[invocation_id] = post
+
+    def after_agent(self, callback_context) -> None:
+        invocation_id = callback_context.invocation_id
+        name = callback_context.agent_name
+        started = self._started.pop((invocation_id, name), None)
+        if name == self.loop_name:
+            self._finish_run(callback_context)
+            return
+        record = self._current(invocation_id)
+        if record is not None and name in self.steps and started is not None:
+            record["step_ms"][name] = round((time.perf_counter() - started) * 1000, 1)
+
+    def _close_iteration(self, invocation_id: str, state) -> None:
+        """
+        Complete the current iteration's record.
+
+        A step that escalates never reaches its after-agent callback (the
+        loop stops reading its events), so it is timed up to this point.
+        """
+        record = self._current(invocation_id)
+        if record is None:
+            return
+        now = time.perf_counter()
+        for name in self.steps:
+            started = self._started.pop((invocation_id, name), None)
+            if started is not None:
+                record["step_ms"][name] = round((now - started) * 1000, 1)
+        record["review_status"] = state.get("review_status")
+
+    def after_model(self, callback_context, llm_response) -> None:
+        record = self._current(callback_context.invocation_id)
+        if record is not None:
+            record["model_calls"] += 1
+
+    def before_tool(self, tool, args, tool_context) -> None:
+        record = self._current(tool_context.invocation_id)
+        if record is not None and tool.name == "exit_loop":
+            record["exit_loop_called"] = True
+
+    def after_tool(self, tool, args, tool_context, tool_response) -> None:
+        record = self._current(tool_context.invocation_id)
+        if record is not None and tool.name == "count_characters":
+            record["char_checks"].append(
+                {
+                    "result": tool_response.get("result"),
+                    "char_count": tool_response.get("char_count"),
+                }
+            )
+
+    def _finish_run(self, callback_context) -> None:
+        """Mark why the loop ended and write out the run's iterations."""
+        invocation_id = callback_context.invocation_id
+        self._close_iteration(invocation_id, callback_context.state)
+        iterations = self._runs.pop(invocation_id, [])
+        self._last_post.pop(invocation_id, None)
+        if not iterations:
+            return
+        loop_exit = callback_context.state.get("loop_exit") or {}
+        iterations[-1]["loop_exit"] = loop_exit.get("reason", "max_iterations")
+        self.records.extend(iterations)
+        if self.output_path:
+            with open(self.output_path, "a") as file:
+                for record in iterations:
+                    file.write(json.dumps(record) + "\n")
+
+
+# --- Reports ---
+
+
+def load_records(path: str) -> List[Dict[str, Any]]:
+    """Read the records written to a telemetry file."""
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate the records by iteration number.
+
+    Args:
+        records: Iteration records from ``LoopTelemetry``
+
+    Returns:
+        Dict[str, Any]: Runs, iterations per run, exit reasons and, for each
+            iteration number, mean step latencies, model calls, post length,
+            changed words, the count_characters pass rate and how often
+            exit_loop fired
+    """
+    runs = [record for record in records if record["loop_exit"]]
+    steps = list(dict.fromkeys(step for r in records for step in r["step_ms"]))
+    by_iteration: Dict[int, List[Dict[str, Any]]] = {}
+    for record in records:
+        by_iteration.setdefault(record["iteration"], []).append(record)
+
+    def mean(values: List[float]) -> Optional[float]:
+        return round(statistics.mean(values), 1) if values else None
+
+    table = []
+    for iteration, group in sorted(by_iteration.items()):
+        checks = [check for record in group for check in record["char_checks"]]
+        table.append(
+            {
+                "iteration": iteration,
+                "runs": len(group),
+                "step_ms": {
+                    step: mean(
+                        [r["step_ms"][step] for r in group if step in r["step_ms"]]
+                    )
+                    for step in steps
+                },
+                "model_calls": mean([r["model_calls"] for r in group]),
+                "post_chars": mean([r["post_chars"] for r in group]),
+                "diff_words": mean(
+                    [r["diff_words"] for r in group if r["diff_words"] is not None]
+                ),
+                "char_check_pass": (
+                    round(
+                        sum(check["result"] == "pass" for check in checks)
+                        / len(checks),
+                        2,
+                    )
+                    if checks
+                    else None
+                ),
+                "exit_loop_called": sum(r["exit_loop_called"] for r in group),
+                "exits": dict(Counter(r["loop_exit"] for r in group if r["loop_exit"])),
+            }
+        )
+    return {
+        "runs": len(runs),
+        "mean_iterations": mean([run["iteration"] for run in runs]),
+        "exit_reasons": dict(Counter(run["loop_exit"] for run in runs)),
+        "steps": steps,
+        "iterations": table,
+    }
+
+
+def format_summary(records: List[Dict[str, Any]]) -> str:
+    """The summary as a plain-text table, one row per iteration number."""
+    summary = summarize(records)
+    steps = summary["steps"]
+
+    def cell(value: Any, width: int) -> str:
+        return f"{'-' if value is None else value:>{width}}"
+
+    lines = [
+        f"{summary['runs']} runs, {summary['mean_iterations']} iterations on "
+        f"average, exit reasons: {summary['exit_reasons']}",
+        f"{'iter':>4} {'runs':>5} "
+        + " ".join(f"{step[:16] + '_ms':>19}" for step in steps)
+        + f" {'calls':>6} {'chars':>7} {'diff_w':>7} {'len_ok':>6}"
+        f" {'exit_loop':>9}  exits",
+    ]
+    for row in summary["iterations"]:
+        lines.append(
+            f"{row['iteration']:>4} {row['runs']:>5} "
+            + " ".join(cell(row["step_ms"][step], 19) for step in steps)
+            + f" {cell(row['model_calls'], 6)} {cell(row['post_chars'], 7)}"
+            f" {cell(row['diff_words'], 7)} {cell(row['char_check_pass'], 6)}"
+            f" {row['exit_loop_called']:>9}  "
+            + ", ".join(f"{reason} x{count}" for reason, count in row["exits"].items())
+        )
+    return "\n".join(lines)
+
+
+def _observe(existing, observer):
+    """Run the agent's own callback, then let the telemetry see the result."""
+    if existing is None:
+        return observer
+
+    def callback(*args, **kwargs):
+        result = existing(*args, **kwargs)
+        observer(*args, **kwargs)
+        return result
+
+    return callback
+
+
+def _start_step(existing, telemetry: LoopTelemetry):
+    """
+    Start timing an agent, then run its own before_agent callback.
+
+    When that callback skips the agent (a review cache hit), ADK does not
+    call after_agent either, so the step is ended right here.
+    """
+
+    def callback(callback_context):
+        telemetry.before_agent(callback_context)
+        skipped = existing(callback_context) if existing else None
+        if skipped is not None:
+            telemetry.after_agent(callback_context)
+        return skipped
+
+    return callback
+
+
+def _attach(agent: BaseAgent, telemetry: LoopTelemetry) -> None:
+    agent.before_agent_callback = _start_step(agent.before_agent_callback, telemetry)
+    agent.after_agent_callback = _observe(
+        agent.after_agent_callback, telemetry.after_agent
+    )
+    if isinstance(agent, LlmAgent):
+        agent.after_model_callback = _observe(
+            agent.after_model_callback, telemetry.after_model
+        )
+        agent.before_tool_callback = _observe(
+            agent.before_tool_callback, telemetry.before_tool
+        )
+        agent.after_tool_callback = _observe(
+            agent.after_tool_callback, telemetry.after_tool
+        )
+    for sub_agent in agent.sub_agents:
+        _attach(sub_agent, telemetry)
+
+
+def instrument(loop: BaseAgent, telemetry: LoopTelemetry) -> None:
+    """
+    Attach the telemetry callbacks to the refinement loop and its sub-agents.
+
+    The loop's direct sub-agents are the steps that get timed; an iteration
+    starts with the first of them.
+    """
+    telemetry.loop_name = loop.name
+    telemetry.steps = [sub_agent.name for sub_agent in loop.sub_agents]
+    _attach(loop, telemetry)
+
+
+if __name__ == "__main__":
+    print(format_summary(load_records(sys.argv[1])))
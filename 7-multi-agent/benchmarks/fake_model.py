@@ -0,0 +1,104 @@
+"""
+Scripted Model for Benchmarks
+
+A stand-in for Gemini that needs no network access or API key, so the
+manager agent can be benchmarked entirely offline together with a fixture
+market data provider. It plays the two agents a stock question goes
+through: the manager transfers to stock_analyst, which calls
+get_stock_prices for the tickers in the question and then reports the
+prices it got back.
+"""
+
+import asyncio
+import json
+import re
+from collections import Counter
+
+from google.adk.agents import BaseAgent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+from pydantic import Field
+
+TICKER_PATTERN = re.compile(r"\b[A-Z]{2,5}\b")
+# Agent -> phrase from its instruction that identifies it
+AGENT_MARKERS = {
+    "manager": "You are a manager agent",
+    "stock_analyst": "You are a helpful stock market assistant",
+}
+
+
+def question(llm_request: LlmRequest) -> str:
+    """The user's message, which is the first content."""
+    for content in llm_request.contents:
+        if content.role == "user" and content.parts and content.parts[0].text:
+            return content.parts[0].text
+    return ""
+
+
+def function_response(llm_request: LlmRequest):
+    """The tool result the last content carries, if any."""
+    if not llm_request.contents:
+        return None
+    for part in llm_request.contents[-1].parts or []:
+        if part.function_response:
+            return part.function_response
+    return None
+
+
+class ScriptedStockModel(BaseLlm):
+    """Routes stock questions to stock_analyst and answers with its tool."""
+
+    latency_sec: float = 0.0
+    # Model calls per agent
+    calls: Counter = Field(default_factory=Counter)
+
+    def reply(self, agent: str, llm_request: LlmRequest) -> types.Part:
+        if agent == "manager":
+            return types.Part(
+                function_call=types.FunctionCall(
+                    name="transfer_to_agent", args={"agent_name": "stock_analyst"}
+                )
+            )
+        response = function_response(llm_request)
+        if response is None:
+            return types.Part(
+                function_call=types.FunctionCall(
+                    name="get_stock_prices",
+                    args={"tickers": TICKER_PATTERN.findall(question(llm_request))},
+                )
+            )
+        quotes = response.response.get("quotes", [])
+        lines = [
+            f"- {quote['ticker']}: ${quote['price']} (updated at {quote['timestamp']})"
+            for quote in quotes
+        ]
+        return types.Part(
+            text=(
+                "Here are the current prices for your stocks:\n" + "\n".join(lines)
+                if lines
+                else json.dumps(response.response)
+            )
+        )
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        system = llm_request.config.system_instruction or ""
+        agent = next(
+            (agent for agent, marker in AGENT_MARKERS.items() if marker in system),
+            None,
+        )
+        if agent is None:
+            raise ValueError("No script for this agent")
+        self.calls[agent] += 1
+        if self.latency_sec:
+            await asyncio.sleep(self.latency_sec)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[self.reply(agent, llm_request)])
+        )
+
+
+def use_fake_model(agent: BaseAgent, model: BaseLlm) -> None:
+    """Point an agent and all of its sub-agents at the fake model."""
+    if hasattr(agent, "model"):
+        agent.model = model
+    for sub_agent in agent.sub_agents:
+        use_fake_model(sub_agent, model)
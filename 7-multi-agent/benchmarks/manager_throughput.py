@@ -0,0 +1,119 @@
+"""
+Manager Throughput Benchmark
+
+Runs --requests stock questions ("What are the prices of AAPL, NVDA, ...?")
+through the manager agent with --clients concurrent clients, entirely
+offline: a scripted model plays the manager and stock_analyst, and the
+quotes come from the sample fixture (fixtures/quotes.json) with --latency
+seconds per request. Each question asks about --tickers random stocks from
+the fixture. The run is repeated with the quote cache off (TTL 0, requests
+are still coalesced) and on (--ttl).
+
+Usage (from 7-multi-agent/):
+    python -m benchmarks.manager_throughput --requests 200 --clients 16
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import statistics
+import threading
+import time
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from manager.agent import root_agent
+from manager.sub_agents.stock_analyst.agent import quote_cache
+from manager.sub_agents.stock_analyst.providers import SAMPLE_FIXTURE, FixtureProvider
+
+from benchmarks.fake_model import ScriptedStockModel, use_fake_model
+
+APP_NAME = "manager_benchmark"
+USER_ID = "benchmark"
+
+
+def ask(runner: Runner, text: str) -> float:
+    """Run one question in a fresh session; returns its latency."""
+    session = runner.session_service.create_session(app_name=APP_NAME, user_id=USER_ID)
+    start = time.perf_counter()
+    for _ in runner.run(
+        user_id=USER_ID,
+        session_id=session.id,
+        new_message=types.Content(role="user", parts=[types.Part(text=text)]),
+    ):
+        pass
+    return time.perf_counter() - start
+
+
+def run(runner: Runner, questions, clients: int):
+    """Ask every question with ``clients`` threads; returns latencies and elapsed."""
+    pending = list(questions)
+    latencies = []
+    lock = threading.Lock()
+
+    def client():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                text = pending.pop()
+            latency = ask(runner, text)
+            with lock:
+                latencies.append(latency)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return latencies, time.perf_counter() - start
+
+
+def main(args):
+    provider = FixtureProvider.from_file(SAMPLE_FIXTURE, latency_sec=args.latency)
+    quote_cache.provider = provider
+    model = ScriptedStockModel(model="scripted", latency_sec=args.model_latency)
+    use_fake_model(root_agent, model)
+    runner = Runner(
+        agent=root_agent, app_name=APP_NAME, session_service=InMemorySessionService()
+    )
+    rng = random.Random(9)
+    tickers = sorted(provider.quotes)
+    questions = [
+        f"What are the prices of {', '.join(rng.sample(tickers, args.tickers))}?"
+        for _ in range(args.requests)
+    ]
+
+    print(
+        f"{'ttl_s':>5} {'req/s':>6} {'mean_s':>7} {'p95_s':>6} "
+        f"{'quote requests':>14} {'model calls':>11}  cache"
+    )
+    for ttl in (0.0, args.ttl):
+        quote_cache.ttl_sec = ttl
+        quote_cache.clear()
+        provider.requests = 0
+        model.calls.clear()
+        latencies, elapsed = run(runner, questions, args.clients)
+        latencies.sort()
+        print(
+            f"{ttl:>5.0f} {len(latencies) / elapsed:>6.1f} "
+            f"{statistics.mean(latencies):>7.2f} "
+            f"{latencies[int(len(latencies) * 0.95)]:>6.2f} "
+            f"{provider.requests:>14} {sum(model.calls.values()):>11}  "
+            f"{quote_cache.stats()}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the manager offline")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--tickers", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.25)
+    parser.add_argument("--model-latency", type=float, default=0.3)
+    parser.add_argument("--ttl", type=float, default=60.0)
+    main(parser.parse_args())
@@ -0,0 +1,118 @@
+"""
+Quote Latency Benchmark
+
+Measures per-ticker latency for a 20-stock watchlist with a local fixture
+provider whose requests take --latency seconds (plus --per-ticker seconds
+per ticker in the request), standing in for Yahoo Finance:
+
+- before: one request per ticker, no cache (what get_stock_price did with
+  a ``yf.Ticker(...).info`` call per ticker, on the event loop)
+- cold: get_stock_prices for the whole watchlist, one batched request
+- warm: the same call again within the TTL
+- coalesced: --callers concurrent tool calls on the event loop (as from
+  parallel sessions) ask for the watchlist at once on an empty cache
+
+Everything runs on one asyncio event loop, like the tools under ADK. A
+probe task measures how long the loop was stalled during each run: the
+tools wait for the provider without blocking it.
+
+Usage (from 7-multi-agent/):
+    python -m benchmarks.quote_latency --latency 0.25
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import time
+
+from manager.sub_agents.stock_analyst import agent as stock_analyst
+from manager.sub_agents.stock_analyst.providers import FixtureProvider
+
+PROBE_INTERVAL_SEC = 0.005
+WATCHLIST = [
+    "AAPL", "MSFT", "GOOG", "AMZN", "META", "NVDA", "TSLA", "NFLX", "AMD", "INTC",
+    "ORCL", "CRM", "ADBE", "IBM", "UBER", "SHOP", "PYPL", "QCOM", "AVGO", "CSCO",
+]  # fmt: skip
+
+
+async def timed(function):
+    """
+    Seconds the call took and the longest the event loop stalled meanwhile,
+    with the tools' progress lines silenced.
+    """
+    stall = 0.0
+
+    async def probe():
+        nonlocal stall
+        while True:
+            expected = time.perf_counter() + PROBE_INTERVAL_SEC
+            await asyncio.sleep(PROBE_INTERVAL_SEC)
+            stall = max(stall, time.perf_counter() - expected)
+
+    prober = asyncio.create_task(probe())
+    # Let the probe start before the call
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        await function()
+    elapsed = time.perf_counter() - start
+    # Give the probe a chance to notice a stall that lasted until now
+    await asyncio.sleep(PROBE_INTERVAL_SEC * 2)
+    prober.cancel()
+    return elapsed, stall
+
+
+async def main(args):
+    rng = random.Random(1)
+    provider = FixtureProvider(
+        {ticker: rng.uniform(20, 900) for ticker in WATCHLIST},
+        latency_sec=args.latency,
+        per_ticker_sec=args.per_ticker,
+    )
+    cache = stock_analyst.quote_cache
+    cache.provider = provider
+    rows = []
+
+    async def run(label, function):
+        provider.requests = 0
+        elapsed, stall = await timed(function)
+        rows.append((label, elapsed, stall, provider.requests))
+
+    async def before():
+        # A blocking request per ticker, nothing reused
+        for ticker in WATCHLIST:
+            provider.get_quotes([ticker])
+
+    async def callers():
+        await asyncio.gather(
+            *(stock_analyst.get_stock_prices(WATCHLIST) for _ in range(args.callers))
+        )
+
+    await run("before", before)
+    cache.clear()
+    await run("cold", lambda: stock_analyst.get_stock_prices(WATCHLIST))
+    await run("warm", lambda: stock_analyst.get_stock_prices(WATCHLIST))
+    cache.clear()
+    await run(f"coalesced x{args.callers}", callers)
+
+    print(
+        f"{'run':<14} {'total_ms':>9} {'ms/ticker':>10} {'loop_stall_ms':>14}"
+        f" {'requests':>9}"
+    )
+    for label, elapsed, stall, requests in rows:
+        print(
+            f"{label:<14} {elapsed * 1e3:>9.1f} "
+            f"{elapsed * 1e3 / len(WATCHLIST):>10.2f} {stall * 1e3:>14.1f}"
+            f" {requests:>9}"
+        )
+    print(f"cache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark quote fetching")
+    parser.add_argument("--latency", type=float, default=0.25)
+    parser.add_argument("--per-ticker", type=float, default=0.002)
+    parser.add_argument("--callers", type=int, default=8)
+    asyncio.run(main(parser.parse_args()))
@@ -1,40 +1,93 @@
-from datetime import datetime
+import asyncio
+import os
+from typing import List
 
-import yfinance as yf
 from google.adk.agents import Agent
 
+from .providers import provider_from_env
+from .quotes import DEFAULT_TTL_SEC, QuoteCache, normalize_ticker
 
-def get_stock_price(ticker: str) -> dict:
+# STOCK_DATA_PROVIDER picks the market data source (yfinance or a fixture).
+# Quotes are shared by every session; STOCK_QUOTE_TTL_SEC sets how long.
+# The tools are async, so ADK awaits them instead of running them on the
+# event loop, and the blocking provider requests run in worker threads
+quote_cache = QuoteCache(
+    provider_from_env(),
+    ttl_sec=float(os.getenv("STOCK_QUOTE_TTL_SEC", DEFAULT_TTL_SEC)),
+)
+
+
+async def get_stock_price(ticker: str) -> dict:
     """Retrieves current stock price and saves to session state."""
     print(f"--- Tool: get_stock_price called for {ticker} ---")
 
     try:
-        # Fetch stock data
-        stock = yf.Ticker(ticker)
-        current_price = stock.info.get("currentPrice")
+        # Fetch stock data (from the quote cache if it is recent enough)
+        quote = (await quote_cache.get_quotes([ticker]))[normalize_ticker(ticker)]
 
-        if current_price is None:
+        if quote is None:
             return {
                 "status": "error",
                 "error_message": f"Could not fetch price for {ticker}",
             }
 
-        # Get current timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return {"status": "success", **quote}
 
+    except Exception as e:
         return {
-            "status": "success",
-            "ticker": ticker,
-            "price": current_price,
-            "timestamp": current_time,
+            "status": "error",
+            "error_message": f"Error fetching stock data: {str(e)}",
         }
 
+
+async def get_stock_prices(tickers: List[str]) -> dict:
+    """Retrieves the current prices of several stocks in one request."""
+    print(f"--- Tool: get_stock_prices called for {', '.join(tickers)} ---")
+
+    try:
+        quotes = await quote_cache.get_quotes(tickers)
     except Exception as e:
         return {
             "status": "error",
             "error_message": f"Error fetching stock data: {str(e)}",
         }
 
+    found = [quote for quote in quotes.values() if quote is not None]
+    missing = [ticker for ticker, quote in quotes.items() if quote is None]
+    if not found:
+        return {
+            "status": "error",
+            "error_message": f"Could not fetch prices for {', '.join(missing)}",
+        }
+    return {
+        "status": "success",
+        "quotes": found,
+        "errors": [f"Could not fetch price for {ticker}" for ticker in missing],
+    }
+
+
+async def get_stock_history(ticker: str, days: int) -> dict:
+    """Retrieves the daily prices of a stock over the last given number of days."""
+    print(f"--- Tool: get_stock_history called for {ticker} ({days} days) ---")
+
+    try:
+        # Provider requests block; run them off the event loop
+        history = await asyncio.to_thread(
+            quote_cache.provider.get_history, normalize_ticker(ticker), days
+        )
+    except Exception as e:
+        return {
+            "status": "error",
+            "error_message": f"Error fetching stock history: {str(e)}",
+        }
+
+    if not history:
+        return {
+            "status": "error",
+            "error_message": f"No price history found for {ticker}",
+        }
+    return {"status": "success", "ticker": normalize_ticker(ticker), "history": history}
+
 
 # Create the root agent
 stock_analyst = Agent(
@@ -45,9 +98,11 @@ stock_analyst = Agent(
     You are a helpful stock market assistant that helps users track their stocks of interest.
     
     When asked about stock prices:
-    1. Use the get_stock_price tool to fetch the latest price for the requested stock(s)
+    1. Use the get_stock_prices tool to fetch the latest prices for all requested stocks in one call
+       (use get_stock_price when only one stock is asked about)
     2. Format the response to show each stock's current price and the time it was fetched
     3. If a stock price couldn't be fetched, mention this in your response
+    4. When asked how a stock moved over time, use get_stock_history and summarize the daily closes
     
     Example response format:
     "Here are the current prices for your stocks:
@@ -55,5 +110,5 @@ stock_analyst = Agent(
     - TSLA: $156.78 (updated at 2024-04-21 16:30:00)
     - META: $123.45 (updated at 2024-04-21 16:30:00)"
     """,
-    tools=[get_stock_price],
+    tools=[get_stock_price, get_stock_prices, get_stock_history],
 )
@@ -0,0 +1,234 @@
+"""
+Market Data Providers
+
+This module provides where stock_analyst gets its market data from. Every
+provider implements MarketDataProvider: latest quotes for many tickers in
+one request (``get_quotes``), a single quote (``get_quote``) and daily price
+history (``get_history``). Two implementations ship with the example:
+
+- YFinanceProvider: Yahoo Finance, with one ``yf.download`` call for all
+  tickers instead of a ``yf.Ticker(...).info`` request per ticker
+- FixtureProvider: replays quotes and history from a JSON file (or a dict)
+  with a configurable request latency, so the agents can be benchmarked and
+  tested without network access
+
+STOCK_DATA_PROVIDER selects the provider: "yfinance" (default), "fixture"
+for the sample file in fixtures/quotes.json, or "fixture:<path>" for a
+recorded file. STOCK_FIXTURE_LATENCY_SEC sets the fixture's latency. Any
+other feed can be plugged in by implementing MarketDataProvider.
+
+Usage:
+    python -m manager.sub_agents.stock_analyst.providers record quotes.json AAPL MSFT
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Union
+
+import yfinance as yf
+
+# --- Constants ---
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+SAMPLE_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "quotes.json")
+DEFAULT_FIXTURE_LATENCY_SEC = 0.0
+HISTORY_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def make_quote(ticker: str, price: float) -> Dict[str, Any]:
+    """A quote in the shape the tools return, stamped with the fetch time."""
+    return {
+        "ticker": ticker,
+        "price": round(float(price), 2),
+        "timestamp": datetime.now().strftime(TIMESTAMP_FORMAT),
+    }
+
+
+class MarketDataProvider(ABC):
+    """Source of quotes and price history for stock_analyst."""
+
+    @abstractmethod
+    def get_quotes(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Latest quotes for many tickers, in as few requests as the source allows.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Quote (see ``make_quote``) per ticker;
+                tickers without a price are left out
+        """
+
+    def get_quote(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Latest quote for one ticker, or None."""
+        return self.get_quotes([ticker]).get(ticker)
+
+    @abstractmethod
+    def get_history(self, ticker: str, days: int) -> List[Dict[str, Any]]:
+        """
+        Daily bars of the last ``days`` calendar days, oldest first.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per trading day with ``date`` and
+                the HISTORY_FIELDS
+        """
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Quotes and history from Yahoo Finance."""
+
+    def get_quotes(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        # One-minute bars of the current day; the last close is the last trade
+        data = yf.download(
+            tickers,
+            period="1d",
+            interval="1m",
+            progress=False,
+            auto_adjust=False,
+            threads=False,
+        )
+        if data.empty:
+            return {}
+        closes = data["Close"].ffill().iloc[-1]
+        quotes = {}
+        for ticker in tickers:
+            price = closes.get(ticker)
+            if price is not None and price == price:  # NaN for unknown tickers
+                quotes[ticker] = make_quote(ticker, price)
+        return quotes
+
+    def get_history(self, ticker: str, days: int) -> List[Dict[str, Any]]:
+        start = (date.today() - timedelta(days=days)).isoformat()
+        data = yf.Ticker(ticker).history(start=start, interval="1d", auto_adjust=False)
+        return [
+            {
+                "date": index.strftime("%Y-%m-%d"),
+                **{
+                    field: round(float(row[field.title()]), 2)
+                    for field in HISTORY_FIELDS
+                },
+            }
+            for index, row in data.iterrows()
+        ]
+
+
+class FixtureProvider(MarketDataProvider):
+    """
+    Replays recorded quotes and history behind a simulated network request.
+
+    Each ticker has a list of recorded prices. Every request returns the
+    ticker's next price, wrapping around at the end, so repeated requests
+    see the price move as it did when it was recorded.
+
+    Args:
+        quotes: Recorded prices per ticker (a single price is fine)
+        history: Daily bars per ticker, oldest first
+        latency_sec: Time every request takes
+        per_ticker_sec: Additional time per ticker in a request
+    """
+
+    def __init__(
+        self,
+        quotes: Dict[str, Union[float, List[float]]],
+        history: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        latency_sec: float = 0.0,
+        per_ticker_sec: float = 0.0,
+    ):
+        self.quotes = {
+            ticker: prices if isinstance(prices, list) else [prices]
+            for ticker, prices in quotes.items()
+        }
+        self.history = history or {}
+        self.latency_sec = latency_sec
+        self.per_ticker_sec = per_ticker_sec
+        self.requests = 0
+        self._replayed: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(
+        cls, path: str, latency_sec: float = 0.0, per_ticker_sec: float = 0.0
+    ) -> "FixtureProvider":
+        """Load ``{"quotes": {...}, "history": {...}}`` as written by ``record``."""
+        with open(path) as file:
+            data = json.load(file)
+        return cls(data["quotes"], data.get("history"), latency_sec, per_ticker_sec)
+
+    def _request(self, tickers: int) -> None:
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency_sec + self.per_ticker_sec * tickers)
+
+    def get_quotes(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        self._request(len(tickers))
+        quotes = {}
+        with self._lock:
+            for ticker in tickers:
+                prices = self.quotes.get(ticker)
+                if prices:
+                    price = prices[self._replayed[ticker] % len(prices)]
+                    self._replayed[ticker] += 1
+                    quotes[ticker] = make_quote(ticker, price)
+        return quotes
+
+    def get_history(self, ticker: str, days: int) -> List[Dict[str, Any]]:
+        self._request(1)
+        if days <= 0:
+            return []
+        return self.history.get(ticker, [])[-days:]
+
+
+def provider_from_env() -> MarketDataProvider:
+    """The provider selected by STOCK_DATA_PROVIDER (see the module docstring)."""
+    name = os.getenv("STOCK_DATA_PROVIDER", "yfinance")
+    if name == "yfinance":
+        return YFinanceProvider()
+    if name == "fixture" or name.startswith("fixture:"):
+        path = name.partition(":")[2] or SAMPLE_FIXTURE
+        latency = float(
+            os.getenv("STOCK_FIXTURE_LATENCY_SEC", DEFAULT_FIXTURE_LATENCY_SEC)
+        )
+        return FixtureProvider.from_file(path, latency_sec=latency)
+    raise ValueError(
+        f"Unknown STOCK_DATA_PROVIDER {name!r}; use yfinance, fixture or fixture:<path>"
+    )
+
+
+def record(
+    provider: MarketDataProvider,
+    tickers: List[str],
+    path: str,
+    samples: int = 5,
+    interval_sec: float = 60.0,
+    days: int = 30,
+) -> None:
+    """
+    Record quotes and history from a live provider into a fixture file.
+
+    Args:
+        provider: Provider to record from
+        tickers: Tickers to record
+        path: JSON file to write
+        samples: Number of quotes recorded per ticker
+        interval_sec: Seconds between quote samples
+        days: Calendar days of history recorded per ticker
+    """
+    quotes: Dict[str, List[float]] = {ticker: [] for ticker in tickers}
+    for sample in range(samples):
+        if sample:
+            time.sleep(interval_sec)
+        for ticker, quote in provider.get_quotes(tickers).items():
+            quotes[ticker].append(quote["price"])
+    history = {ticker: provider.get_history(ticker, days) for ticker in tickers}
+    with open(path, "w") as file:
+        json.dump({"quotes": quotes, "history": history}, file, indent=1)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == "record":
+        record(YFinanceProvider(), [t.upper() for t in sys.argv[3:]], sys.argv[2])
+    else:
+        print(__doc__)
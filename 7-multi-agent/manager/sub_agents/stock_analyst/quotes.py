@@ -0,0 +1,143 @@
+"""
+Quote Cache
+
+This module keeps the quotes stock_analyst fetched for a configurable time
+(TTL), so asking about the same stocks again, from any session in the
+process, costs no request. Expired quotes are dropped whenever new ones are
+stored, so the cache only holds quotes that are still fresh. Tickers that are
+not cached are fetched from the
+provider together, in one batched request. A ticker that is already being
+fetched for another caller is not requested again; the second caller waits
+for the first request's result (request coalescing).
+
+The cache is used from the agent's async tools. Provider requests block, so
+they run in a worker thread, and callers wait for them without blocking the
+event loop: other sessions, and other tool calls of the same session, keep
+running while a quote is fetched.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from .providers import MarketDataProvider
+
+# --- Constants ---
+DEFAULT_TTL_SEC = 60.0
+
+
+def normalize_ticker(ticker: str) -> str:
+    return ticker.strip().upper()
+
+
+class QuoteCache:
+    """
+    Process-wide TTL cache in front of a quote provider.
+
+    Args:
+        provider: MarketDataProvider to fetch quotes from
+        ttl_sec: Seconds a quote is reused for (0 disables caching, but
+            concurrent requests are still coalesced)
+    """
+
+    def __init__(self, provider: MarketDataProvider, ttl_sec: float = DEFAULT_TTL_SEC):
+        self.provider = provider
+        self.ttl_sec = ttl_sec
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.requests = 0
+        self._quotes: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    async def get_quotes(
+        self, tickers: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Quotes for the given tickers, from the cache or one provider request.
+
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: Quote per normalized ticker,
+                None for tickers the provider has no price for
+
+        Raises:
+            Exception: Whatever the provider raised for the request this call
+                made or waited for
+        """
+        tickers = list(dict.fromkeys(normalize_ticker(t) for t in tickers))
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        # Pending fetches are thread-safe futures, so callers on other event
+        # loops (Runner.run starts its own) or threads can wait for them too
+        waiting: Dict[str, Future] = {}
+        to_fetch: List[str] = []
+        now = time.monotonic()
+        with self._lock:
+            for ticker in tickers:
+                cached = self._quotes.get(ticker)
+                if cached and now - cached[0] < self.ttl_sec:
+                    results[ticker] = cached[1]
+                    self.hits += 1
+                elif ticker in self._pending:
+                    waiting[ticker] = self._pending[ticker]
+                    self.coalesced += 1
+                else:
+                    waiting[ticker] = self._pending[ticker] = Future()
+                    to_fetch.append(ticker)
+                    self.misses += 1
+
+        if to_fetch:
+            # The worker thread resolves the futures itself, so the callers
+            # waiting on them get an answer even if this call is cancelled
+            await asyncio.to_thread(self._fetch, to_fetch)
+        for ticker, future in waiting.items():
+            results[ticker] = await asyncio.wrap_future(future)
+        return {ticker: results[ticker] for ticker in tickers}
+
+    def _fetch(self, tickers: List[str]) -> None:
+        """Fetch tickers in one (blocking) request and resolve their futures."""
+        try:
+            quotes = self.provider.get_quotes(tickers)
+        except Exception as e:
+            with self._lock:
+                for ticker in tickers:
+                    self._pending.pop(ticker).set_exception(e)
+            return
+        fetched_at = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            if self.ttl_sec > 0:
+                self._evict_expired(fetched_at)
+            for ticker in tickers:
+                quote = quotes.get(ticker)
+                # Missing prices are not cached, so the next call retries them
+                if quote is not None and self.ttl_sec > 0:
+                    # Re-insert at the end, to keep the oldest quotes first
+                    self._quotes.pop(ticker, None)
+                    self._quotes[ticker] = (fetched_at, quote)
+                self._pending.pop(ticker).set_result(quote)
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop expired quotes (called with the lock held)."""
+        # Quotes are stored oldest first, so stop at the first fresh one
+        while self._quotes:
+            ticker = next(iter(self._quotes))
+            if now - self._quotes[ticker][0] < self.ttl_sec:
+                return
+            del self._quotes[ticker]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
+            self.hits = self.misses = self.coalesced = self.requests = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "cached": len(self._quotes),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "requests": self.requests,
+        }